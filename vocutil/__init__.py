@@ -15,12 +15,17 @@
 __version__ = "0.0.5"
 
 from . import cc
+from .cache import GlossaryCache
 from .create import create_unit
+from .create import create_units
 from .enrich import enrich
 from .exceptions import VocutilError
+from .load import GlossaryIterator
 from .load import _clean_glossary
 from .load import _load_glossary_csv
 from .load import _load_glossary_json
+from .load import iter_glossary
 from .load import load_glossary
 from .words import Entry
 from .words import Glossary
+from .write import write_glossary
@@ -0,0 +1,180 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""vocutil glossary cache."""
+
+import hashlib
+import os
+import pickle  # nosec B403
+import tempfile
+
+from . import __version__
+
+DEFAULT_MAX_SIZE = 256 * 1024 * 1024
+
+
+class GlossaryCache:
+    """An on-disk cache of cleaned glossaries.
+
+    Cleaned glossaries are pickled into ``directory``, keyed by the
+    absolute path, modification time, and size of the glossary file,
+    the glossary format, and the vocutil version.  Any change to the
+    glossary file produces a new key, so stale entries are never
+    read; they simply age out.  When the cache grows beyond
+    ``max_size`` bytes, the least recently used entries are removed.
+
+    Parameters
+    ----------
+    directory : str
+        The cache directory, created as necessary.
+    max_size : int, optional
+        The maximum total size of the cache in bytes.
+    """
+
+    suffix = ".pickle"
+
+    def __init__(self, directory, max_size=DEFAULT_MAX_SIZE):
+        """Initialize a glossary cache."""
+        self.directory = str(directory)
+        self.max_size = int(max_size)
+
+        return
+
+    def _path(self, fn, st, format):
+        """Get the cache path for a glossary file."""
+        key = "\0".join(
+            (
+                os.path.abspath(fn),
+                str(st.st_mtime_ns),
+                str(st.st_size),
+                str(format),
+                __version__,
+                str(pickle.HIGHEST_PROTOCOL),
+            )
+        )
+
+        return os.path.join(
+            self.directory,
+            hashlib.sha256(key.encode("utf-8")).hexdigest() + self.suffix,
+        )
+
+    def load(self, fn, loader, format=None):
+        """Load a glossary through the cache.
+
+        Parameters
+        ----------
+        fn : str
+            The filename containing the glossary data.
+        loader : callable
+            Called as ``loader(fn, format)`` to load the glossary on a
+            cache miss.
+        format : str, optional
+            The glossary format passed to ``loader``.
+
+        Returns
+        -------
+        dict
+            The cleaned glossary.
+        """
+        st = os.stat(fn)
+        path = self._path(fn, st, format)
+
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)  # nosec B301
+        except (OSError, EOFError, pickle.UnpicklingError):
+            data = loader(fn, format)
+            self._store(path, data)
+        else:
+            # Mark as recently used.
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+
+        return data
+
+    def _store(self, path, data):
+        """Store a glossary in the cache, ignoring failures."""
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                dir=self.directory, suffix=".tmp", delete=False
+            ) as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(f.name, path)
+        except OSError:
+            return
+
+        self._evict()
+
+    def _entries(self):
+        """List the cache entries as (mtime, size, path) tuples."""
+        entries = []
+
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    if entry.name.endswith(self.suffix):
+                        try:
+                            st = entry.stat()
+                        except OSError:
+                            continue
+                        entries.append((st.st_mtime_ns, st.st_size, entry.path))
+        except OSError:
+            pass
+
+        return entries
+
+    def _evict(self):
+        """Remove least recently used entries beyond the size limit."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+
+        for _, size, path in sorted(entries):
+            if total <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+    def clear(self):
+        """Remove all cache entries."""
+        for _, _, path in self._entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def default_cache():
+    """Get the glossary cache configured by the environment.
+
+    The cache is enabled by setting ``VOCUTIL_CACHE_DIR`` to the cache
+    directory.  ``VOCUTIL_CACHE_SIZE`` optionally sets its maximum
+    size in bytes.
+
+    Returns
+    -------
+    GlossaryCache or None
+        The configured cache, or ``None`` if caching is disabled.
+    """
+    directory = os.environ.get("VOCUTIL_CACHE_DIR")
+    if not directory:
+        return None
+
+    return GlossaryCache(
+        directory,
+        max_size=os.environ.get("VOCUTIL_CACHE_SIZE", DEFAULT_MAX_SIZE),
+    )
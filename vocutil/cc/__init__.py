@@ -14,8 +14,17 @@
 
 from .assessment import Assessment
 from .bank import Bank
+from .bank import convert_banks
+from .bank import iter_bank_items
+from .bank import load_banks
+from .bank import normalize_question
 from .cartridge import Cartridge
+from .cartridge import CartridgeReader
+from .cartridge import CartridgeUpdate
+from .dedup import deduplicate
+from .dedup import near_duplicates
 from .fib import FillInTheBlank
+from .ids import deterministic
 from .item import Item
 from .manifest import Manifest
 from .mc import MultipleChoice
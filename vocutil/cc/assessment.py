@@ -12,17 +12,18 @@
 
 """Common Cartridge assessment."""
 
-import uuid
 from xml.etree.ElementTree import Element as ETElement  # nosec B405
 from xml.etree.ElementTree import SubElement as ETSubElement  # nosec B405
 
+from .ids import new_uuid
+
 
 class Assessment:
     """A Common Cartridge assessment."""
 
     def __init__(self, **kwargs):
         """Initialize an assessment."""
-        self.uuid = uuid.uuid4()
+        self.uuid = new_uuid()
         self.doc = ETElement(
             "questestinterop",
             attrib={
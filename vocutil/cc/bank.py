@@ -12,23 +12,219 @@
 
 """Common Cartridge question bank."""
 
+import hashlib
+import html
 import json
-import uuid
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from xml.etree.ElementTree import Element as ETElement  # nosec B405
 from xml.etree.ElementTree import SubElement as ETSubElement  # nosec B405
 
 import defusedxml.ElementTree as ET
 
-from .utils import _load_json_item
-from .utils import _load_xml_item
+from ..exceptions import VocutilError
+from . import qti
+from .ids import is_deterministic
+from .ids import new_uuid
+from .registry import load_json_item
+from .registry import load_xml_item
+from .registry import local_name
+
+
+def iter_bank_items(source):
+    """Iterate over the items of an IMSCC item bank.
+
+    Iterate over the items of an IMSCC item bank incrementally, so
+    only the current item is held in memory.  Each ``item`` element
+    of the ``objectbank`` is loaded when its end tag is parsed.  Every
+    child of the ``objectbank``, including metadata, is then removed
+    from the partial tree.
+
+    Parameters
+    ----------
+    source : str or file
+        The filename, or binary file object, containing IMSCC item
+        bank XML data.
+
+    Yields
+    ------
+    Item
+        The items of the bank, in order.
+    """
+    bank = None
+    depth = 0
+
+    for event, ele in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            depth += 1
+            if bank is None and local_name(ele.tag) == "objectbank":
+                bank = ele
+                bank_depth = depth
+            continue
+
+        # Direct children of the ``objectbank``, items or not, are
+        # removed once parsed, so the partial tree stays small.
+        if bank is not None and depth == bank_depth + 1:
+            if local_name(ele.tag) == "item":
+                yield load_xml_item(ele)
+            bank.remove(ele)
+
+        depth -= 1
+
+
+_TAG = re.compile(r"<[^>]*>")
+
+
+def normalize_question(question):
+    """Normalize question text for comparison.
+
+    Remove HTML markup, unescape character references, fold case, and
+    collapse whitespace, so questions that differ only in formatting
+    compare equal.
+
+    Parameters
+    ----------
+    question : str
+        The HTML formatted question text, or ``None``.
+    """
+    return " ".join(html.unescape(_TAG.sub(" ", question or "")).casefold().split())
+
+
+def question_hash(question):
+    """Get the hash of normalized question text."""
+    return hashlib.blake2b(
+        normalize_question(question).encode(), digest_size=16
+    ).digest()
+
+
+def _serial(jobs, n):
+    """Determine if work should be done in this process.
+
+    Work is done in this process with one job, with fewer than two
+    tasks, or when creating identifiers deterministically, which
+    worker processes cannot share.
+    """
+    return jobs == 1 or n < 2 or is_deterministic()
+
+
+def _workers(jobs):
+    """Get the number of worker processes for ``jobs``."""
+    return jobs if jobs > 0 else os.cpu_count() or 1
+
+
+def _load_bank(source, kwargs):
+    """Load an item bank from an XML file."""
+    return Bank.from_xml_file(source, **kwargs)
+
+
+def load_banks(sources, jobs=1, **kwargs):
+    """Load item banks from XML files.
+
+    Load item banks from XML files, in order.  With more than one
+    job, the files are parsed concurrently in a process pool.
+
+    Parameters
+    ----------
+    sources : [str]
+        The filenames containing IMSCC item bank XML data.
+    jobs : int, optional
+        The number of worker processes; a number less than one uses
+        all available processors.
+
+    Returns
+    -------
+    [Bank]
+        The banks, in the order of ``sources``.
+    """
+    sources = list(sources)
+
+    if _serial(jobs, len(sources)):
+        return [_load_bank(source, kwargs) for source in sources]
+
+    with ProcessPoolExecutor(max_workers=_workers(jobs)) as pool:
+        return list(pool.map(_load_bank, sources, repeat(kwargs)))
+
+
+def _convert_bank(source, dest, format):
+    """Load an item bank from an XML file and write it to ``dest``."""
+    bank = Bank.from_xml_file(source)
+
+    with open(dest, "w") as f:
+        if format == "json":
+            bank.write_json(f)
+        else:
+            f.write(bank.to_qti(declaration=True))
+
+    return dest
+
+
+def convert_banks(sources, dests, format="xml", jobs=1):
+    """Convert item bank XML files.
+
+    Load each item bank XML file in ``sources`` and write it to the
+    corresponding file in ``dests`` as IMSCC XML or JSON.  With more
+    than one job, the files are converted concurrently in a process
+    pool, so only filenames pass between processes.
+
+    Parameters
+    ----------
+    sources : [str]
+        The filenames containing IMSCC item bank XML data.
+    dests : [str]
+        The output filenames.
+    format : str, optional
+        The output format, ``xml`` or ``json``.
+    jobs : int, optional
+        The number of worker processes; a number less than one uses
+        all available processors.
+
+    Returns
+    -------
+    [str]
+        The output filenames, in order.
+    """
+    sources = list(sources)
+    dests = list(dests)
+
+    if _serial(jobs, len(sources)):
+        return [
+            _convert_bank(source, dest, format) for source, dest in zip(sources, dests)
+        ]
+
+    with ProcessPoolExecutor(max_workers=_workers(jobs)) as pool:
+        return list(pool.map(_convert_bank, sources, dests, repeat(format)))
+
+
+def _items_to_qti(items):
+    """Serialize items with ``qti`` templates."""
+    return "".join(item.to_qti() for item in items)
 
 
 class Bank:
-    """A Common Cartridge item bank."""
+    """A Common Cartridge item bank.
+
+    The bank keeps its items in ``items``.  Their element trees are
+    added to the ``objectbank`` element, ``bank``, only when the bank
+    is serialized to XML, so exporting JSON never builds them.
+
+    Items are indexed by identifier, profile, and normalized question
+    text as they are appended, for constant time lookups.  Add items
+    with ``append()`` or ``extend()``, not to ``items`` directly, to
+    keep the indexes current.
+    """
 
     def __init__(self, **kwargs):
-        """Initialize an item bank."""
-        self.uuid = uuid.uuid4()
+        """Initialize an item bank.
+
+        Parameters
+        ----------
+        unique : bool, optional
+            Reject items with the same normalized question text as an
+            item already in the bank.
+        """
+        self.uuid = new_uuid()
         self.doc = ETElement(
             "questestinterop",
             attrib={
@@ -41,12 +237,73 @@ class Bank:
         self.bank = ETSubElement(
             self.doc, "objectbank", attrib={"ident": str(self.uuid)}
         )
+        self.items = []
+        self.unique = kwargs["unique"] if "unique" in kwargs else False
+
+        # Number of items already added to ``bank``.
+        self._synced = 0
+
+        # Indexes.
+        self._by_uuid = {}
+        self._by_profile = {}
+        self._by_question = {}
 
         return
 
+    def __len__(self):
+        """Get the number of items in the bank."""
+        return len(self.items)
+
+    def __contains__(self, ident):
+        """Determine if the bank has an item with identifier ``ident``."""
+        return str(ident) in self._by_uuid
+
     def append(self, item):
-        """Append an item to the bank."""
-        self.bank.append(item)
+        """Append an item to the bank.
+
+        Raises
+        ------
+        VocutilError
+            Raises if the bank has an item with the same identifier
+            or, for a ``unique`` bank, the same normalized question
+            text.
+        """
+        ident = str(item.uuid)
+        if ident in self._by_uuid:
+            raise VocutilError(f"Duplicate item identifier {ident}")
+
+        key = question_hash(item.question)
+        if self.unique and key in self._by_question:
+            raise VocutilError(f"Duplicate question {item.question!r}")
+
+        self.items.append(item)
+        self._by_uuid[ident] = item
+        self._by_profile.setdefault(item.profile, []).append(item)
+        self._by_question.setdefault(key, []).append(item)
+
+    def extend(self, items):
+        """Append items to the bank."""
+        for item in items:
+            self.append(item)
+
+    def get(self, ident):
+        """Get the item with identifier ``ident``, or ``None``."""
+        return self._by_uuid.get(str(ident))
+
+    def by_profile(self, profile):
+        """Get the items with ``cc_profile`` field entry ``profile``."""
+        return list(self._by_profile.get(profile, ()))
+
+    def by_question(self, question):
+        """Get the items with the same normalized question text."""
+        return list(self._by_question.get(question_hash(question), ()))
+
+    def _sync(self):
+        """Add the element trees of new items to ``bank``."""
+        for item in self.items[self._synced :]:
+            self.bank.append(item.item)
+
+        self._synced = len(self.items)
 
     @classmethod
     def from_json(cls, bank, **kwargs):
@@ -66,7 +323,29 @@ class Bank:
         questions = cls(**kwargs)
 
         for item in data["questions"]:
-            questions.bank.append(_load_json_item(item))
+            questions.append(load_json_item(item))
+
+        return questions
+
+    @classmethod
+    def from_records(cls, item_cls, *columns, **kwargs):
+        """Create a ``Bank`` from columns of item data.
+
+        Create a ``Bank`` of ``item_cls`` items from columns of item
+        data, with ``item_cls.many()``.
+
+        Parameters
+        ----------
+        cls
+            The ``Bank`` class.
+        item_cls
+            The ``Item`` subclass of the items.
+        *columns
+            The columns of item data, such as questions, answers, and
+            correct answer indexes, as ``item_cls.many()`` takes them.
+        """
+        questions = cls(**kwargs)
+        questions.extend(item_cls.many(*columns))
 
         return questions
 
@@ -86,23 +365,104 @@ class Bank:
         tree = ET.fromstring(bank)
         questions = cls(**kwargs)
 
-        if tree.find("objectbank") is not None:
-            for item in tree.find("objectbank").findall("item"):
-                questions.bank.append(_load_xml_item(item))
+        # Match tags without the QTI namespace.
+        for ele in tree:
+            if local_name(ele.tag) == "objectbank":
+                questions.extend(
+                    load_xml_item(item)
+                    for item in ele
+                    if local_name(item.tag) == "item"
+                )
+                break
+
+        return questions
+
+    @classmethod
+    def from_xml_file(cls, source, **kwargs):
+        """Create a ``Bank`` from an XML file.
+
+        Create a ``Bank`` from an XML file, parsing and loading one
+        item at a time with ``iter_bank_items()``, so memory use does
+        not depend on the size of the file.
+
+        Parameters
+        ----------
+        cls
+            The ``Bank`` class.
+        source : str or file
+            The filename, or binary file object, containing IMSCC item
+            bank XML data.
+        """
+        questions = cls(**kwargs)
+        questions.extend(iter_bank_items(source))
 
         return questions
 
+    def to_dict(self):
+        """Create a dict of item bank data."""
+        return {
+            "type": "question bank",
+            "questions": [item.to_dict() for item in self.items],
+        }
+
     def to_json(self):
         """Create an item bank JSON string."""
-        return json.dumps(
-            {
-                "type": "question bank",
-                "questions": [json.loads(q) for q in self.bank.findall("item")],
-            }
-        )
+        return json.dumps(self.to_dict())
+
+    def write_json(self, f):
+        """Write item bank JSON to a file.
+
+        Write item bank JSON to a file, one item at a time, so the
+        bank is never held in memory as a single dict or string.  The
+        output is identical to ``to_json()``.
+
+        Parameters
+        ----------
+        f : file
+            A text file open for writing.
+        """
+        encoder = json.JSONEncoder()
+
+        f.write('{"type": "question bank", "questions": [')
+        for i, item in enumerate(self.items):
+            if i:
+                f.write(", ")
+            f.write(encoder.encode(item.to_dict()))
+        f.write("]}")
+
+    def to_qti(self, declaration=False, jobs=1):
+        """Create an IMSCC item bank XML string from item fields.
+
+        Create an IMSCC item bank XML string with the ``qti`` string
+        templates rather than the element tree.  The output matches
+        ``to_xml()``.  With more than one job, the items are split
+        into a chunk per worker and serialized concurrently in a
+        process pool.
+
+        Parameters
+        ----------
+        declaration : bool, optional
+            Add an XML declaration.
+        jobs : int, optional
+            The number of worker processes; a number less than one
+            uses all available processors.
+        """
+        if jobs == 1 or len(self.items) < 2:
+            items = _items_to_qti(self.items)
+        else:
+            size = -(-len(self.items) // _workers(jobs))
+            chunks = [self.items[i : i + size] for i in range(0, len(self.items), size)]
+            with ProcessPoolExecutor(max_workers=len(chunks)) as pool:
+                items = "".join(pool.map(_items_to_qti, chunks))
+
+        xml = qti.object_bank(self.doc.attrib, self.uuid, items)
+
+        return qti.declaration() + xml if declaration else xml
 
     def to_xml(self, declaration=False):
         """Create an IMSCC item bank XML string."""
+        self._sync()
+
         return ET.tostring(
             self.doc,
             encoding="unicode",
@@ -12,22 +12,56 @@
 
 """Common Cartridge cartridge."""
 
-import io
-import uuid
+import collections
+import hashlib
+import os
+import time
 import zipfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 
+from ..exceptions import VocutilError
+from ..write import _replace_file
+from .bank import Bank
+from .ids import date_time
+from .ids import new_uuid
 from .manifest import Manifest
+from .manifest import _child
+from .registry import local_name
+from .zipcompat import copy_member
+from .zipcompat import mkdir
+from .zipcompat import write_member
 
 
 class Cartridge:
-    """A Common Cartridge cartridge."""
+    """A Common Cartridge cartridge.
 
-    def __init__(self, title="default", **kwargs):
+    Parameters
+    ----------
+    title : str, optional
+        The cartridge title.
+    dedupe : bool, optional
+        Store identical resource payloads once, pointing the manifest
+        entries of the duplicates at the shared file.
+
+    Notes
+    -----
+    A cartridge created in a ``deterministic()`` context records fixed
+    timestamps, so the same input creates the same archive.
+    """
+
+    def __init__(self, title="default", dedupe=False, **kwargs):
         """Initialize a cartridge."""
-        self.uuid = uuid.uuid4()
+        self.uuid = new_uuid()
+        self.date_time = date_time()
 
         self.manifest = Manifest(title=str(title))
         self.resources = []
+        self.dedupe = dedupe
+
+        # Resources with stored payloads and their payload digests.
+        self._stored = []
+        self._digests = {}
 
     def set_title(self, title):
         """Set the ``title`` tag of the cartridge/manifest."""
@@ -37,23 +71,516 @@ class Cartridge:
         return
 
     def append(self, res):
-        """Append a resource to the cartridge."""
-        self.resources.append(res)
+        """Append a resource to the cartridge.
+
+        If the cartridge deduplicates resources and the payload of
+        ``res`` is already stored, the manifest entry of ``res`` is
+        pointed at the stored file instead of storing another copy.
+        """
+        self._store(res)
         self.manifest.append(res)
 
-    def write(self, filename="cartridge.imscc.zip", overwrite=False):
-        """Write a cartridge zip archive."""
-        buf = io.BytesIO()
+    def _store(self, res):
+        """Store the payload of a resource, unless it is a duplicate."""
+        shared = res
+        if self.dedupe:
+            shared = self._digests.setdefault(_digest(res.buffer), res)
+
+        if shared is res:
+            self._stored.append(res)
+        else:
+            _share_file(res, shared.resource_name)
+
+        self.resources.append(res)
+
+    def write(
+        self,
+        filename="cartridge.imscc.zip",
+        overwrite=False,
+        compression=zipfile.ZIP_STORED,
+        compresslevel=None,
+        jobs=None,
+    ):
+        """Write a cartridge zip archive.
+
+        The archive is streamed to ``filename``, one resource at a time,
+        so memory use is bounded by the largest resource rather than
+        the size of the archive.  A filename is written to a temporary
+        file in the same directory, which replaces ``filename`` only
+        once the archive is complete.
+
+        Deflated resources are compressed concurrently in a thread pool
+        and written in order as they are ready.
+
+        The archive comment records a digest of the archive contents.
+        If ``filename`` is an archive with the same digest, it is left
+        as it is.
+
+        Parameters
+        ----------
+        filename : str or file object, optional
+            The file to write, or a writable binary stream.
+        overwrite : bool, optional
+            Unused; an existing ``filename`` is always replaced.
+        compression : int, optional
+            The ``zipfile`` compression method; entries are stored
+            uncompressed by default.
+        compresslevel : int, optional
+            The compression level, as for ``zipfile.ZipFile``.
+        jobs : int, optional
+            The number of compression threads; the default is the
+            ``ThreadPoolExecutor`` default.  At most four resources per
+            thread are held compressed in memory.
+
+        Returns
+        -------
+        bool
+            ``False`` if an unchanged ``filename`` was left as it is,
+            otherwise ``True``.
+        """
+        # The payloads are hashed once, for both the comparison and
+        # the archive comment.
+        digest = self._digest(compression, compresslevel)
+
+        if hasattr(filename, "write"):
+            self._write_zip(filename, compression, compresslevel, jobs, digest)
+            return True
+
+        if digest is not None and digest == _archive_comment(filename):
+            return False
+
+        with _replace_file(filename, mode="wb") as f:
+            self._write_zip(f, compression, compresslevel, jobs, digest)
+
+        return True
+
+    def _digest(self, compression, compresslevel):
+        """Get the digest of the archive contents, as an archive comment."""
+        digest = hashlib.sha256()
+        digest.update(repr((compression, compresslevel, self.date_time)).encode())
+        for name, data in (
+            ("imsmanifest.xml", str(self.manifest)),
+            *((res.resource_name, res.buffer) for res in self._stored),
+        ):
+            digest.update(name.encode("utf-8") + b"\0")
+            digest.update(_digest(data))
+
+        return f"vocutil sha256:{digest.hexdigest()}".encode()
+
+    def _write_zip(self, f, compression, compresslevel, jobs, digest=None):
+        """Write the cartridge zip archive to the binary stream ``f``.
+
+        ``digest``, from ``_digest()``, is recorded as the archive
+        comment.
+        """
+        with zipfile.ZipFile(
+            f, mode="w", compression=compression, compresslevel=compresslevel
+        ) as zip:
+            _mkdir(zip, "resources", self.date_time)
+            _writestr(zip, "imsmanifest.xml", str(self.manifest), self.date_time)
+            self._write_resources(zip, compression, compresslevel, jobs)
+            zip.comment = digest or b""
+
+    def _write_resources(self, zip, compression, compresslevel, jobs):
+        """Write the stored resource payloads to ``zip``."""
+        if compression != zipfile.ZIP_DEFLATED:
+            for res in self._stored:
+                _mkdir(zip, str(res.resource_uuid), self.date_time)
+                _writestr(zip, res.resource_name, res.buffer, self.date_time)
+            return
+
+        level = zlib.Z_DEFAULT_COMPRESSION if compresslevel is None else compresslevel
+        jobs = jobs if jobs else min(32, (os.cpu_count() or 1) + 4)
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            for res, (data, compressed, crc) in _map_window(
+                pool,
+                lambda res: _deflate(res.buffer, level),
+                self._stored,
+                4 * jobs,
+            ):
+                _mkdir(zip, str(res.resource_uuid), self.date_time)
+                _write_deflated(
+                    zip, res.resource_name, data, compressed, crc, self.date_time
+                )
+
+
+class CartridgeUpdate(Cartridge):
+    """Update an existing Common Cartridge cartridge.
+
+    Resources can be appended, replaced, or removed, and the updated
+    cartridge replaces the original when written.  The members of the
+    original cartridge are copied to the updated cartridge as raw
+    compressed bytes, so only the manifest and the new resources are
+    serialized and compressed.  Used as a context manager, the
+    cartridge is written on success and closed on exit.
+
+    Parameters
+    ----------
+    filename : str
+        The cartridge to update.
+    dedupe : bool, optional
+        Store identical new resource payloads once.
+    compression : int, optional
+        The ``zipfile`` compression method of new members.
+    compresslevel : int, optional
+        The compression level of new members.
+    jobs : int, optional
+        The number of compression threads.
+    """
+
+    def __init__(
+        self,
+        filename,
+        dedupe=False,
+        compression=zipfile.ZIP_STORED,
+        compresslevel=None,
+        jobs=None,
+    ):
+        """Open a cartridge for updating."""
+        super().__init__(dedupe=dedupe)
+
+        self.filename = filename
+        self.compression = compression
+        self.compresslevel = compresslevel
+        self.jobs = jobs
+
+        self.source = zipfile.ZipFile(filename)
+        try:
+            self.manifest = Manifest.from_xml(self.source.read("imsmanifest.xml"))
+        except BaseException:
+            self.source.close()
+            raise
+
+        # Files of removed and replaced resources.
+        self._removed = set()
+
+    def __enter__(self):
+        """Enter the update context."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Write the cartridge on success and close it."""
+        try:
+            if exc_type is None:
+                self.write()
+        finally:
+            self.close()
+
+    def close(self):
+        """Close the original cartridge."""
+        self.source.close()
+
+    def remove(self, identifier):
+        """Remove a resource from the cartridge.
+
+        Parameters
+        ----------
+        identifier : str
+            The identifier of the resource.
+
+        Raises
+        ------
+        VocutilError
+            Raises if the cartridge has no resource ``identifier``.
+        """
+        self._removed.update(_files(self.manifest.remove(identifier)))
+
+    def replace(self, identifier, res):
+        """Replace a resource of the cartridge.
+
+        Parameters
+        ----------
+        identifier : str
+            The identifier of the resource to replace.
+        res : Resource
+            The replacement resource.
+
+        Raises
+        ------
+        VocutilError
+            Raises if the cartridge has no resource ``identifier``.
+        """
+        self._removed.update(_files(self.manifest.replace(identifier, res)))
+        self._store(res)
+
+    def write(
+        self,
+        filename=None,
+        overwrite=False,
+        compression=None,
+        compresslevel=None,
+        jobs=None,
+    ):
+        """Write the updated cartridge zip archive.
+
+        Parameters
+        ----------
+        filename : str or file object, optional
+            The file to write; the original cartridge by default.
+        overwrite : bool, optional
+            Unused; an existing ``filename`` is always replaced.
+        compression : int, optional
+            The compression method of new members; the method given
+            when opening the cartridge by default.
+        compresslevel : int, optional
+            The compression level of new members.
+        jobs : int, optional
+            The number of compression threads.
+        """
+        super().write(
+            self.filename if filename is None else filename,
+            overwrite=overwrite,
+            compression=self.compression if compression is None else compression,
+            compresslevel=(
+                self.compresslevel if compresslevel is None else compresslevel
+            ),
+            jobs=self.jobs if jobs is None else jobs,
+        )
+
+    def _digest(self, compression, compresslevel):
+        """Skip the digest; the copied members are not hashed."""
+        return None
+
+    def _write_zip(self, f, compression, compresslevel, jobs, digest=None):
+        """Write the updated cartridge zip archive to ``f``."""
+        # Drop the files of removed resources that are no longer
+        # shared with another resource, the directories left empty,
+        # and anything overwritten by a new resource.
+        referenced = set()
+        for resource in self.manifest.resources:
+            referenced.update(_files(resource))
+        dropped = self._removed - referenced
+        dropped.update(res.resource_name for res in self._stored)
+        dropped.update(f"{res.resource_uuid}/" for res in self._stored)
+        dropped.add("imsmanifest.xml")
+
+        members = [
+            info for info in self.source.infolist() if info.filename not in dropped
+        ]
+        emptied = {f"{os.path.dirname(fn)}/" for fn in dropped} - {
+            f"{os.path.dirname(info.filename)}/"
+            for info in members
+            if not info.is_dir()
+        }
+        members = [info for info in members if info.filename not in emptied]
+
+        with zipfile.ZipFile(
+            f, mode="w", compression=compression, compresslevel=compresslevel
+        ) as zip:
+            _writestr(zip, "imsmanifest.xml", str(self.manifest), self.date_time)
+            for info in members:
+                copy_member(zip, self.source, info)
+            self._write_resources(zip, compression, compresslevel, jobs)
+
+
+class CartridgeReader:
+    """Read the resources of an existing Common Cartridge cartridge.
 
-        with zipfile.ZipFile(buf, mode="x") as zip:
-            zip.mkdir("resources")
-            zip.writestr("imsmanifest.xml", str(self.manifest))
+    Only ``imsmanifest.xml`` is parsed when the cartridge is opened,
+    to index the resources by identifier.  Resources are read from the
+    archive, and question banks parsed, only when first accessed, so
+    reading one bank of a large cartridge costs time proportional to
+    that bank.  Parsed banks are cached.
 
-            for res in self.resources:
-                zip.mkdir(str(res.resource_uuid))
-                zip.writestr(res.resource_name, res.buffer)
+    Parameters
+    ----------
+    filename : str or file object
+        The cartridge to read.
+    """
 
-        with open(filename, mode="wb") as f:
-            f.write(buf.getvalue())
+    def __init__(self, filename):
+        """Open a cartridge for reading."""
+        self.zip = zipfile.ZipFile(filename)
+        try:
+            self.manifest = Manifest.from_xml(self.zip.read("imsmanifest.xml"))
+        except BaseException:
+            self.zip.close()
+            raise
+
+        # Resource identifier to type and archive member.
+        self._index = {}
+        for resource in self.manifest.resources:
+            href = resource.get("href")
+            if href is None:
+                file = _child(resource, "file")
+                href = file.get("href") if file is not None else None
+            self._index[resource.get("identifier")] = (resource.get("type"), href)
+
+        self._banks = {}
 
         return
+
+    def __enter__(self):
+        """Enter the reader context."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the cartridge."""
+        self.close()
+
+    def __len__(self):
+        """Get the number of resources."""
+        return len(self._index)
+
+    def __iter__(self):
+        """Iterate over the resource identifiers in manifest order."""
+        return iter(self._index)
+
+    def __contains__(self, identifier):
+        """Determine if the cartridge has the resource ``identifier``."""
+        return str(identifier) in self._index
+
+    def close(self):
+        """Close the cartridge."""
+        self.zip.close()
+
+    def _lookup(self, identifier):
+        """Get the type and archive member of a resource."""
+        try:
+            return self._index[str(identifier)]
+        except KeyError:
+            raise VocutilError(f"No resource with identifier {identifier}") from None
+
+    def resource_type(self, identifier):
+        """Get the type of the resource ``identifier``."""
+        return self._lookup(identifier)[0]
+
+    def read(self, identifier):
+        """Read the contents of the resource ``identifier``.
+
+        Raises
+        ------
+        VocutilError
+            Raises if the cartridge has no resource ``identifier`` or
+            the resource has no file.
+        """
+        href = self._lookup(identifier)[1]
+        if href is None:
+            raise VocutilError(f"Resource {identifier} has no file")
+
+        return self.zip.read(href)
+
+    def bank(self, identifier, **kwargs):
+        """Get the question bank ``identifier``.
+
+        The bank is parsed with ``Bank.from_xml()`` on first access
+        and cached.
+        """
+        identifier = str(identifier)
+        if identifier not in self._banks:
+            self._banks[identifier] = Bank.from_xml(self.read(identifier), **kwargs)
+
+        return self._banks[identifier]
+
+    def banks(self):
+        """Iterate over the identifiers of the question banks."""
+        for identifier, (type, href) in self._index.items():
+            if type is not None and type.endswith("/question-bank"):
+                yield identifier
+
+
+def _digest(data):
+    """Get the SHA-256 digest of a resource payload."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    return hashlib.sha256(data).digest()
+
+
+def _share_file(res, name):
+    """Point the manifest entry of ``res`` at the stored file ``name``."""
+    res.resource.set("href", name)
+    for file in res.resource.iter("file"):
+        file.set("href", name)
+
+
+def _files(resource):
+    """Get the files of a manifest resource element."""
+    files = {
+        file.get("href") for file in resource.iter() if local_name(file.tag) == "file"
+    }
+    if resource.get("href"):
+        files.add(resource.get("href"))
+
+    return files
+
+
+def _map_window(pool, fn, items, size):
+    """Map ``fn`` over ``items`` in ``pool``, with at most ``size`` pending.
+
+    Yields each item and its result, in order.
+    """
+    pending = collections.deque()
+    for item in items:
+        pending.append((item, pool.submit(fn, item)))
+        if len(pending) >= size:
+            item, future = pending.popleft()
+            yield item, future.result()
+
+    while pending:
+        item, future = pending.popleft()
+        yield item, future.result()
+
+
+def _deflate(data, level):
+    """Deflate ``data`` as a zip member.
+
+    Returns the data, the raw deflated data, and the CRC-32 of the
+    data.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+
+    return data, compressor.compress(data) + compressor.flush(), zlib.crc32(data)
+
+
+def _archive_comment(fn):
+    """Get the comment of a zip archive, if it exists."""
+    try:
+        with zipfile.ZipFile(fn) as zip:
+            return zip.comment
+    except (OSError, zipfile.BadZipFile):
+        return None
+
+
+def _zipinfo(name, date_time):
+    """Create a ``ZipInfo``, timestamped now if ``date_time`` is ``None``."""
+    if date_time is None:
+        date_time = time.localtime(time.time())[:6]
+
+    return zipfile.ZipInfo(filename=name, date_time=date_time)
+
+
+def _mkdir(zip, name, date_time):
+    """Create the directory ``name`` in ``zip``, as ``ZipFile.mkdir``."""
+    zinfo = _zipinfo(f"{name.rstrip('/')}/", date_time)
+    zinfo.external_attr = ((0o40000 | 0o777) & 0xFFFF) << 16 | 0x10
+    zinfo.file_size = 0
+    zinfo.compress_size = 0
+    zinfo.CRC = 0
+
+    mkdir(zip, zinfo)
+
+
+def _writestr(zip, name, data, date_time):
+    """Write ``data`` to ``zip`` as ``name``, as ``ZipFile.writestr``."""
+    zinfo = _zipinfo(name, date_time)
+    zinfo.external_attr = 0o600 << 16
+
+    zip.writestr(
+        zinfo, data, compress_type=zip.compression, compresslevel=zip.compresslevel
+    )
+
+
+def _write_deflated(zip, name, data, compressed, crc, date_time=None):
+    """Write already deflated data to ``zip`` as the member ``name``."""
+    zinfo = _zipinfo(name, date_time)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.external_attr = 0o600 << 16
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(compressed)
+    zinfo.CRC = crc
+
+    write_member(zip, zinfo, (compressed,))
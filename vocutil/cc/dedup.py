@@ -0,0 +1,244 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""Near-duplicate item detection.
+
+Items are compared by the Jaccard similarity of the character
+shingles of their normalized question and answer text, estimated
+with MinHash signatures.  Signatures are split into bands and hashed
+into buckets (locality-sensitive hashing), so only items sharing a
+bucket are compared, in roughly linear time.
+"""
+
+import random
+import re
+import zlib
+
+from .bank import Bank
+from .bank import normalize_question
+
+_WORD = re.compile(r"\w+")
+
+# A Mersenne prime larger than any shingle hash.
+_PRIME = (1 << 61) - 1
+
+
+def _words(text):
+    """Get the words of normalized text, without punctuation."""
+    return " ".join(_WORD.findall(normalize_question(text)))
+
+
+def item_text(item):
+    """Get the normalized question and answer text of an item.
+
+    The question and each answer are normalized with
+    ``normalize_question()``, without punctuation, and joined with
+    `` | ``.
+    """
+    data = item.to_dict()
+    answers = data["answers"] if "answers" in data else [data["answer"]]
+
+    return " | ".join(
+        [_words(data["question"])]
+        + [
+            _words(ans["answer"] if isinstance(ans, dict) else str(ans))
+            for ans in answers
+        ]
+    )
+
+
+def shingles(text, k=4):
+    """Get the hashes of the character ``k``-shingles of ``text``.
+
+    Text shorter than ``k`` is a single shingle.
+    """
+    data = text.encode()
+    if len(data) <= k:
+        return {zlib.crc32(data)}
+
+    return {zlib.crc32(data[i : i + k]) for i in range(len(data) - k + 1)}
+
+
+class MinHash:
+    """MinHash signatures of shingle sets.
+
+    Signatures use one permutation hashing: each shingle is hashed
+    once into one of ``num_perm`` bins, which keep their minimum
+    hash, so a signature costs time proportional to the number of
+    shingles rather than to the number of shingles times
+    ``num_perm``.  Empty bins are filled from the first nonempty bin
+    of a fixed, random probe order per bin (optimal densification).
+
+    Parameters
+    ----------
+    num_perm : int, optional
+        The number of bins, and the signature length.
+    seed : int, optional
+        The seed of the hash function and probe orders; signatures
+        are only comparable with the same seed.
+    """
+
+    def __init__(self, num_perm=128, seed=1):
+        """Initialize the hash function and probe orders."""
+        rng = random.Random(seed)
+
+        self.num_perm = num_perm
+        self.a = rng.randrange(1, _PRIME)
+        self.b = rng.randrange(0, _PRIME)
+        self.probes = [rng.sample(range(num_perm), num_perm) for _ in range(num_perm)]
+
+    def signature(self, hashes):
+        """Get the signature of a nonempty set of shingle hashes."""
+        a, b, n = self.a, self.b, self.num_perm
+        # Empty bins hold ``_PRIME``, larger than any hash.
+        bins = [_PRIME] * n
+
+        for x in hashes:
+            h = (a * x + b) % _PRIME
+            i = h % n
+            if h < bins[i]:
+                bins[i] = h
+
+        return tuple(
+            h if h != _PRIME else next(bins[j] for j in probe if bins[j] != _PRIME)
+            for h, probe in zip(bins, self.probes)
+        )
+
+    @staticmethod
+    def similarity(first, second):
+        """Estimate the Jaccard similarity of two signatures."""
+        return sum(x == y for x, y in zip(first, second)) / len(first)
+
+
+class LSHIndex:
+    """A locality-sensitive hash index of MinHash signatures.
+
+    Signatures are split into ``bands`` bands, and signatures with
+    any identical band share a bucket.  Pairs of similarity ``s`` are
+    candidates with probability ``1 - (1 - s**r)**bands``, where
+    ``r`` is the number of rows per band.
+
+    Parameters
+    ----------
+    num_perm : int, optional
+        The signature length.
+    bands : int, optional
+        The number of bands, which must divide ``num_perm``.
+    """
+
+    def __init__(self, num_perm=128, bands=16):
+        """Initialize an empty index."""
+        if num_perm % bands:
+            raise ValueError(f"{bands} bands do not divide {num_perm} hashes")
+
+        self.rows = num_perm // bands
+        self.bands = bands
+        self.buckets = [{} for _ in range(bands)]
+
+    def _keys(self, signature):
+        """Get the band keys of a signature."""
+        r = self.rows
+        return (signature[i * r : (i + 1) * r] for i in range(self.bands))
+
+    def candidates(self, signature):
+        """Get the keys sharing a bucket with ``signature``."""
+        found = {}
+        for buckets, band in zip(self.buckets, self._keys(signature)):
+            for key in buckets.get(band, ()):
+                found[key] = None
+
+        return list(found)
+
+    def add(self, key, signature):
+        """Add a key with its signature."""
+        for buckets, band in zip(self.buckets, self._keys(signature)):
+            buckets.setdefault(band, []).append(key)
+
+
+def near_duplicates(items, threshold=0.8, num_perm=128, bands=16, k=4):
+    """Find near-duplicate items.
+
+    Find items with an estimated Jaccard similarity of at least
+    ``threshold`` to an earlier item that is not itself a
+    near-duplicate.  Each item is compared only with the earlier items
+    sharing an LSH bucket.  Items from several banks can be checked
+    together by chaining their items.
+
+    Parameters
+    ----------
+    items : iterable
+        The items to check, in order.
+    threshold : float, optional
+        The minimum estimated similarity of near-duplicates.
+    num_perm : int, optional
+        The MinHash signature length.
+    bands : int, optional
+        The number of LSH bands.
+    k : int, optional
+        The shingle length, in bytes.
+
+    Yields
+    ------
+    (Item, Item, float)
+        The earlier item, its later near-duplicate, and their
+        estimated similarity.  A later item is reported once, with
+        its most similar earlier item.
+    """
+    hasher = MinHash(num_perm=num_perm)
+    index = LSHIndex(num_perm=num_perm, bands=bands)
+    seen = []
+
+    for item in items:
+        signature = hasher.signature(shingles(item_text(item), k=k))
+
+        best = None
+        for i in index.candidates(signature):
+            similarity = MinHash.similarity(seen[i][1], signature)
+            if similarity >= threshold and (best is None or similarity > best[1]):
+                best = (seen[i][0], similarity)
+
+        if best is not None:
+            yield best[0], item, best[1]
+        else:
+            index.add(len(seen), signature)
+            seen.append((item, signature))
+
+
+def deduplicate(*banks, threshold=0.8, **kwargs):
+    """Merge banks without near-duplicate items.
+
+    Merge the items of ``banks`` into a new bank, in order, dropping
+    the items ``near_duplicates()`` reports.
+
+    Parameters
+    ----------
+    *banks : Bank
+        The banks to merge.
+    threshold : float, optional
+        The minimum estimated similarity of near-duplicates.
+    **kwargs
+        Keyword arguments for the new ``Bank``.
+
+    Returns
+    -------
+    (Bank, [(Item, Item, float)])
+        The new bank, and the dropped near-duplicates as reported by
+        ``near_duplicates()``.
+    """
+    items = [item for bank in banks for item in bank.items]
+    dropped = list(near_duplicates(items, threshold=threshold))
+    drop = {id(duplicate) for _, duplicate, _ in dropped}
+
+    questions = Bank(**kwargs)
+    questions.extend(item for item in items if id(item) not in drop)
+
+    return questions, dropped
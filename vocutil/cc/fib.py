@@ -18,12 +18,37 @@ from xml.etree.ElementTree import SubElement as ETSubElement  # nosec B405
 
 import defusedxml.ElementTree as ET
 
+from . import qti
+from .ids import new_uuids
 from .item import Item
+from .registry import register
 
 
+@register
 class FillInTheBlank(Item):
     """A Common Cartridge fill in the blank item."""
 
+    profile = "cc.fib.v0p1"
+    json_type = "fib"
+
+    # Element tree attributes, set by ``_build()``.
+    _elements = Item._elements + (
+        "itemmetadata",
+        "qtimetadata",
+        "qtimetadatafield",
+        "fieldlabel",
+        "fieldentry",
+        "presentation",
+        "material",
+        "mattext",
+        "response",
+        "blank",
+    )
+
+    # Slots for the item data and the element tree; ``item`` has its
+    # slot in ``Item``.
+    __slots__ = ("question", "answers", "default_case") + _elements[1:]
+
     def __init__(self, question, answers, default_case="No", **kwargs):
         """Initialize a ``FillInTheBlank`` item.
 
@@ -43,6 +68,10 @@ class FillInTheBlank(Item):
         self.answers = answers
         self.default_case = default_case if default_case == "Yes" else "No"
 
+        return
+
+    def _build(self):
+        """Build the fill-in-the-blank element tree from the item data."""
         self.item = ETElement("item", ident=str(self.uuid))
         self.itemmetadata = ETSubElement(self.item, "itemmetadata")
         self.qtimetadata = ETSubElement(self.itemmetadata, "qtimetadata")
@@ -50,7 +79,7 @@ class FillInTheBlank(Item):
         self.fieldlabel = ETSubElement(self.qtimetadatafield, "fieldlabel")
         self.fieldlabel.text = "cc_profile"
         self.fieldentry = ETSubElement(self.qtimetadatafield, "fieldentry")
-        self.fieldentry.text = "cc.fib.v0p1"
+        self.fieldentry.text = self.profile
         self.presentation = ETSubElement(self.item, "presentation")
         self.material = ETSubElement(self.presentation, "material")
         self.mattext = ETSubElement(self.material, "mattext", texttype="text/html")
@@ -83,7 +112,7 @@ class FillInTheBlank(Item):
         )
         condvar = ETSubElement(cond, "conditionvar")
 
-        # Set possible correct answers.
+        # Set possible correct self.answers.
         for answer in self.answers:
             varequal = ETSubElement(
                 condvar,
@@ -98,6 +127,52 @@ class FillInTheBlank(Item):
 
         return
 
+    @classmethod
+    def many(cls, questions, answers, **kwargs):
+        """Create ``FillInTheBlank`` items from columns of data.
+
+        Create ``FillInTheBlank`` items from columns of data, with the
+        identifiers created in bulk.
+
+        Parameters
+        ----------
+        cls
+            The ``FillInTheBlank`` class.
+        questions : [str]
+            The HTML formatted question text of each item.
+        answers : [[str]]
+            The correct answer(s) of each item.
+        """
+        questions = list(questions)
+
+        return [
+            cls(
+                question,
+                [{"answer": answer} for answer in blanks],
+                uuid=uuid,
+                **kwargs,
+            )
+            for question, blanks, uuid in zip(
+                questions, answers, new_uuids(len(questions))
+            )
+        ]
+
+    @classmethod
+    def from_dict(cls, data, **kwargs):
+        """Create a ``FillInTheBlank`` item from a dict.
+
+        Create a ``FillInTheBlank`` item from a dict of
+        fill-in-the-blank data, as created by ``to_dict()``.
+
+        Parameters
+        ----------
+        cls
+            The ``FillInTheBlank`` class.
+        data : dict
+            A dict containing fill-in-the-blank data.
+        """
+        return cls(data["question"], data["answers"], **kwargs)
+
     @classmethod
     def from_json(cls, item, **kwargs):
         """Create a ``FillInTheBlank`` item from JSON data.
@@ -112,26 +187,22 @@ class FillInTheBlank(Item):
         item : str
             A string containing JSON fill-in-the-blank data.
         """
-        data = json.loads(item)
-
-        return cls(data["question"], data["answers"], **kwargs)
+        return cls.from_dict(json.loads(item), **kwargs)
 
     @classmethod
-    def from_xml(cls, item, **kwargs):
-        """Create a ``FillInTheBlank`` item XML data.
+    def from_element(cls, tree, **kwargs):
+        """Create a ``FillInTheBlank`` item from an XML element.
 
-        Create a ``FillInTheBlank`` item from IMSCC fill-in-the-blank
-        XML data.
+        Create a ``FillInTheBlank`` item from a parsed IMSCC
+        fill-in-the-blank ``item`` element.
 
         Parameters
         ----------
         cls
             The ``FillInTheBlank`` class.
-        item : str
-            A string containing IMSCC fill-in-the-blank XML data.
+        tree : xml.etree.ElementTree.Element
+            An IMSCC fill-in-the-blank ``item`` element.
         """
-        tree = ET.fromstring(item)
-
         # Question text.
         q = tree.find("presentation").find("material").find("mattext").text
 
@@ -149,24 +220,39 @@ class FillInTheBlank(Item):
 
         return cls(q, a, **kwargs)
 
+    @classmethod
+    def from_xml(cls, item, **kwargs):
+        """Create a ``FillInTheBlank`` item XML data.
+
+        Create a ``FillInTheBlank`` item from IMSCC fill-in-the-blank
+        XML data.
+
+        Parameters
+        ----------
+        cls
+            The ``FillInTheBlank`` class.
+        item : str
+            A string containing IMSCC fill-in-the-blank XML data.
+        """
+        return cls.from_element(ET.fromstring(item), **kwargs)
+
+    def to_dict(self):
+        """Create a fill-in-the-blank dict from item data."""
+        return {
+            "type": "fib",
+            "question": str(self.question),
+            "answers": [
+                {
+                    "answer": ans["answer"],
+                    "case": ans["case"] if "case" in ans else self.default_case,
+                }
+                for ans in self.answers
+            ],
+        }
+
     def to_json(self):
         """Create a fill-in-the-blank JSON string from item data."""
-        return json.dumps(
-            {
-                "type": "fib",
-                "question": str(self.mattext.text),
-                "answers": [
-                    {
-                        "answer": ele.text,
-                        "case": ele.get("case"),
-                    }
-                    for ele in self.item.find("resprocessing")
-                    .find("respcondition")
-                    .find("conditionvar")
-                    .findall("varequal")
-                ],
-            }
-        )
+        return json.dumps(self.to_dict())
 
     def to_xml(self, declaration=False):
         """Create a fill-in-the-blank XML string from item data."""
@@ -175,3 +261,17 @@ class FillInTheBlank(Item):
             encoding="unicode",
             xml_declaration=declaration,
         )
+
+    def to_qti(self, declaration=False):
+        """Create a fill-in-the-blank XML string from item fields.
+
+        The XML is written directly from the item fields with ``qti``
+        string templates rather than serialized from the element tree.
+        The output matches ``to_xml()``, in a fraction of the time, as
+        long as the element tree has not been modified.
+        """
+        xml = qti.fill_in_the_blank(
+            self.uuid, self.question, self.answers, self.default_case
+        )
+
+        return qti.declaration() + xml if declaration else xml
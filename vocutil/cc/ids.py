@@ -0,0 +1,108 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""Common Cartridge identifiers."""
+
+import contextlib
+import os
+import threading
+import time
+import uuid
+
+# Earliest timestamp a zip archive can record.
+ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+_state = threading.local()
+
+
+def new_uuid():
+    """Get a new identifier.
+
+    Identifiers are random, unless created in a ``deterministic()``
+    context.
+    """
+    namespace = getattr(_state, "namespace", None)
+    if namespace is None:
+        return uuid.uuid4()
+
+    _state.counter += 1
+
+    return uuid.uuid5(namespace, str(_state.counter))
+
+
+def new_uuids(n):
+    """Get ``n`` new identifiers.
+
+    Get ``n`` new identifiers at once, the same identifiers as ``n``
+    calls to ``new_uuid()``, with one read of random data.
+    """
+    namespace = getattr(_state, "namespace", None)
+    if namespace is None:
+        data = os.urandom(16 * n)
+        return [
+            uuid.UUID(bytes=data[i : i + 16], version=4) for i in range(0, 16 * n, 16)
+        ]
+
+    start = _state.counter
+    _state.counter += n
+
+    return [uuid.uuid5(namespace, str(i)) for i in range(start + 1, start + n + 1)]
+
+
+def is_deterministic():
+    """Determine if identifiers are being created deterministically."""
+    return getattr(_state, "namespace", None) is not None
+
+
+def date_time():
+    """Get the timestamp of zip archive members.
+
+    Returns ``None``, for the current time, unless in a
+    ``deterministic()`` context, where the timestamp is fixed at
+    ``SOURCE_DATE_EPOCH``, if set, or the start of 1980.
+    """
+    if not is_deterministic():
+        return None
+
+    try:
+        epoch = int(os.environ["SOURCE_DATE_EPOCH"])
+    except (KeyError, ValueError):
+        return ZIP_EPOCH
+
+    return max(ZIP_EPOCH, time.gmtime(epoch)[:6])
+
+
+@contextlib.contextmanager
+def deterministic(seed="vocutil"):
+    """Create identifiers deterministically.
+
+    Within the context, identifiers are ``uuid5`` identifiers derived
+    from ``seed`` and a counter, and cartridges record fixed
+    timestamps, so building the same input with the same seed creates
+    the same cartridge.  Contexts are per thread and can be nested.
+
+    Parameters
+    ----------
+    seed : str, optional
+        The seed of the identifiers, such as the unit name.
+    """
+    previous = (
+        getattr(_state, "namespace", None),
+        getattr(_state, "counter", 0),
+    )
+    _state.namespace = uuid.uuid5(uuid.NAMESPACE_URL, f"vocutil:{seed}")
+    _state.counter = 0
+
+    try:
+        yield
+    finally:
+        _state.namespace, _state.counter = previous
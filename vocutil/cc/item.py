@@ -12,7 +12,7 @@
 
 """Common Cartridge item."""
 
-import uuid
+from .ids import new_uuid
 
 
 class Item:
@@ -20,14 +20,78 @@ class Item:
 
     A general Common Cartridge question item.  All other question
     types are subclassed from ``Item``.
+
+    Items hold only their data (identifier, question, answers, and
+    flags) until one of the elements in ``_elements`` is accessed,
+    such as ``item`` or through ``to_xml()``, which builds the element
+    tree from the data with ``_build()``.  The tree is not rebuilt, so
+    changes to the data after the first access are not reflected in
+    the tree.
     """
 
+    __slots__ = ("uuid", "item")
+
+    # The ``cc_profile`` field entry and JSON ``type`` of the item,
+    # with which subclasses are registered.
+    profile = None
+    json_type = None
+
+    # Attributes set by ``_build()``.
+    _elements = ("item",)
+
     def __init__(self, **kwargs):
-        """Initialize an item."""
-        self.uuid = uuid.uuid4()
+        """Initialize an item.
+
+        Parameters
+        ----------
+        uuid : uuid.UUID, optional
+            The item identifier, instead of a new one.
+        """
+        self.uuid = kwargs["uuid"] if "uuid" in kwargs else new_uuid()
 
         return
 
+    def __getattr__(self, name):
+        """Build the element tree on first access to its elements."""
+        if name not in type(self)._elements:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+        self._build()
+
+        return object.__getattribute__(self, name)
+
+    def __getstate__(self):
+        """Get the item data, without the element tree, for pickling."""
+        return (
+            None,
+            {
+                name: getattr(self, name)
+                for cls in type(self).__mro__
+                for name in getattr(cls, "__slots__", ())
+                if name not in self._elements
+            },
+        )
+
+    def _build(self):
+        """Build the element tree from the item data.
+
+        Build the element tree from the item data, setting each
+        attribute in ``_elements``.  Subclasses should override this
+        method.
+
+        Raises
+        ------
+        NotImplementedError
+            Raises if you do not implement this part of the interface
+            you filthy animal.
+        """
+        raise NotImplementedError(
+            "Items inheriting from ``Item`` should implement"
+            " their own ``_build()`` interface."
+        )
+
     @classmethod
     def from_dict(cls, data, **kwargs):
         """Instantiate from a dict.
@@ -54,6 +118,59 @@ class Item:
             " ``from_dict()`` interface."
         )
 
+    @classmethod
+    def many(cls, questions, answers, **kwargs):
+        """Instantiate many items from columns of data.
+
+        Instantiate many items from columns of data, with the
+        identifiers created in bulk.  Subclasses should override this
+        method.
+
+        Parameters
+        ----------
+        cls
+            The ``Item`` class.
+        questions : [str]
+            The question text of each item.
+        answers : [obj]
+            The answer data of each item.
+
+        Raises
+        ------
+        NotImplementedError
+            Raises if you do not implement this part of the interface
+            you filthy animal.
+        """
+        raise NotImplementedError(
+            "Items inheriting from ``Item`` should implement their own"
+            " ``many()`` interface."
+        )
+
+    @classmethod
+    def from_element(cls, tree, **kwargs):
+        """Instantiate from an IMSCC XML element.
+
+        Instantiate from a parsed IMSCC ``item`` element.  Subclasses
+        should override this method.
+
+        Parameters
+        ----------
+        cls
+            The ``Item`` class.
+        tree : xml.etree.ElementTree.Element
+            An IMSCC ``item`` element.
+
+        Raises
+        ------
+        NotImplementedError
+            Raises if you do not implement this part of the interface
+            you filthy animal.
+        """
+        raise NotImplementedError(
+            "Items inheriting from ``Item`` should implement their own"
+            " ``from_element()`` interface."
+        )
+
     @classmethod
     def from_json(cls, data, **kwargs):
         """Instantiate from JSON data.
@@ -156,3 +273,21 @@ class Item:
             "Items inheriting from ``Item`` should implement"
             " their own ``to_xml()`` interface."
         )
+
+    def to_qti(self, declaration=False):
+        """Create a string of IMSCC XML data from item fields.
+
+        Create a string of IMSCC XML data from item fields without
+        building an element tree.  Subclasses should override this
+        method.
+
+        Raises
+        ------
+        NotImplementedError
+            Raises if you do not implement this part of the interface
+            you filthy animal.
+        """
+        raise NotImplementedError(
+            "Items inheriting from ``Item`` should implement"
+            " their own ``to_qti()`` interface."
+        )
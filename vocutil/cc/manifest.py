@@ -12,19 +12,96 @@
 
 """Common Cartridge manifest."""
 
+import io
 import uuid
 from xml.etree.ElementTree import Element as ETElement  # nosec B405
 from xml.etree.ElementTree import SubElement as ETSubElement  # nosec B405
 
 import defusedxml.ElementTree as ET
 
+from ..exceptions import VocutilError
+from .ids import new_uuid
+from .registry import local_name
+
+_XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+
+def _qualify(name, scope, declarations, attribute=False):
+    """Convert a ``{uri}local`` name to the ``prefix:local`` form.
+
+    The prefix is the one bound to ``uri`` in ``scope``, a mapping of
+    prefixes to namespaces, or the default namespace for an element.
+    An unbound namespace is given a new prefix, added to ``scope`` and
+    to the ``declarations`` of the element.  Other names are returned
+    as they are.
+    """
+    if name[:1] != "{":
+        return name
+
+    uri, local = name[1:].split("}", 1)
+    if uri == _XML_NAMESPACE:
+        return f"xml:{local}"
+    if not attribute and scope.get("") == uri:
+        return local
+
+    for prefix, value in reversed(scope.items()):
+        if prefix and value == uri:
+            return f"{prefix}:{local}"
+
+    n = 0
+    while f"ns{n}" in scope:
+        n += 1
+    scope[f"ns{n}"] = uri
+    declarations[f"xmlns:ns{n}"] = uri
+
+    return f"ns{n}:{local}"
+
+
+def _prefixed(element, namespaces, scope=None):
+    """Copy ``element`` with prefixed names and namespace declarations.
+
+    ``namespaces`` maps parsed elements to the namespace declarations
+    they were read with, which are restored on the copy and are in
+    scope for its children.
+    """
+    scope = dict(scope or {})
+    declarations = {}
+    for prefix, uri in namespaces.get(element, ()):
+        scope[prefix] = uri
+        declarations[f"xmlns:{prefix}" if prefix else "xmlns"] = uri
+
+    tag = _qualify(element.tag, scope, declarations)
+    attrib = {
+        _qualify(key, scope, declarations, attribute=True): value
+        for key, value in element.items()
+    }
+
+    copy = ETElement(tag, {**declarations, **attrib})
+    copy.text = element.text
+    copy.tail = element.tail
+    copy.extend(_prefixed(child, namespaces, scope) for child in element)
+
+    return copy
+
+
+def _child(element, tag):
+    """Get the first child of ``element`` named ``tag``, if any."""
+    if element is None:
+        return None
+
+    for child in element:
+        if local_name(child.tag) == tag:
+            return child
+
+    return None
+
 
 class Manifest:
     """A Common Cartridge manifest."""
 
     def __init__(self, **kwargs):
         """Initialize a manifest."""
-        self.uuid = uuid.uuid4()
+        self.uuid = new_uuid()
         self.manifest = ETElement(
             "manifest",
             attrib={
@@ -63,11 +140,73 @@ class Manifest:
         # File locations.
         self.resources = ETSubElement(self.manifest, "resources")
 
+        # Namespace declarations by element, for parsed manifests.
+        self._namespaces = None
+
         return
 
+    @classmethod
+    def from_xml(cls, manifest):
+        """Create a ``Manifest`` from XML data.
+
+        Names are kept in the ``{uri}local`` form and the namespace
+        declarations of each element are kept with it, so the manifest
+        serializes with the prefixes it was read with.  Elements added
+        later, such as new resources, are written as they are named.
+
+        Parameters
+        ----------
+        cls
+            The ``Manifest`` class.
+        manifest : str or bytes
+            A string containing an ``imsmanifest.xml`` document.
+        """
+        if isinstance(manifest, str):
+            manifest = manifest.encode("utf-8")
+
+        namespaces = {}
+        declarations = []
+        root = None
+        for event, data in ET.iterparse(
+            io.BytesIO(manifest), events=("start-ns", "start")
+        ):
+            if event == "start-ns":
+                declarations.append(data)
+                continue
+            if declarations:
+                namespaces[data] = declarations
+                declarations = []
+            if root is None:
+                root = data
+
+        self = cls.__new__(cls)
+        try:
+            self.uuid = uuid.UUID(root.get("identifier"))
+        except (TypeError, ValueError):
+            self.uuid = root.get("identifier")
+        self.manifest = root
+        self._namespaces = namespaces
+
+        self.metadata = _child(root, "metadata")
+        title = self.metadata
+        for tag in ("lom", "general", "title", "string"):
+            title = _child(title, tag)
+        self.title = title
+
+        self.organizations = _child(root, "organizations")
+        self.organization = _child(self.organizations, "organization")
+        self.root = _child(self.organization, "item")
+        self.resources = _child(root, "resources")
+
+        return self
+
     def __str__(self):
         """Stringify myself."""
-        return ET.tostring(self.manifest, encoding="unicode", xml_declaration=True)
+        manifest = self.manifest
+        if self._namespaces is not None:
+            manifest = _prefixed(manifest, self._namespaces)
+
+        return ET.tostring(manifest, encoding="unicode", xml_declaration=True)
 
     def set_title(self, title):
         """Set the ``title`` tag of the manifest."""
@@ -80,3 +219,82 @@ class Manifest:
         """Append resources to the manifest."""
         self.root.append(res.item)
         self.resources.append(res.resource)
+
+    def _find(self, identifier):
+        """Find the item and resource for a resource identifier."""
+        identifier = str(identifier)
+
+        for resource in self.resources:
+            if resource.get("identifier") == identifier:
+                break
+        else:
+            raise VocutilError(f"No resource with identifier {identifier}")
+
+        for item in self.root:
+            if item.get("identifierref") == identifier:
+                break
+        else:
+            item = None
+
+        return item, resource
+
+    def remove(self, identifier):
+        """Remove a resource from the manifest.
+
+        Parameters
+        ----------
+        identifier : str
+            The identifier of the resource.
+
+        Returns
+        -------
+        xml.etree.ElementTree.Element
+            The removed resource element.
+
+        Raises
+        ------
+        VocutilError
+            Raises if the manifest has no resource ``identifier``.
+        """
+        item, resource = self._find(identifier)
+
+        if item is not None:
+            self.root.remove(item)
+        self.resources.remove(resource)
+
+        return resource
+
+    def replace(self, identifier, res):
+        """Replace a resource in the manifest, keeping its position.
+
+        Parameters
+        ----------
+        identifier : str
+            The identifier of the resource to replace.
+        res : Resource
+            The replacement resource.
+
+        Returns
+        -------
+        xml.etree.ElementTree.Element
+            The replaced resource element.
+
+        Raises
+        ------
+        VocutilError
+            Raises if the manifest has no resource ``identifier``.
+        """
+        item, resource = self._find(identifier)
+
+        if item is not None:
+            index = list(self.root).index(item)
+            self.root.remove(item)
+            self.root.insert(index, res.item)
+        else:
+            self.root.append(res.item)
+
+        index = list(self.resources).index(resource)
+        self.resources.remove(resource)
+        self.resources.insert(index, res.resource)
+
+        return resource
@@ -18,12 +18,37 @@ from xml.etree.ElementTree import SubElement as ETSubElement  # nosec B405
 
 import defusedxml.ElementTree as ET
 
+from . import qti
+from .ids import new_uuids
 from .item import Item
+from .registry import register
 
 
+@register
 class MultipleChoice(Item):
     """A Common Cartridge multiple choice item."""
 
+    profile = "cc.multiple_choice.v0p1"
+    json_type = "multiple choice"
+
+    # Element tree attributes, set by ``_build()``.
+    _elements = Item._elements + (
+        "itemmetadata",
+        "qtimetadata",
+        "qtimetadatafield",
+        "fieldlabel",
+        "fieldentry",
+        "presentation",
+        "material",
+        "mattext",
+        "response",
+        "choices",
+    )
+
+    # Slots for the item data and the element tree; ``item`` has its
+    # slot in ``Item``.
+    __slots__ = ("question", "answers") + _elements[1:]
+
     def __init__(self, question, answers, **kwargs):
         """Initialize a ``MultipleChoice`` item.
 
@@ -41,6 +66,11 @@ class MultipleChoice(Item):
 
         self.question = question
         self.answers = answers
+
+        return
+
+    def _build(self):
+        """Build the multiple choice element tree from the item data."""
         self.item = ETElement("item", ident=str(self.uuid))
         self.itemmetadata = ETSubElement(self.item, "itemmetadata")
         self.qtimetadata = ETSubElement(self.itemmetadata, "qtimetadata")
@@ -48,11 +78,11 @@ class MultipleChoice(Item):
         self.fieldlabel = ETSubElement(self.qtimetadatafield, "fieldlabel")
         self.fieldlabel.text = "cc_profile"
         self.fieldentry = ETSubElement(self.qtimetadatafield, "fieldentry")
-        self.fieldentry.text = "cc.multiple_choice.v0p1"
+        self.fieldentry.text = self.profile
         self.presentation = ETSubElement(self.item, "presentation")
         self.material = ETSubElement(self.presentation, "material")
         self.mattext = ETSubElement(self.material, "mattext", texttype="text/html")
-        self.mattext.text = question
+        self.mattext.text = self.question
 
         self.response = ETSubElement(
             self.presentation,
@@ -63,7 +93,7 @@ class MultipleChoice(Item):
         self.choices = ETSubElement(self.response, "render_choice")
 
         correct = None
-        for i, ans in enumerate(answers):
+        for i, ans in enumerate(self.answers):
             ident = f"{self.uuid}-{i}"
             choice = ETSubElement(self.choices, "response_label", ident=ident)
             material = ETSubElement(choice, "material")
@@ -97,6 +127,57 @@ class MultipleChoice(Item):
 
         return
 
+    @classmethod
+    def many(cls, questions, answers, correct, **kwargs):
+        """Create ``MultipleChoice`` items from columns of data.
+
+        Create ``MultipleChoice`` items from columns of data, with the
+        identifiers created in bulk.
+
+        Parameters
+        ----------
+        cls
+            The ``MultipleChoice`` class.
+        questions : [str]
+            The HTML formatted question text of each item.
+        answers : [[str]]
+            The possible answers of each item.
+        correct : [int]
+            The index of the correct answer of each item.
+        """
+        questions = list(questions)
+
+        return [
+            cls(
+                question,
+                [
+                    {"answer": answer, "correct": i == index}
+                    for i, answer in enumerate(choices)
+                ],
+                uuid=uuid,
+                **kwargs,
+            )
+            for question, choices, index, uuid in zip(
+                questions, answers, correct, new_uuids(len(questions))
+            )
+        ]
+
+    @classmethod
+    def from_dict(cls, data, **kwargs):
+        """Create a ``MultipleChoice`` item from a dict.
+
+        Create a ``MultipleChoice`` item from a dict of multiple
+        choice data, as created by ``to_dict()``.
+
+        Parameters
+        ----------
+        cls
+            The ``MultipleChoice`` class.
+        data : dict
+            A dict containing multiple choice data.
+        """
+        return cls(data["question"], data["answers"], **kwargs)
+
     @classmethod
     def from_json(cls, item, **kwargs):
         """Create a ``MultipleChoice`` item from JSON data.
@@ -110,25 +191,22 @@ class MultipleChoice(Item):
         item : str
             A string containing JSON multiple choice data.
         """
-        data = json.loads(item)
-
-        return cls(data["question"], data["answers"], **kwargs)
+        return cls.from_dict(json.loads(item), **kwargs)
 
     @classmethod
-    def from_xml(cls, item, **kwargs):
-        """Create a ``MultipleChoice`` item from XML data.
+    def from_element(cls, tree, **kwargs):
+        """Create a ``MultipleChoice`` item from an XML element.
 
-        Create a ``MultipleChoice`` item from XML data.
+        Create a ``MultipleChoice`` item from a parsed IMSCC multiple
+        choice ``item`` element.
 
         Parameters
         ----------
         cls
             The ``MultipleChoice`` class.
-        item : str
-            A string containing IMSCC multiple choice XML data.
+        tree : xml.etree.ElementTree.Element
+            An IMSCC multiple choice ``item`` element.
         """
-        tree = ET.fromstring(item)
-
         # Question text.
         q = tree.find("presentation").find("material").find("mattext").text
 
@@ -157,30 +235,44 @@ class MultipleChoice(Item):
 
         return cls(q, a, **kwargs)
 
+    @classmethod
+    def from_xml(cls, item, **kwargs):
+        """Create a ``MultipleChoice`` item from XML data.
+
+        Create a ``MultipleChoice`` item from XML data.
+
+        Parameters
+        ----------
+        cls
+            The ``MultipleChoice`` class.
+        item : str
+            A string containing IMSCC multiple choice XML data.
+        """
+        return cls.from_element(ET.fromstring(item), **kwargs)
+
+    def to_dict(self):
+        """Create a multiple choice dict from item data."""
+        # Only the last correct answer is marked correct in the XML.
+        correct = None
+        for i, ans in enumerate(self.answers):
+            if ans["correct"]:
+                correct = i
+
+        return {
+            "type": "multiple choice",
+            "question": self.question,
+            "answers": [
+                {
+                    "answer": ans["answer"],
+                    "correct": i == correct,
+                }
+                for i, ans in enumerate(self.answers)
+            ],
+        }
+
     def to_json(self):
         """Create a multiple choice JSON string from item data."""
-        # Correct answer.
-        correct = (
-            self.item.find("resprocessing")
-            .find("respcondition")
-            .find("conditionvar")
-            .find("varequal")
-            .text
-        )
-
-        return json.dumps(
-            {
-                "type": "multiple choice",
-                "question": self.mattext.text,
-                "answers": [
-                    {
-                        "answer": ele.find("material").find("mattext").text,
-                        "correct": True if correct == ele.get("ident") else False,
-                    }
-                    for ele in self.choices.findall("response_label")
-                ],
-            }
-        )
+        return json.dumps(self.to_dict())
 
     def to_xml(self, declaration=False):
         """Create a multiple choice XML string from item data."""
@@ -189,3 +281,15 @@ class MultipleChoice(Item):
             encoding="unicode",
             xml_declaration=declaration,
         )
+
+    def to_qti(self, declaration=False):
+        """Create a multiple choice XML string from item fields.
+
+        The XML is written directly from the item fields with ``qti``
+        string templates rather than serialized from the element tree.
+        The output matches ``to_xml()``, in a fraction of the time, as
+        long as the element tree has not been modified.
+        """
+        xml = qti.multiple_choice(self.uuid, self.question, self.answers)
+
+        return qti.declaration() + xml if declaration else xml
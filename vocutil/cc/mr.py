@@ -18,7 +18,10 @@ from xml.etree.ElementTree import SubElement as ETSubElement  # nosec B405
 
 import defusedxml.ElementTree as ET
 
+from . import qti
+from .ids import new_uuids
 from .item import Item
+from .registry import register
 
 
 def _get_answer_states(conditionvar):
@@ -101,9 +104,31 @@ def _parse_answers(tree):
     return answers
 
 
+@register
 class MultipleResponse(Item):
     """A Common Cartridge multiple response item."""
 
+    profile = "cc.multiple_response.v0p1"
+    json_type = "multiple response"
+
+    # Element tree attributes, set by ``_build()``.
+    _elements = Item._elements + (
+        "itemmetadata",
+        "qtimetadata",
+        "qtimetadatafield",
+        "fieldlabel",
+        "fieldentry",
+        "presentation",
+        "material",
+        "mattext",
+        "response",
+        "choices",
+    )
+
+    # Slots for the item data and the element tree; ``item`` has its
+    # slot in ``Item``.
+    __slots__ = ("question", "answers") + _elements[1:]
+
     def __init__(self, question, answers, **kwargs):
         """Initialize a ``MultipleResponse`` item.
 
@@ -122,6 +147,10 @@ class MultipleResponse(Item):
         self.question = question
         self.answers = answers
 
+        return
+
+    def _build(self):
+        """Build the multiple response element tree from the item data."""
         self.item = ETElement("item", ident=str(self.uuid))
         self.itemmetadata = ETSubElement(self.item, "itemmetadata")
         self.qtimetadata = ETSubElement(self.itemmetadata, "qtimetadata")
@@ -129,11 +158,11 @@ class MultipleResponse(Item):
         self.fieldlabel = ETSubElement(self.qtimetadatafield, "fieldlabel")
         self.fieldlabel.text = "cc_profile"
         self.fieldentry = ETSubElement(self.qtimetadatafield, "fieldentry")
-        self.fieldentry.text = "cc.multiple_response.v0p1"
+        self.fieldentry.text = self.profile
         self.presentation = ETSubElement(self.item, "presentation")
         self.material = ETSubElement(self.presentation, "material")
         self.mattext = ETSubElement(self.material, "mattext", texttype="text/html")
-        self.mattext.text = question
+        self.mattext.text = self.question
 
         self.response = ETSubElement(
             self.presentation,
@@ -144,7 +173,7 @@ class MultipleResponse(Item):
         self.choices = ETSubElement(self.response, "render_choice")
 
         ans_states = {}
-        for i, ans in enumerate(answers):
+        for i, ans in enumerate(self.answers):
             ident = f"{self.uuid}-{i}"
             choice = ETSubElement(self.choices, "response_label", ident=ident)
             material = ETSubElement(choice, "material")
@@ -186,6 +215,60 @@ class MultipleResponse(Item):
 
         return
 
+    @classmethod
+    def many(cls, questions, answers, correct, **kwargs):
+        """Create ``MultipleResponse`` items from columns of data.
+
+        Create ``MultipleResponse`` items from columns of data, with
+        the identifiers created in bulk.
+
+        Parameters
+        ----------
+        cls
+            The ``MultipleResponse`` class.
+        questions : [str]
+            The HTML formatted question text of each item.
+        answers : [[str]]
+            The possible answers of each item.
+        correct : [[int]]
+            The indexes of the correct answers of each item.
+        """
+        questions = list(questions)
+
+        return [
+            cls(
+                question,
+                [
+                    {"answer": answer, "correct": i in indexes}
+                    for i, answer in enumerate(choices)
+                ],
+                uuid=uuid,
+                **kwargs,
+            )
+            for question, choices, indexes, uuid in zip(
+                questions,
+                answers,
+                (frozenset(indexes) for indexes in correct),
+                new_uuids(len(questions)),
+            )
+        ]
+
+    @classmethod
+    def from_dict(cls, data, **kwargs):
+        """Create a ``MultipleResponse`` item from a dict.
+
+        Create a ``MultipleResponse`` item from a dict of multiple
+        response data, as created by ``to_dict()``.
+
+        Parameters
+        ----------
+        cls
+            The ``MultipleResponse`` class.
+        data : dict
+            A dict containing multiple response data.
+        """
+        return cls(data["question"], data["answers"], **kwargs)
+
     @classmethod
     def from_json(cls, item, **kwargs):
         """Create a ``MultipleResponse`` item from JSON data.
@@ -199,9 +282,27 @@ class MultipleResponse(Item):
         item : str
             A string containing JSON multiple response data.
         """
-        data = json.loads(item)
+        return cls.from_dict(json.loads(item), **kwargs)
 
-        return cls(data["question"], data["answers"], **kwargs)
+    @classmethod
+    def from_element(cls, tree, **kwargs):
+        """Create a ``MultipleResponse`` item from an XML element.
+
+        Create a ``MultipleResponse`` item from a parsed IMSCC
+        multiple response ``item`` element.
+
+        Parameters
+        ----------
+        cls
+            The ``MultipleResponse`` class.
+        tree : xml.etree.ElementTree.Element
+            An IMSCC multiple response ``item`` element.
+        """
+        return cls(
+            tree.find("presentation").find("material").find("mattext").text,
+            list(_parse_answers(tree).values()),
+            **kwargs,
+        )
 
     @classmethod
     def from_xml(cls, item, **kwargs):
@@ -216,29 +317,25 @@ class MultipleResponse(Item):
         item : str
             A string containing IMSCC multiple response XML data.
         """
-        tree = ET.fromstring(item)
+        return cls.from_element(ET.fromstring(item), **kwargs)
 
-        return cls(
-            tree.find("presentation").find("material").find("mattext").text,
-            _parse_answers(tree),
-            **kwargs,
-        )
+    def to_dict(self):
+        """Create a multiple response dict from item data."""
+        return {
+            "type": "multiple response",
+            "question": self.question,
+            "answers": [
+                {
+                    "answer": ans["answer"],
+                    "correct": bool(ans["correct"]),
+                }
+                for ans in self.answers
+            ],
+        }
 
     def to_json(self):
         """Create a multiple response JSON string from item data."""
-        return json.dumps(
-            {
-                "type": "multiple response",
-                "question": self.mattext.text,
-                "answers": [
-                    {
-                        "answer": ans["answer"],
-                        "correct": ans["correct"],
-                    }
-                    for ans in _parse_answers(self.item).values()
-                ],
-            }
-        )
+        return json.dumps(self.to_dict())
 
     def to_xml(self, declaration=False):
         """Create a multiple response XML string from item data."""
@@ -247,3 +344,15 @@ class MultipleResponse(Item):
             encoding="unicode",
             xml_declaration=declaration,
         )
+
+    def to_qti(self, declaration=False):
+        """Create a multiple response XML string from item fields.
+
+        The XML is written directly from the item fields with ``qti``
+        string templates rather than serialized from the element tree.
+        The output matches ``to_xml()``, in a fraction of the time, as
+        long as the element tree has not been modified.
+        """
+        xml = qti.multiple_response(self.uuid, self.question, self.answers)
+
+        return qti.declaration() + xml if declaration else xml
@@ -0,0 +1,306 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""QTI item serialization.
+
+Serialize question items directly from their fields with string
+templates rather than building and serializing an ElementTree.  The
+output matches ``ET.tostring(item, encoding="unicode")`` byte for
+byte: the same attribute order, escaping, and self-closing empty
+elements.
+"""
+
+from xml.etree.ElementTree import Element as ETElement  # nosec B405
+
+import defusedxml.ElementTree as ET
+
+_METADATA = (
+    "<itemmetadata><qtimetadata><qtimetadatafield>"
+    "<fieldlabel>cc_profile</fieldlabel><fieldentry>{}</fieldentry>"
+    "</qtimetadatafield></qtimetadata></itemmetadata>"
+)
+
+_OUTCOMES = (
+    '<resprocessing><outcomes><decvar maxvalue="100" minvalue="0"'
+    ' varname="SCORE" vartype="Decimal" /></outcomes>'
+    '<respcondition continue="No">'
+)
+
+_SCORE = (
+    '<setvar action="Set" varname="SCORE">100</setvar>'
+    "</respcondition></resprocessing></item>"
+)
+
+
+def _serialization_error(value):
+    """Raise the ElementTree error for values it cannot serialize."""
+    raise TypeError(f"cannot serialize {value!r} (type {type(value).__name__})")
+
+
+def escape_text(text):
+    """Escape character data, as ElementTree does."""
+    try:
+        if "&" in text:
+            text = text.replace("&", "&amp;")
+        if "<" in text:
+            text = text.replace("<", "&lt;")
+        if ">" in text:
+            text = text.replace(">", "&gt;")
+        return text
+    except (TypeError, AttributeError):
+        _serialization_error(text)
+
+
+def escape_attribute(text):
+    """Escape an attribute value, as ElementTree does."""
+    try:
+        if "&" in text:
+            text = text.replace("&", "&amp;")
+        if "<" in text:
+            text = text.replace("<", "&lt;")
+        if ">" in text:
+            text = text.replace(">", "&gt;")
+        if '"' in text:
+            text = text.replace('"', "&quot;")
+        if "\r" in text:
+            text = text.replace("\r", "&#13;")
+        if "\n" in text:
+            text = text.replace("\n", "&#10;")
+        if "\t" in text:
+            text = text.replace("\t", "&#09;")
+        return text
+    except (TypeError, AttributeError):
+        _serialization_error(text)
+
+
+def _element(start, tag, text):
+    """Serialize an element with only text content.
+
+    ``start`` is the start tag up to, but not including, the closing
+    ``>``; an element without text is self-closing.
+    """
+    if text:
+        return f"{start}>{escape_text(text)}</{tag}>"
+
+    return f"{start} />"
+
+
+def _mattext(texttype, text):
+    """Serialize a ``material`` element."""
+    return (
+        "<material>"
+        + _element(f'<mattext texttype="{texttype}"', "mattext", text)
+        + "</material>"
+    )
+
+
+def _container(tag, content):
+    """Serialize an element with only child content."""
+    return f"<{tag}>{content}</{tag}>" if content else f"<{tag} />"
+
+
+def declaration():
+    """Get the XML declaration ``ET.tostring`` adds to unicode output."""
+    return ET.tostring(ETElement("x"), encoding="unicode", xml_declaration=True)[
+        : -len("<x />")
+    ]
+
+
+def object_bank(attrib, ident, items):
+    """Serialize an item bank.
+
+    Parameters
+    ----------
+    attrib : dict
+        The attributes of the ``questestinterop`` element.
+    ident : str
+        The bank identifier.
+    items : str
+        The serialized items.
+    """
+    attrs = "".join(f' {k}="{escape_attribute(v)}"' for k, v in attrib.items())
+    start = f'<objectbank ident="{escape_attribute(str(ident))}"'
+    bank = f"{start}>{items}</objectbank>" if items else f"{start} />"
+
+    return f"<questestinterop{attrs}>{bank}</questestinterop>"
+
+
+def multiple_choice(ident, question, answers):
+    """Serialize a multiple choice item.
+
+    Parameters
+    ----------
+    ident : str
+        The item identifier.
+    question : str
+        The HTML formatted question text.
+    answers : [dict]
+        The possible answers, with ``answer`` and ``correct`` keys.
+    """
+    raw = str(ident)
+    ident = escape_attribute(raw)
+
+    correct = None
+    choices = []
+    for i, ans in enumerate(answers):
+        choices.append(
+            f'<response_label ident="{ident}-{i}">'
+            + _mattext("text/html", ans["answer"])
+            + "</response_label>"
+        )
+        if ans["correct"]:
+            correct = f"{raw}-{i}"
+
+    return "".join(
+        (
+            f'<item ident="{ident}">',
+            _METADATA.format("cc.multiple_choice.v0p1"),
+            "<presentation>",
+            _mattext("text/html", question),
+            f'<response_lid ident="{ident}" rcardinality="Single">',
+            _container("render_choice", "".join(choices)),
+            "</response_lid></presentation>",
+            _OUTCOMES,
+            "<conditionvar>",
+            _element(f'<varequal respident="{ident}"', "varequal", correct),
+            "</conditionvar>",
+            _SCORE,
+        )
+    )
+
+
+def true_false(ident, question, answer):
+    """Serialize a true/false item.
+
+    Parameters
+    ----------
+    ident : str
+        The item identifier.
+    question : str
+        The HTML formatted question text.
+    answer : bool
+        The Boolean answer.
+    """
+    raw = str(ident)
+    ident = escape_attribute(raw)
+    correct = escape_text(f"{raw}-01" if answer else f"{raw}-02")
+
+    return "".join(
+        (
+            f'<item ident="{ident}">',
+            _METADATA.format("cc.true_false.v0p1"),
+            "<presentation>",
+            _mattext("text/html", question),
+            f'<response_lid ident="{ident}" rcardinality="Single"><render_choice>',
+            f'<response_label ident="{ident}-01">',
+            _mattext("text/plain", "True"),
+            f'</response_label><response_label ident="{ident}-02">',
+            _mattext("text/plain", "False"),
+            "</response_label></render_choice></response_lid></presentation>",
+            _OUTCOMES,
+            f'<conditionvar><varequal respident="{ident}">{correct}</varequal>',
+            "</conditionvar>",
+            _SCORE,
+        )
+    )
+
+
+def fill_in_the_blank(ident, question, answers, default_case="No"):
+    """Serialize a fill-in-the-blank item.
+
+    Parameters
+    ----------
+    ident : str
+        The item identifier.
+    question : str
+        The HTML formatted question text.
+    answers : [dict]
+        The correct answers, with ``answer`` and optional ``case``
+        keys.
+    default_case : str, optional
+        The case sensitivity of answers without a ``case``.
+    """
+    ident = escape_attribute(str(ident))
+    respident = f"fib-resp-{ident}"
+
+    return "".join(
+        (
+            f'<item ident="{ident}">',
+            _METADATA.format("cc.fib.v0p1"),
+            "<presentation>",
+            _mattext("text/html", question),
+            f'<response_str rcardinality="Single" ident="{respident}">',
+            '<render_fib prompt="Dashline" /></response_str></presentation>',
+            _OUTCOMES,
+            _container(
+                "conditionvar",
+                "".join(
+                    _element(
+                        '<varequal case="'
+                        + escape_attribute(
+                            answer["case"] if "case" in answer else default_case
+                        )
+                        + f'" respident="{respident}"',
+                        "varequal",
+                        answer["answer"],
+                    )
+                    for answer in answers
+                ),
+            ),
+            _SCORE,
+        )
+    )
+
+
+def multiple_response(ident, question, answers):
+    """Serialize a multiple response item.
+
+    Parameters
+    ----------
+    ident : str
+        The item identifier.
+    question : str
+        The HTML formatted question text.
+    answers : [dict]
+        The possible answers, with ``answer`` and ``correct`` keys.
+    """
+    raw = str(ident)
+    ident = escape_attribute(raw)
+
+    choices = []
+    states = []
+    for i, ans in enumerate(answers):
+        choices.append(
+            f'<response_label ident="{ident}-{i}">'
+            + _mattext("text/html", ans["answer"])
+            + "</response_label>"
+        )
+        choice = escape_text(f"{raw}-{i}")
+        varequal = f'<varequal respident="{ident}">{choice}</varequal>'
+        states.append(varequal if ans["correct"] else f"<not>{varequal}</not>")
+
+    return "".join(
+        (
+            f'<item ident="{ident}">',
+            _METADATA.format("cc.multiple_response.v0p1"),
+            "<presentation>",
+            _mattext("text/html", question),
+            f'<response_lid ident="{ident}" rcardinality="Multiple">',
+            _container("render_choice", "".join(choices)),
+            "</response_lid></presentation>",
+            _OUTCOMES,
+            "<conditionvar>",
+            _container("and", "".join(states)),
+            "</conditionvar>",
+            _SCORE,
+        )
+    )
@@ -0,0 +1,111 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""Common Cartridge item type registry.
+
+Item classes are registered by their ``cc_profile`` field entry and
+their JSON ``type``, so parsed item data is dispatched to the right
+class with one lookup.
+"""
+
+from ..exceptions import VocutilError
+
+_profiles = {}
+_types = {}
+
+
+def register(cls):
+    """Register an item class.
+
+    Register an item class by its ``profile`` and ``json_type``
+    attributes.  Use as a class decorator.
+    """
+    _profiles[cls.profile] = cls
+    _types[cls.json_type] = cls
+
+    return cls
+
+
+def local_name(tag):
+    """Get an element tag without its namespace."""
+    return tag.rpartition("}")[2]
+
+
+def item_profile(ele):
+    """Get the ``cc_profile`` field entry of an item element.
+
+    Parameters
+    ----------
+    ele : xml.etree.ElementTree.Element
+        An IMSCC ``item`` element, without namespaces.
+    """
+    for field in ele.iterfind("itemmetadata/qtimetadata/qtimetadatafield"):
+        if field.findtext("fieldlabel") == "cc_profile":
+            return field.findtext("fieldentry")
+
+    return None
+
+
+def load_xml_item(ele, **kwargs):
+    """Create an item from an IMSCC item element.
+
+    Create an item from an already parsed IMSCC ``item`` element with
+    the ``from_element()`` constructor of the class registered for
+    its ``cc_profile``.  Element namespaces are removed in place.
+
+    Parameters
+    ----------
+    ele : xml.etree.ElementTree.Element
+        An IMSCC ``item`` element.
+
+    Raises
+    ------
+    VocutilError
+        Raises if the item profile is not registered.
+    """
+    for sub in ele.iter():
+        if sub.tag[0] == "{":
+            sub.tag = local_name(sub.tag)
+
+    profile = item_profile(ele)
+
+    try:
+        cls = _profiles[profile]
+    except KeyError:
+        raise VocutilError(f"Unknown item profile {profile}") from None
+
+    return cls.from_element(ele, **kwargs)
+
+
+def load_json_item(data, **kwargs):
+    """Create an item from JSON item data.
+
+    Create an item from already parsed JSON item data with the
+    ``from_dict()`` constructor of the class registered for its
+    ``type``.
+
+    Parameters
+    ----------
+    data : dict
+        The JSON item data.
+
+    Raises
+    ------
+    VocutilError
+        Raises if the item type is not registered.
+    """
+    try:
+        cls = _types[data.get("type")]
+    except KeyError:
+        raise VocutilError(f"Unknown item type {data.get('type')}") from None
+
+    return cls.from_dict(data, **kwargs)
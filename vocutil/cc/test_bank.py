@@ -12,8 +12,12 @@
 
 """vocutil CC item bank tests."""
 
+import io
 import json
 
+import defusedxml.ElementTree as ET
+import pytest
+
 import vocutil
 
 
@@ -78,3 +82,291 @@ def test_should_export_empty_json_bank():
     actual = json.loads(questions.to_json())
 
     assert actual == expected
+
+
+def _bank():
+    """Create a bank of one item of each type."""
+    questions = vocutil.cc.Bank()
+    questions.append(
+        vocutil.cc.MultipleChoice(
+            "<p>Pick one.</p>",
+            [
+                {"answer": "right", "correct": True},
+                {"answer": "wrong", "correct": False},
+            ],
+        )
+    )
+    questions.append(
+        vocutil.cc.MultipleResponse(
+            "<p>Pick two.</p>",
+            [
+                {"answer": "right", "correct": True},
+                {"answer": "correct", "correct": True},
+                {"answer": "wrong", "correct": False},
+            ],
+        )
+    )
+    questions.append(vocutil.cc.TrueFalse("<p>True?</p>", True))
+    questions.append(
+        vocutil.cc.FillInTheBlank("<p>_: blank</p>", [{"answer": "blank"}])
+    )
+
+    return questions
+
+
+def test_should_export_json_bank():
+    """Should export a JSON bank from item data."""
+    questions = _bank()
+
+    actual = json.loads(questions.to_json())
+
+    assert [q["type"] for q in actual["questions"]] == [
+        "multiple choice",
+        "multiple response",
+        "true/false",
+        "fib",
+    ]
+    assert actual["questions"] == [
+        json.loads(item.to_json()) for item in questions.items
+    ]
+
+
+def test_should_write_json_bank():
+    """Should write the same JSON as ``to_json()``."""
+    questions = _bank()
+    f = io.StringIO()
+
+    questions.write_json(f)
+
+    assert f.getvalue() == questions.to_json()
+
+
+def test_should_export_xml_bank():
+    """Should add item trees to the XML bank on export."""
+    questions = _bank()
+
+    xml = questions.to_xml()
+
+    for item in questions.items:
+        assert item.to_xml() in xml
+
+    questions.append(vocutil.cc.TrueFalse("<p>False?</p>", False))
+
+    assert len(ET.fromstring(questions.to_xml())[0]) == 5
+
+
+def test_should_create_bank_from_records():
+    """Should create a bank from columns of item data."""
+    questions = vocutil.cc.Bank.from_records(
+        vocutil.cc.MultipleChoice,
+        ["<p>One?</p>", "<p>Two?</p>"],
+        [["a", "b"], ["c", "d", "e"]],
+        [1, 0],
+    )
+
+    assert [json.loads(item.to_json()) for item in questions.items] == [
+        {
+            "type": "multiple choice",
+            "question": "<p>One?</p>",
+            "answers": [
+                {"answer": "a", "correct": False},
+                {"answer": "b", "correct": True},
+            ],
+        },
+        {
+            "type": "multiple choice",
+            "question": "<p>Two?</p>",
+            "answers": [
+                {"answer": "c", "correct": True},
+                {"answer": "d", "correct": False},
+                {"answer": "e", "correct": False},
+            ],
+        },
+    ]
+
+
+def test_many_should_match_single_items():
+    """Should create the same items in bulk as one at a time."""
+    with vocutil.cc.deterministic("many"):
+        expected = [
+            vocutil.cc.MultipleResponse(
+                "<p>Pick two.</p>",
+                [
+                    {"answer": "a", "correct": True},
+                    {"answer": "b", "correct": False},
+                    {"answer": "c", "correct": True},
+                ],
+            ),
+            vocutil.cc.TrueFalse("<p>True?</p>", False),
+            vocutil.cc.FillInTheBlank("<p>_: blank</p>", [{"answer": "blank"}]),
+        ]
+    with vocutil.cc.deterministic("many"):
+        actual = (
+            vocutil.cc.MultipleResponse.many(
+                ["<p>Pick two.</p>"], [["a", "b", "c"]], [[0, 2]]
+            )
+            + vocutil.cc.TrueFalse.many(["<p>True?</p>"], [False])
+            + vocutil.cc.FillInTheBlank.many(["<p>_: blank</p>"], [["blank"]])
+        )
+
+    assert [item.to_xml() for item in actual] == [item.to_xml() for item in expected]
+
+
+def test_should_stream_items_from_xml_file(tmp_path):
+    """Should load items one at a time from an XML file."""
+    items = [vocutil.cc.TrueFalse(f"<p>{i} is even.</p>", i % 2 == 0) for i in range(5)]
+    fn = tmp_path / "bank.xml"
+    fn.write_text(
+        '<questestinterop xmlns="http://www.imsglobal.org/xsd/ims_qtiasiv1p2">'
+        '<objectbank ident="bank">'
+        + "".join(item.to_xml() for item in items)
+        + "</objectbank></questestinterop>"
+    )
+
+    with open(fn, "rb") as f:
+        assert [item.to_dict() for item in vocutil.cc.iter_bank_items(f)] == [
+            item.to_dict() for item in items
+        ]
+
+    questions = vocutil.cc.Bank.from_xml_file(str(fn))
+
+    assert questions.to_json() == json.dumps(
+        {
+            "type": "question bank",
+            "questions": [item.to_dict() for item in items],
+        }
+    )
+
+
+def test_should_stream_items_after_bank_metadata(tmp_path):
+    """Should skip ``objectbank`` metadata and keep the tree small."""
+    items = [vocutil.cc.TrueFalse(f"<p>{i} is even.</p>", i % 2 == 0) for i in range(2)]
+    xml = (
+        '<questestinterop xmlns="http://www.imsglobal.org/xsd/ims_qtiasiv1p2">'
+        '<objectbank ident="bank"><qtimetadata><qtimetadatafield>'
+        "<fieldlabel>bank_type</fieldlabel><fieldentry>Item Bank</fieldentry>"
+        "</qtimetadatafield></qtimetadata>"
+        + "".join(item.to_xml() for item in items)
+        + "</objectbank></questestinterop>"
+    )
+    fn = tmp_path / "bank.xml"
+    fn.write_text(xml)
+
+    expected = [item.to_dict() for item in items]
+
+    assert [item.to_dict() for item in vocutil.cc.Bank.from_xml(xml).items] == (
+        expected
+    )
+    assert [item.to_dict() for item in vocutil.cc.iter_bank_items(str(fn))] == (
+        expected
+    )
+    assert [
+        item.to_dict() for item in vocutil.cc.Bank.from_xml_file(str(fn)).items
+    ] == expected
+
+
+def test_should_roundtrip_bank_with_xml():
+    """Should load every item type from bank XML."""
+    questions = _bank()
+
+    actual = vocutil.cc.Bank.from_xml(questions.to_xml())
+
+    assert actual.to_json() == questions.to_json()
+
+
+def test_should_roundtrip_bank_with_json():
+    """Should load every item type from bank JSON."""
+    questions = _bank()
+
+    actual = vocutil.cc.Bank.from_json(questions.to_json())
+
+    assert [type(item) for item in actual.items] == [
+        type(item) for item in questions.items
+    ]
+    assert actual.to_json() == questions.to_json()
+
+
+def test_should_reject_unknown_items():
+    """Should raise on unregistered item types."""
+    with pytest.raises(vocutil.VocutilError):
+        vocutil.cc.Bank.from_json(
+            json.dumps({"type": "question bank", "questions": [{"type": "essay"}]})
+        )
+
+    with pytest.raises(vocutil.VocutilError):
+        vocutil.cc.Bank.from_xml(
+            "<questestinterop><objectbank><item /></objectbank></questestinterop>"
+        )
+
+
+def test_to_qti_should_match_to_xml():
+    """Should serialize banks exactly as the element tree does."""
+    empty = vocutil.cc.Bank()
+    questions = _bank()
+
+    assert empty.to_qti() == empty.to_xml()
+    assert questions.to_qti(declaration=True) == questions.to_xml(declaration=True)
+    assert questions.to_qti(jobs=2) == questions.to_xml()
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_should_load_and_convert_banks(tmp_path, jobs):
+    """Should load and convert bank files in order."""
+    banks = [_bank() for _ in range(3)]
+    sources = [tmp_path / f"bank-{i}.xml" for i in range(3)]
+    for bank, source in zip(banks, sources):
+        source.write_text(bank.to_xml())
+
+    loaded = vocutil.cc.load_banks(sources, jobs=jobs)
+
+    assert [bank.to_json() for bank in loaded] == [bank.to_json() for bank in banks]
+
+    dests = [tmp_path / f"bank-{i}.json" for i in range(3)]
+
+    assert vocutil.cc.convert_banks(sources, dests, format="json", jobs=jobs) == dests
+    assert [dest.read_text() for dest in dests] == [bank.to_json() for bank in banks]
+
+
+def test_should_index_items():
+    """Should look up items by identifier, profile and question."""
+    questions = _bank()
+    mc, mr, tf, fib = questions.items
+
+    assert len(questions) == 4
+    assert mc.uuid in questions
+    assert questions.get(tf.uuid) is tf
+    assert questions.get(str(fib.uuid)) is fib
+    assert questions.get("missing") is None
+    assert questions.by_profile("cc.multiple_response.v0p1") == [mr]
+    assert questions.by_profile("cc.essay") == []
+    assert questions.by_question("pick  ONE.") == [mc]
+
+
+def test_should_reject_duplicate_items():
+    """Should reject duplicate identifiers and, if unique, questions."""
+    questions = _bank()
+
+    with pytest.raises(vocutil.VocutilError):
+        questions.append(questions.items[0])
+
+    duplicate = vocutil.cc.TrueFalse("<p>True?</p>", False)
+    questions.append(duplicate)
+
+    assert len(questions.by_question("True?")) == 2
+
+    unique = vocutil.cc.Bank(unique=True)
+    unique.append(vocutil.cc.TrueFalse("<p>True?</p>", True))
+
+    with pytest.raises(vocutil.VocutilError):
+        unique.append(vocutil.cc.TrueFalse("<b>true?</b>", False))
+
+    assert len(unique) == 1
+
+
+def test_should_normalize_questions():
+    """Should ignore markup, case, entities and whitespace."""
+    assert (
+        vocutil.cc.normalize_question("<p>Salt &amp;\n  <b>Water</b> </p>")
+        == "salt & water"
+    )
+    assert vocutil.cc.normalize_question(None) == ""
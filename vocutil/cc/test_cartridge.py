@@ -0,0 +1,410 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""vocutil CC cartridge tests."""
+
+import io
+import os
+import zipfile
+from types import SimpleNamespace
+from xml.etree.ElementTree import Element as ETElement  # nosec B405
+from xml.etree.ElementTree import SubElement as ETSubElement  # nosec B405
+
+import pytest
+
+import vocutil
+from vocutil.cc.ids import new_uuid
+
+
+def _resource(name="bank.xml", buffer="<questestinterop />", type="webcontent"):
+    """Create a minimal resource."""
+    resource_uuid = new_uuid()
+    resource_name = f"{resource_uuid}/{name}"
+    resource = ETElement(
+        "resource", identifier=str(resource_uuid), type=type, href=resource_name
+    )
+    ETSubElement(resource, "file", href=resource_name)
+
+    return SimpleNamespace(
+        resource_uuid=resource_uuid,
+        resource_name=resource_name,
+        buffer=buffer,
+        item=ETElement("item", identifierref=str(resource_uuid)),
+        resource=resource,
+    )
+
+
+def _cartridge():
+    """Create a cartridge with some resources."""
+    cartridge = vocutil.cc.Cartridge(title="Chapter 15:  Sound and Light")
+    for i in range(3):
+        cartridge.append(_resource(buffer=f"<questestinterop>{i}</questestinterop>"))
+
+    return cartridge
+
+
+def test_write_should_write_file(tmp_path):
+    """Should write the manifest and resources to the archive."""
+    cartridge = _cartridge()
+    fn = tmp_path / "cartridge.imscc.zip"
+
+    cartridge.write(fn)
+
+    with zipfile.ZipFile(fn) as zip:
+        assert zip.read("imsmanifest.xml").decode() == str(cartridge.manifest)
+        for res in cartridge.resources:
+            assert zip.read(res.resource_name).decode() == res.buffer
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_write_should_write_stream():
+    """Should write the archive to a writable stream."""
+    cartridge = _cartridge()
+    buf = io.BytesIO()
+
+    cartridge.write(buf)
+
+    with zipfile.ZipFile(buf) as zip:
+        assert len(zip.namelist()) == 1 + 1 + 2 * 3
+
+
+def test_write_should_keep_file_on_failure(tmp_path, monkeypatch):
+    """Should leave an existing archive in place if writing fails."""
+    cartridge = _cartridge()
+    fn = tmp_path / "cartridge.imscc.zip"
+    fn.write_bytes(b"old")
+
+    writestr = vocutil.cc.cartridge._writestr
+    partial = []
+
+    def _writestr(zip, name, data, date_time):
+        # Fail on a payload, after the manifest is in the temporary file.
+        if name != "imsmanifest.xml":
+            partial.extend(tmp_path.glob("*.tmp"))
+            raise OSError("disk full")
+        writestr(zip, name, data, date_time)
+
+    monkeypatch.setattr(vocutil.cc.cartridge, "_writestr", _writestr)
+
+    with pytest.raises(OSError):
+        cartridge.write(fn)
+
+    assert len(partial) == 1
+    assert fn.read_bytes() == b"old"
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_write_should_hash_payloads_once(tmp_path, monkeypatch):
+    """Should hash each payload once per write."""
+    cartridge = _cartridge()
+    fn = tmp_path / "cartridge.imscc.zip"
+
+    digest = vocutil.cc.cartridge._digest
+    hashed = []
+
+    def _digest(data):
+        hashed.append(data)
+        return digest(data)
+
+    monkeypatch.setattr(vocutil.cc.cartridge, "_digest", _digest)
+
+    cartridge.write(fn)
+
+    # The manifest and three resources.
+    assert len(hashed) == 4
+    with zipfile.ZipFile(fn) as zip:
+        assert zip.comment.startswith(b"vocutil sha256:")
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_DEFLATED, zipfile.ZIP_BZIP2])
+def test_write_should_compress(tmp_path, compression):
+    """Should compress resources with the requested method."""
+    cartridge = vocutil.cc.Cartridge()
+    for i in range(20):
+        cartridge.append(_resource(buffer="<questestinterop />" * (i + 1)))
+    fn = tmp_path / "cartridge.imscc.zip"
+
+    cartridge.write(fn, compression=compression, compresslevel=9, jobs=3)
+
+    with zipfile.ZipFile(fn) as zip:
+        assert zip.testzip() is None
+        for res in cartridge.resources:
+            info = zip.getinfo(res.resource_name)
+            assert info.compress_type == compression
+            assert zip.read(info).decode() == res.buffer
+
+
+def test_write_should_compress_to_stream():
+    """Should write compressed resources to an unseekable stream."""
+
+    class Stream(io.RawIOBase):
+        def __init__(self):
+            self.buf = io.BytesIO()
+
+        def writable(self):
+            return True
+
+        def write(self, data):
+            return self.buf.write(data)
+
+    cartridge = _cartridge()
+    stream = Stream()
+
+    cartridge.write(stream, compression=zipfile.ZIP_DEFLATED)
+
+    with zipfile.ZipFile(stream.buf) as zip:
+        assert zip.testzip() is None
+        assert zip.read(cartridge.resources[0].resource_name).decode() == (
+            cartridge.resources[0].buffer
+        )
+
+
+def test_write_should_dedupe_resources(tmp_path):
+    """Should store identical payloads once and share the file."""
+    cartridge = vocutil.cc.Cartridge(dedupe=True)
+    first = _resource(buffer="<questestinterop />")
+    second = _resource(buffer="<questestinterop />")
+    other = _resource(buffer=b"<questestinterop>other</questestinterop>")
+    for res in (first, second, other):
+        cartridge.append(res)
+    fn = tmp_path / "cartridge.imscc.zip"
+
+    cartridge.write(fn)
+
+    assert second.resource.get("href") == first.resource_name
+    assert second.resource.find("file").get("href") == first.resource_name
+    assert second.resource.get("identifier") == str(second.resource_uuid)
+    with zipfile.ZipFile(fn) as zip:
+        names = zip.namelist()
+        assert first.resource_name in names
+        assert second.resource_name not in names
+        assert f"{second.resource_uuid}/" not in names
+        assert other.resource_name in names
+        assert f'href="{first.resource_name}"' in zip.read("imsmanifest.xml").decode()
+
+
+def test_write_should_keep_duplicates_by_default(tmp_path):
+    """Should store every payload without deduplication."""
+    cartridge = vocutil.cc.Cartridge()
+    first = _resource()
+    second = _resource()
+    cartridge.append(first)
+    cartridge.append(second)
+    fn = tmp_path / "cartridge.imscc.zip"
+
+    cartridge.write(fn)
+
+    assert second.resource.get("href") == second.resource_name
+    with zipfile.ZipFile(fn) as zip:
+        assert second.resource_name in zip.namelist()
+
+
+def _members(fn):
+    """Get the infos of the members of an archive by name."""
+    with zipfile.ZipFile(fn) as zip:
+        return {info.filename: info for info in zip.infolist()}
+
+
+def test_update_should_append_replace_and_remove(tmp_path):
+    """Should update the resources of an existing cartridge."""
+    cartridge = _cartridge()
+    first, second, third = cartridge.resources
+    fn = tmp_path / "cartridge.imscc.zip"
+    cartridge.write(fn, compression=zipfile.ZIP_DEFLATED)
+    before = _members(fn)
+
+    added = _resource(buffer="<questestinterop>added</questestinterop>")
+    replacement = _resource(buffer="<questestinterop>new</questestinterop>")
+    with vocutil.cc.CartridgeUpdate(fn, compression=zipfile.ZIP_DEFLATED) as update:
+        update.append(added)
+        update.replace(str(second.resource_uuid), replacement)
+        update.remove(str(third.resource_uuid))
+
+    after = _members(fn)
+    assert set(after) == {
+        "resources/",
+        "imsmanifest.xml",
+        f"{first.resource_uuid}/",
+        first.resource_name,
+        f"{replacement.resource_uuid}/",
+        replacement.resource_name,
+        f"{added.resource_uuid}/",
+        added.resource_name,
+    }
+    # Unchanged members are copied as they were compressed.
+    for attr in ("compress_type", "compress_size", "CRC", "date_time"):
+        assert getattr(after[first.resource_name], attr) == getattr(
+            before[first.resource_name], attr
+        )
+
+    with zipfile.ZipFile(fn) as zip:
+        assert zip.testzip() is None
+        assert zip.read(added.resource_name).decode() == added.buffer
+        manifest = vocutil.cc.Manifest.from_xml(zip.read("imsmanifest.xml"))
+    assert [res.get("identifier") for res in manifest.resources] == [
+        str(first.resource_uuid),
+        str(replacement.resource_uuid),
+        str(added.resource_uuid),
+    ]
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+def test_update_should_write_to_stream(tmp_path, compression):
+    """Should copy and write members to an unseekable stream."""
+
+    class Stream(io.RawIOBase):
+        def __init__(self):
+            self.buf = io.BytesIO()
+
+        def writable(self):
+            return True
+
+        def write(self, data):
+            return self.buf.write(data)
+
+    cartridge = _cartridge()
+    fn = tmp_path / "cartridge.imscc.zip"
+    cartridge.write(fn, compression=compression)
+    added = [_resource(buffer=f"<questestinterop>{i}</questestinterop>") for i in "ab"]
+    stream = Stream()
+
+    update = vocutil.cc.CartridgeUpdate(fn, compression=compression)
+    try:
+        for res in added:
+            update.append(res)
+        update.write(stream)
+    finally:
+        update.close()
+
+    with zipfile.ZipFile(stream.buf) as zip:
+        assert zip.testzip() is None
+        for res in cartridge.resources + added:
+            assert zip.getinfo(res.resource_name).compress_type == compression
+            assert zip.read(res.resource_name).decode() == res.buffer
+
+
+def test_update_should_keep_shared_files(tmp_path):
+    """Should keep files still used by another resource."""
+    cartridge = vocutil.cc.Cartridge(dedupe=True)
+    first = _resource()
+    second = _resource()
+    cartridge.append(first)
+    cartridge.append(second)
+    fn = tmp_path / "cartridge.imscc.zip"
+    cartridge.write(fn)
+
+    with vocutil.cc.CartridgeUpdate(fn) as update:
+        update.remove(str(first.resource_uuid))
+
+    assert first.resource_name in _members(fn)
+
+
+def test_update_should_keep_cartridge_on_error(tmp_path):
+    """Should leave the cartridge unchanged if the update fails."""
+    fn = tmp_path / "cartridge.imscc.zip"
+    _cartridge().write(fn)
+    before = fn.read_bytes()
+
+    with pytest.raises(vocutil.VocutilError):
+        with vocutil.cc.CartridgeUpdate(fn) as update:
+            update.append(_resource())
+            update.remove("missing")
+
+    assert fn.read_bytes() == before
+
+
+def test_reader_should_parse_banks_on_access(tmp_path, monkeypatch):
+    """Should only parse the banks that are accessed."""
+    cartridge = vocutil.cc.Cartridge()
+    banks = [
+        _resource(
+            buffer=f'<questestinterop><objectbank ident="{i}" /></questestinterop>',
+            type="imsqti_xmlv1p2/imscc_xmlv1p2/question-bank",
+        )
+        for i in range(3)
+    ]
+    page = _resource(name="page.html", buffer="<html />")
+    for res in (*banks, page):
+        cartridge.append(res)
+    fn = tmp_path / "cartridge.imscc.zip"
+    cartridge.write(fn)
+
+    parsed = []
+    from_xml = vocutil.cc.Bank.from_xml
+
+    def _from_xml(bank, **kwargs):
+        parsed.append(bank)
+        return from_xml(bank, **kwargs)
+
+    monkeypatch.setattr(vocutil.cc.Bank, "from_xml", _from_xml)
+
+    with vocutil.cc.CartridgeReader(fn) as reader:
+        assert len(reader) == 4
+        assert list(reader.banks()) == [str(res.resource_uuid) for res in banks]
+        assert reader.read(page.resource_uuid) == b"<html />"
+        assert reader.resource_type(page.resource_uuid) == "webcontent"
+
+        bank = reader.bank(banks[1].resource_uuid)
+        assert isinstance(bank, vocutil.cc.Bank)
+        assert reader.bank(str(banks[1].resource_uuid)) is bank
+        assert parsed == [banks[1].buffer.encode()]
+
+        with pytest.raises(vocutil.VocutilError):
+            reader.bank("missing")
+
+
+def test_write_should_be_reproducible(tmp_path, monkeypatch):
+    """Should write the same archive from the same input."""
+    monkeypatch.delenv("SOURCE_DATE_EPOCH", raising=False)
+    archives = []
+    for i in range(2):
+        with vocutil.cc.deterministic("unit 1"):
+            cartridge = _cartridge()
+        fn = tmp_path / f"cartridge-{i}.imscc.zip"
+        cartridge.write(fn, compression=zipfile.ZIP_DEFLATED)
+        archives.append(fn.read_bytes())
+
+    assert archives[0] == archives[1]
+    with zipfile.ZipFile(fn) as zip:
+        assert {info.date_time for info in zip.infolist()} == {(1980, 1, 1, 0, 0, 0)}
+
+
+def test_write_should_use_source_date_epoch(tmp_path, monkeypatch):
+    """Should timestamp members at ``SOURCE_DATE_EPOCH``."""
+    monkeypatch.setenv("SOURCE_DATE_EPOCH", "1700000000")
+    with vocutil.cc.deterministic():
+        cartridge = _cartridge()
+    fn = tmp_path / "cartridge.imscc.zip"
+
+    cartridge.write(fn)
+
+    with zipfile.ZipFile(fn) as zip:
+        assert {info.date_time for info in zip.infolist()} == {
+            (2023, 11, 14, 22, 13, 20)
+        }
+
+
+def test_write_should_skip_unchanged_archive(tmp_path):
+    """Should leave an archive with the same contents as it is."""
+    with vocutil.cc.deterministic():
+        cartridge = _cartridge()
+    fn = tmp_path / "cartridge.imscc.zip"
+
+    assert cartridge.write(fn)
+    os.utime(fn, ns=(0, 0))
+    assert not cartridge.write(fn)
+    assert os.stat(fn).st_mtime_ns == 0
+
+    cartridge.append(_resource(buffer="<questestinterop>new</questestinterop>"))
+    assert cartridge.write(fn)
+    assert os.stat(fn).st_mtime_ns != 0
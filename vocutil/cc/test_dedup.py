@@ -0,0 +1,89 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""vocutil CC near-duplicate detection tests."""
+
+import pytest
+
+import vocutil
+from vocutil.cc import dedup
+
+
+def _fib(question, answer):
+    """Create a fill-in-the-blank item."""
+    return vocutil.cc.FillInTheBlank(question, [{"answer": answer}])
+
+
+def test_should_find_near_duplicates():
+    """Should report near-duplicates of earlier items."""
+    items = [
+        _fib("<p>Define osmosis.</p>", "osmosis"),
+        _fib("<p>Define diffusion.</p>", "diffusion"),
+        _fib("<p>Define  <b>osmosis</b></p>", "osmosis"),
+        _fib("<p>The movement of water across a membrane.</p>", "osmosis"),
+    ]
+
+    actual = list(vocutil.cc.near_duplicates(items))
+
+    assert [(first, second) for first, second, _ in actual] == [(items[0], items[2])]
+    assert actual[0][2] >= 0.8
+
+
+def test_should_compare_answers():
+    """Should not report items with the same question and new answers."""
+    items = [
+        vocutil.cc.TrueFalse("<p>Water is wet.</p>", True),
+        vocutil.cc.TrueFalse("<p>Water is wet.</p>", False),
+    ]
+
+    assert list(vocutil.cc.near_duplicates(items)) == []
+
+
+def test_should_deduplicate_across_banks():
+    """Should merge banks without near-duplicates."""
+    first = vocutil.cc.Bank()
+    first.extend(
+        [
+            _fib("<p>Define osmosis.</p>", "osmosis"),
+            _fib("<p>Define diffusion.</p>", "diffusion"),
+        ]
+    )
+    second = vocutil.cc.Bank()
+    second.extend(
+        [
+            _fib("<p>Define osmosis</p>", "osmosis"),
+            _fib("<p>Define refraction.</p>", "refraction"),
+        ]
+    )
+
+    merged, dropped = vocutil.cc.deduplicate(first, second)
+
+    assert merged.items == [first.items[0], first.items[1], second.items[1]]
+    assert [(a, b) for a, b, _ in dropped] == [(first.items[0], second.items[0])]
+
+
+def test_signatures_should_estimate_similarity():
+    """Should estimate Jaccard similarity from signatures."""
+    hasher = dedup.MinHash(num_perm=256)
+    a = set(range(100))
+    b = set(range(50, 150))
+
+    estimate = dedup.MinHash.similarity(hasher.signature(a), hasher.signature(b))
+
+    assert abs(estimate - 1 / 3) < 0.1
+    assert dedup.MinHash.similarity(hasher.signature(a), hasher.signature(a)) == 1
+
+
+def test_bands_should_divide_signatures():
+    """Should reject band counts that do not divide the signature."""
+    with pytest.raises(ValueError):
+        dedup.LSHIndex(num_perm=128, bands=10)
@@ -0,0 +1,71 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""vocutil CC identifier tests."""
+
+import vocutil
+from vocutil.cc import ids
+
+
+def _bank_ident():
+    """Create a bank and get its identifier."""
+    return vocutil.cc.Bank().bank.get("ident")
+
+
+def test_identifiers_should_be_random():
+    """Should create random identifiers by default."""
+    assert _bank_ident() != _bank_ident()
+    assert not ids.is_deterministic()
+    assert ids.date_time() is None
+
+
+def test_identifiers_should_be_deterministic():
+    """Should create the same identifiers from the same seed."""
+    with vocutil.cc.deterministic("unit 1"):
+        first = [_bank_ident(), str(vocutil.cc.Manifest().uuid)]
+    with vocutil.cc.deterministic("unit 1"):
+        second = [_bank_ident(), str(vocutil.cc.Manifest().uuid)]
+    with vocutil.cc.deterministic("unit 2"):
+        other = [_bank_ident(), str(vocutil.cc.Manifest().uuid)]
+
+    assert first == second
+    assert first[0] != first[1]
+    assert other != first
+
+
+def test_deterministic_contexts_should_nest():
+    """Should resume the outer sequence after a nested context."""
+    with vocutil.cc.deterministic("outer"):
+        expected = [ids.new_uuid(), ids.new_uuid()]
+    with vocutil.cc.deterministic("outer"):
+        actual = [ids.new_uuid()]
+        with vocutil.cc.deterministic("inner"):
+            ids.new_uuid()
+        actual.append(ids.new_uuid())
+
+    assert actual == expected
+    assert not ids.is_deterministic()
+
+
+def test_bulk_identifiers_should_match():
+    """Should create the same identifiers in bulk as one at a time."""
+    with vocutil.cc.deterministic("bulk"):
+        expected = [ids.new_uuid() for _ in range(3)] + [ids.new_uuid()]
+    with vocutil.cc.deterministic("bulk"):
+        actual = ids.new_uuids(3) + [ids.new_uuid()]
+
+    assert actual == expected
+
+    random = ids.new_uuids(3)
+
+    assert len(set(random)) == 3
+    assert all(u.version == 4 for u in random)
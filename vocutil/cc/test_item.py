@@ -12,11 +12,13 @@
 
 """vocutil CC item tests."""
 
+import pickle
 from uuid import UUID
 
 import pytest
 
 from vocutil.cc import Item
+from vocutil.cc import MultipleChoice
 
 
 def test_item_should_have_valid_uuid():
@@ -62,3 +64,52 @@ def test_to_xml_should_raise():
     with pytest.raises(NotImplementedError):
         item = Item()
         item.to_xml()
+
+
+def test_to_qti_should_raise():
+    """``Item.to_qti()`` should raise."""
+    with pytest.raises(NotImplementedError):
+        item = Item()
+        item.to_qti()
+
+
+def test_build_should_raise():
+    """``Item.item`` should raise without a ``_build()``."""
+    with pytest.raises(NotImplementedError):
+        item = Item()
+        item.item
+
+
+def test_unknown_attribute_should_raise():
+    """``Item`` should raise on unknown attributes without building."""
+    item = Item()
+
+    with pytest.raises(AttributeError):
+        item.mattext
+
+    with pytest.raises(AttributeError):
+        item.title = "title"
+
+
+def test_many_should_raise():
+    """``Item.many()`` should raise."""
+    with pytest.raises(NotImplementedError):
+        Item.many([], [])
+
+
+def test_from_element_should_raise():
+    """``Item.from_element()`` should raise."""
+    with pytest.raises(NotImplementedError):
+        Item.from_element(None)
+
+
+def test_pickle_should_not_build_tree():
+    """Should pickle the item data without the element tree."""
+    item = MultipleChoice("<p>Question?</p>", [{"answer": "yes", "correct": True}])
+
+    copy = pickle.loads(pickle.dumps(item))
+
+    with pytest.raises(AttributeError):
+        Item.item.__get__(item)
+    assert copy.uuid == item.uuid
+    assert copy.to_xml() == item.to_xml()
@@ -13,10 +13,11 @@
 """vocutil CC item bank tests."""
 
 import sys
+from types import SimpleNamespace
+from xml.etree.ElementTree import Element as ETElement  # nosec B405
 
 import defusedxml.ElementTree as ET
-
-# import pytest
+import pytest
 
 sys.path.insert(0, "/home/gray/src/work/vocutil")
 
@@ -54,3 +55,77 @@ def test_set_title():
     )
 
     assert actual == expected
+
+
+def _resource(identifier):
+    """Create a minimal resource."""
+    return SimpleNamespace(
+        item=ETElement("item", identifier=f"i{identifier}", identifierref=identifier),
+        resource=ETElement("resource", identifier=identifier, href=f"{identifier}/a"),
+    )
+
+
+def test_from_xml_should_roundtrip():
+    """Should read a manifest that serializes as it was written."""
+    manifest = vocutil.cc.Manifest(title="Chapter 15:  Sound & Light")
+    manifest.append(_resource("a"))
+
+    actual = vocutil.cc.Manifest.from_xml(str(manifest))
+
+    assert str(actual) == str(manifest)
+    assert actual.uuid == manifest.uuid
+    assert actual.title.text == "Chapter 15:  Sound & Light"
+    assert [item.get("identifierref") for item in actual.root] == ["a"]
+
+
+def test_from_xml_should_keep_namespaces():
+    """Should write nested namespace declarations and ``xml:lang`` back."""
+    xml = (
+        "<?xml version='1.0' encoding='utf-8'?>\n"
+        '<manifest xmlns="http://www.imsglobal.org/xsd/imsccv1p1/imscp_v1p1" '
+        'xmlns:lomimscc="http://ltsc.ieee.org/xsd/imsccv1p1/LOM/manifest" '
+        'identifier="m">'
+        "<metadata><lomimscc:lom><lomimscc:general><lomimscc:title>"
+        '<lomimscc:string xml:lang="en">Sound</lomimscc:string>'
+        "</lomimscc:title></lomimscc:general></lomimscc:lom></metadata>"
+        '<organizations><organization identifier="org"><item identifier="root">'
+        '<item identifier="ia" identifierref="a" /></item></organization>'
+        "</organizations>"
+        '<resources><resource identifier="a" href="a/a">'
+        '<metadata><lom xmlns="http://ltsc.ieee.org/xsd/imsccv1p1/LOM/resource">'
+        "<general /></lom></metadata>"
+        '<file href="a/a" /></resource></resources>'
+        "</manifest>"
+    )
+
+    manifest = vocutil.cc.Manifest.from_xml(xml)
+
+    assert str(manifest) == xml
+    assert manifest.title.text == "Sound"
+    assert [res.get("identifier") for res in manifest.resources] == ["a"]
+
+    manifest.append(_resource("b"))
+    manifest.remove("a")
+    actual = ET.fromstring(str(manifest))
+    assert [
+        res.get("identifier")
+        for res in actual.iter(
+            "{http://www.imsglobal.org/xsd/imsccv1p1/imscp_v1p1}resource"
+        )
+    ] == ["b"]
+
+
+def test_remove_and_replace():
+    """Should remove and replace resources in place."""
+    manifest = vocutil.cc.Manifest(title="test")
+    for identifier in ("a", "b", "c"):
+        manifest.append(_resource(identifier))
+
+    assert manifest.remove("a").get("href") == "a/a"
+    assert manifest.replace("c", _resource("d")).get("href") == "c/a"
+    manifest.append(_resource("e"))
+
+    assert [item.get("identifierref") for item in manifest.root] == ["b", "d", "e"]
+    assert [res.get("identifier") for res in manifest.resources] == ["b", "d", "e"]
+    with pytest.raises(vocutil.VocutilError):
+        manifest.remove("a")
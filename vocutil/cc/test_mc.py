@@ -14,6 +14,8 @@
 
 import json
 
+import pytest
+
 import vocutil
 
 
@@ -111,3 +113,27 @@ def test_mc_xml_roundtrip():
     xml_item = vocutil.cc.MultipleChoice.from_xml(xml_str)
 
     assert item.question == xml_item.question
+
+
+def test_mc_should_build_tree_lazily():
+    """Should build the element tree on first access."""
+    item = vocutil.cc.MultipleChoice(
+        "<p>Question?</p>",
+        [
+            {"answer": "right", "correct": True},
+            {"answer": "wrong", "correct": False},
+        ],
+    )
+
+    assert not hasattr(item, "__dict__")
+
+    # Read the ``item`` slot directly, which does not build the tree.
+    with pytest.raises(AttributeError):
+        vocutil.cc.Item.item.__get__(item)
+
+    xml = item.to_qti()
+    tree = item.item
+
+    assert item.item is tree
+    assert item.mattext.text == "<p>Question?</p>"
+    assert item.to_xml() == xml
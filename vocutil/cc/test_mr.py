@@ -80,3 +80,26 @@ def test_mr_json_roundtrip():
 
     print(item.to_xml())
     assert item.to_json() == json.dumps(questions)
+
+
+def test_mr_xml_json_roundtrip():
+    """Should export JSON from a multiple response read from XML."""
+    questions = {
+        "type": "multiple response",
+        "question": "<p>This question has two correct answers.</p>",
+        "answers": [
+            {
+                "answer": "correct",
+                "correct": True,
+            },
+            {
+                "answer": "wrong",
+                "correct": False,
+            },
+        ],
+    }
+
+    item = vocutil.cc.MultipleResponse(questions["question"], questions["answers"])
+    xml_item = vocutil.cc.MultipleResponse.from_xml(item.to_xml())
+
+    assert xml_item.to_json() == json.dumps(questions)
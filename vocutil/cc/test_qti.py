@@ -0,0 +1,63 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""vocutil QTI serialization tests."""
+
+import pytest
+
+import vocutil
+from vocutil.cc import qti
+
+question = 'Is <b>"salt" & water</b>\ta mixture?\r\n'
+
+answers = [
+    {"answer": "<i>yes</i> & no", "correct": True},
+    {"answer": "", "correct": False},
+    {"answer": 'a "solution"', "correct": 1},
+]
+
+
+@pytest.mark.parametrize(
+    "item",
+    [
+        vocutil.cc.MultipleChoice(question, answers),
+        vocutil.cc.MultipleChoice("", []),
+        vocutil.cc.TrueFalse(question, True),
+        vocutil.cc.TrueFalse("", False),
+        vocutil.cc.FillInTheBlank(
+            question,
+            [{"answer": "salt & water"}, {"answer": "", "case": "Yes"}],
+            default_case="Yes",
+        ),
+        vocutil.cc.FillInTheBlank("", []),
+        vocutil.cc.MultipleResponse(question, answers),
+        vocutil.cc.MultipleResponse("", []),
+    ],
+)
+def test_to_qti_should_match_to_xml(item):
+    """Should serialize items exactly as the element tree does."""
+    assert item.to_qti() == item.to_xml()
+    assert item.to_qti(declaration=True) == item.to_xml(declaration=True)
+
+
+def test_escape_should_match_element_tree():
+    """Should escape text and attributes as the element tree does."""
+    assert (
+        qti.escape_text('<a href="x">\t&</a>') == '&lt;a href="x"&gt;\t&amp;&lt;/a&gt;'
+    )
+    assert qti.escape_attribute('<"\r\n\t&>') == "&lt;&quot;&#13;&#10;&#09;&amp;&gt;"
+
+
+def test_should_reject_unserializable_values():
+    """Should raise as the element tree does for non-string text."""
+    with pytest.raises(TypeError):
+        vocutil.cc.FillInTheBlank("question", [{"answer": "a", "case": None}]).to_qti()
@@ -0,0 +1,119 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""vocutil raw zip member tests."""
+
+import io
+import zipfile
+import zlib
+
+import pytest
+
+from vocutil.cc import zipcompat
+
+
+class Stream(io.RawIOBase):
+    """An unseekable binary stream."""
+
+    def __init__(self):
+        """Create the stream."""
+        self.buf = io.BytesIO()
+
+    def writable(self):
+        """Write only."""
+        return True
+
+    def write(self, data):
+        """Write ``data``."""
+        return self.buf.write(data)
+
+
+def _member(name, data, compression):
+    """Compress ``data`` as the member ``name``."""
+    zinfo = zipfile.ZipInfo(filename=name, date_time=(2024, 1, 1, 0, 0, 0))
+    zinfo.compress_type = compression
+    zinfo.file_size = len(data)
+    zinfo.CRC = zlib.crc32(data)
+    if compression == zipfile.ZIP_DEFLATED:
+        compressor = zlib.compressobj(9, zlib.DEFLATED, -15)
+        data = compressor.compress(data) + compressor.flush()
+    zinfo.compress_size = len(data)
+
+    return zinfo, data
+
+
+def _directory(name):
+    """Create the directory member ``name``."""
+    zinfo = zipfile.ZipInfo(filename=name, date_time=(2024, 1, 1, 0, 0, 0))
+    zinfo.external_attr = ((0o40000 | 0o777) & 0xFFFF) << 16 | 0x10
+    zinfo.file_size = 0
+    zinfo.compress_size = 0
+    zinfo.CRC = 0
+
+    return zinfo
+
+
+def _payloads():
+    """Create some member payloads."""
+    return {f"{i}/bank.xml": b"<questestinterop />" * (i + 1) for i in range(3)}
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+def test_write_member_should_write_to_stream(compression):
+    """Should write compressed members to an unseekable stream."""
+    stream = Stream()
+
+    with zipfile.ZipFile(stream, mode="w") as zip:
+        for name, data in _payloads().items():
+            zipcompat.mkdir(zip, _directory(f"{name.split('/')[0]}/"))
+            zinfo, compressed = _member(name, data, compression)
+            zipcompat.write_member(zip, zinfo, (compressed,))
+
+    with zipfile.ZipFile(stream.buf) as zip:
+        assert zip.testzip() is None
+        for name, data in _payloads().items():
+            assert zip.getinfo(name).compress_type == compression
+            assert zip.read(name) == data
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+def test_copy_member_should_copy_to_stream(compression):
+    """Should copy members, as compressed, to an unseekable stream."""
+    source = io.BytesIO()
+    with zipfile.ZipFile(source, mode="w", compression=compression) as zip:
+        for name, data in _payloads().items():
+            zip.writestr(name, data)
+    stream = Stream()
+
+    with zipfile.ZipFile(source) as src:
+        with zipfile.ZipFile(stream, mode="w") as zip:
+            zip.writestr("imsmanifest.xml", b"<manifest />")
+            for info in src.infolist():
+                zipcompat.copy_member(zip, src, info)
+        infos = {info.filename: info for info in src.infolist()}
+
+    with zipfile.ZipFile(stream.buf) as zip:
+        assert zip.testzip() is None
+        assert zip.read("imsmanifest.xml") == b"<manifest />"
+        for name, data in _payloads().items():
+            assert zip.getinfo(name).compress_size == infos[name].compress_size
+            assert zip.read(name) == data
+
+
+def test_write_member_should_refuse_open_handle():
+    """Should not write while a member is open for writing."""
+    zinfo, compressed = _member("bank.xml", b"<x />", zipfile.ZIP_STORED)
+
+    with zipfile.ZipFile(io.BytesIO(), mode="w") as zip:
+        with zip.open("open.xml", mode="w"):
+            with pytest.raises(ValueError):
+                zipcompat.write_member(zip, zinfo, (compressed,))
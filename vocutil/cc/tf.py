@@ -18,12 +18,37 @@ from xml.etree.ElementTree import SubElement as ETSubElement  # nosec B405
 
 import defusedxml.ElementTree as ET
 
+from . import qti
+from .ids import new_uuids
 from .item import Item
+from .registry import register
 
 
+@register
 class TrueFalse(Item):
     """A Common Cartridge true/false item."""
 
+    profile = "cc.true_false.v0p1"
+    json_type = "true/false"
+
+    # Element tree attributes, set by ``_build()``.
+    _elements = Item._elements + (
+        "itemmetadata",
+        "qtimetadata",
+        "qtimetadatafield",
+        "fieldlabel",
+        "fieldentry",
+        "presentation",
+        "material",
+        "mattext",
+        "response",
+        "choices",
+    )
+
+    # Slots for the item data and the element tree; ``item`` has its
+    # slot in ``Item``.
+    __slots__ = ("question", "answer") + _elements[1:]
+
     def __init__(self, question, answer, **kwargs):
         """Initialize a ``TrueFalse`` item.
 
@@ -42,6 +67,10 @@ class TrueFalse(Item):
         self.question = question
         self.answer = answer
 
+        return
+
+    def _build(self):
+        """Build the true/false element tree from the item data."""
         self.item = ETElement("item", ident=str(self.uuid))
         self.itemmetadata = ETSubElement(self.item, "itemmetadata")
         self.qtimetadata = ETSubElement(self.itemmetadata, "qtimetadata")
@@ -49,11 +78,11 @@ class TrueFalse(Item):
         self.fieldlabel = ETSubElement(self.qtimetadatafield, "fieldlabel")
         self.fieldlabel.text = "cc_profile"
         self.fieldentry = ETSubElement(self.qtimetadatafield, "fieldentry")
-        self.fieldentry.text = "cc.true_false.v0p1"
+        self.fieldentry.text = self.profile
         self.presentation = ETSubElement(self.item, "presentation")
         self.material = ETSubElement(self.presentation, "material")
         self.mattext = ETSubElement(self.material, "mattext", texttype="text/html")
-        self.mattext.text = question
+        self.mattext.text = self.question
 
         self.response = ETSubElement(
             self.presentation,
@@ -63,7 +92,7 @@ class TrueFalse(Item):
         )
         self.choices = ETSubElement(self.response, "render_choice")
 
-        correct = f"{self.uuid}-01" if answer else f"{self.uuid}-02"
+        correct = f"{self.uuid}-01" if self.answer else f"{self.uuid}-02"
 
         # True.
         ident = f"{self.uuid}-01"
@@ -104,6 +133,47 @@ class TrueFalse(Item):
 
         return
 
+    @classmethod
+    def many(cls, questions, answers, **kwargs):
+        """Create ``TrueFalse`` items from columns of data.
+
+        Create ``TrueFalse`` items from columns of data, with the
+        identifiers created in bulk.
+
+        Parameters
+        ----------
+        cls
+            The ``TrueFalse`` class.
+        questions : [str]
+            The HTML formatted question text of each item.
+        answers : [bool]
+            The Boolean answer of each item.
+        """
+        questions = list(questions)
+
+        return [
+            cls(question, answer, uuid=uuid, **kwargs)
+            for question, answer, uuid in zip(
+                questions, answers, new_uuids(len(questions))
+            )
+        ]
+
+    @classmethod
+    def from_dict(cls, data, **kwargs):
+        """Create a ``TrueFalse`` item from a dict.
+
+        Create a ``TrueFalse`` item from a dict of true/false data, as
+        created by ``to_dict()``.
+
+        Parameters
+        ----------
+        cls
+            The ``TrueFalse`` class.
+        data : dict
+            A dict containing true/false data.
+        """
+        return cls(data["question"], data["answer"], **kwargs)
+
     @classmethod
     def from_json(cls, item, **kwargs):
         """Create a ``TrueFalse`` item from JSON data.
@@ -117,25 +187,22 @@ class TrueFalse(Item):
         item : str
             A string containing true/false JSON data.
         """
-        data = json.loads(item)
-
-        return cls(data["question"], data["answer"], **kwargs)
+        return cls.from_dict(json.loads(item), **kwargs)
 
     @classmethod
-    def from_xml(cls, item, **kwargs):
-        """Create a ``TrueFalse`` item from XML data.
+    def from_element(cls, tree, **kwargs):
+        """Create a ``TrueFalse`` item from an XML element.
 
-        Create a ``TrueFalse`` item from XML data.
+        Create a ``TrueFalse`` item from a parsed IMSCC true/false
+        ``item`` element.
 
         Parameters
         ----------
         cls
             The ``TrueFalse`` class.
-        item : str
-            A string containing IMSCC true/false XML data.
+        tree : xml.etree.ElementTree.Element
+            An IMSCC true/false ``item`` element.
         """
-        tree = ET.fromstring(item)
-
         # Question text.
         q = tree.find("presentation").find("material").find("mattext").text
 
@@ -166,34 +233,32 @@ class TrueFalse(Item):
 
         return cls(q, a, **kwargs)
 
-    def to_json(self):
-        """Create a true/false JSON string from item data."""
-        # Correct answer.
-        correct = (
-            self.item.find("resprocessing")
-            .find("respcondition")
-            .find("conditionvar")
-            .find("varequal")
-            .text
-        )
+    @classmethod
+    def from_xml(cls, item, **kwargs):
+        """Create a ``TrueFalse`` item from XML data.
 
-        for ele in self.choices.findall("response_label"):
-            if correct == ele.get("ident"):
-                answer = (
-                    True
-                    if ele.find("material").find("mattext").text.lower() == "true"
-                    else False
-                )
+        Create a ``TrueFalse`` item from XML data.
 
-        return json.dumps(
-            {
-                "type": "true/false",
-                "question": str(
-                    self.item.find("presentation").find("material").find("mattext").text
-                ),
-                "answer": answer,
-            }
-        )
+        Parameters
+        ----------
+        cls
+            The ``TrueFalse`` class.
+        item : str
+            A string containing IMSCC true/false XML data.
+        """
+        return cls.from_element(ET.fromstring(item), **kwargs)
+
+    def to_dict(self):
+        """Create a true/false dict from item data."""
+        return {
+            "type": "true/false",
+            "question": str(self.question),
+            "answer": bool(self.answer),
+        }
+
+    def to_json(self):
+        """Create a true/false JSON string from item data."""
+        return json.dumps(self.to_dict())
 
     def to_xml(self, declaration=False):
         """Create a true/false XML string from item data."""
@@ -202,3 +267,15 @@ class TrueFalse(Item):
             encoding="unicode",
             xml_declaration=declaration,
         )
+
+    def to_qti(self, declaration=False):
+        """Create a true/false XML string from item fields.
+
+        The XML is written directly from the item fields with ``qti``
+        string templates rather than serialized from the element tree.
+        The output matches ``to_xml()``, in a fraction of the time, as
+        long as the element tree has not been modified.
+        """
+        xml = qti.true_false(self.uuid, self.question, self.answer)
+
+        return qti.declaration() + xml if declaration else xml
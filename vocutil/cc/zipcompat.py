@@ -0,0 +1,124 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""Raw zip member access.
+
+``zipfile`` only writes members it compresses itself.  These functions
+write already compressed members, and copy members between archives
+without recompression, through private ``zipfile.ZipFile`` attributes
+(``_lock``, ``_seekable``, ``_writing``, ``_writecheck()``,
+``_didModify``, and ``start_dir``) and the local file header layout
+(``structFileHeader``, ``sizeFileHeader``, ``_FH_FILENAME_LENGTH``,
+and ``_FH_EXTRA_FIELD_LENGTH``).  All other modules should use these
+functions rather than ``zipfile`` internals.
+
+Checked against the ``zipfile`` module of CPython 3.10, 3.11, 3.12,
+and 3.13.
+"""
+
+import os
+import struct
+import zipfile
+
+
+def mkdir(zip, zinfo):
+    """Create the directory member ``zinfo`` in ``zip``.
+
+    This is ``ZipFile.mkdir``, which is new in Python 3.11.
+    """
+    if hasattr(zip, "mkdir"):
+        zip.mkdir(zinfo)
+    else:
+        write_member(zip, zinfo, ())
+
+
+def write_member(zip, zinfo, chunks):
+    """Write already compressed data to ``zip`` as the member ``zinfo``.
+
+    This follows ``zipfile.ZipFile.writestr``, except the data is
+    written as is rather than compressed by ``zipfile``.  The sizes and
+    CRC-32 of ``zinfo`` must be set.
+
+    Parameters
+    ----------
+    zip : zipfile.ZipFile
+        The archive, open for writing.
+    zinfo : zipfile.ZipInfo
+        The member.
+    chunks : iterable
+        The compressed data of the member, as bytes.
+    """
+    if not zip.fp:
+        raise ValueError("Attempt to write to ZIP archive that was already closed")
+    if zip._writing:
+        raise ValueError(
+            "Can't write to ZIP archive while an open writing handle exists"
+        )
+
+    with zip._lock:
+        if zip._seekable:
+            zip.fp.seek(zip.start_dir)
+        zinfo.header_offset = zip.fp.tell()
+        zip._writecheck(zinfo)
+        zip._didModify = True
+
+        zip.fp.write(zinfo.FileHeader())
+        for chunk in chunks:
+            zip.fp.write(chunk)
+
+        zip.filelist.append(zinfo)
+        zip.NameToInfo[zinfo.filename] = zinfo
+        zip.start_dir = zip.fp.tell()
+
+
+def copy_member(zip, src, info):
+    """Copy the member ``info`` of ``src`` to ``zip`` without recompression.
+
+    Parameters
+    ----------
+    zip : zipfile.ZipFile
+        The archive, open for writing.
+    src : zipfile.ZipFile
+        The archive to copy from, open for reading.
+    info : zipfile.ZipInfo
+        The member of ``src``.
+    """
+    zinfo = zipfile.ZipInfo(filename=info.filename, date_time=info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.create_system = info.create_system
+    zinfo.external_attr = info.external_attr
+    zinfo.file_size = info.file_size
+    zinfo.compress_size = info.compress_size
+    zinfo.CRC = info.CRC
+
+    with src._lock:
+        src.fp.seek(info.header_offset)
+        header = struct.unpack(
+            zipfile.structFileHeader, src.fp.read(zipfile.sizeFileHeader)
+        )
+        src.fp.seek(
+            header[zipfile._FH_FILENAME_LENGTH]
+            + header[zipfile._FH_EXTRA_FIELD_LENGTH],
+            os.SEEK_CUR,
+        )
+
+        write_member(zip, zinfo, _read_chunks(src.fp, info.compress_size))
+
+
+def _read_chunks(f, size, chunk_size=1 << 20):
+    """Read ``size`` bytes from ``f`` in chunks."""
+    while size > 0:
+        chunk = f.read(min(chunk_size, size))
+        if not chunk:
+            raise zipfile.BadZipFile("Truncated zip member")
+        size -= len(chunk)
+        yield chunk
@@ -12,52 +12,113 @@
 
 """Create the boilerplate for a new unit."""
 
+import csv
+import json
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from jinja2 import Environment
+from jinja2 import FileSystemBytecodeCache
 from jinja2 import FileSystemLoader
 from jinja2 import TemplateNotFound
 
+_environments = {}
+_environments_lock = threading.Lock()
+
+
+def _bytecode_cache():
+    """Create the template bytecode cache.
+
+    Compiled templates are kept in ``jinja`` under ``VOCUTIL_CACHE_DIR``.
+    Without it, or if the directory cannot be created, templates are
+    compiled in memory only.
+    """
+    directory = os.environ.get("VOCUTIL_CACHE_DIR")
+    if not directory:
+        return None
+
+    directory = os.path.join(directory, "jinja")
+    try:
+        os.makedirs(directory, exist_ok=True)
+    except OSError:
+        return None
+
+    return FileSystemBytecodeCache(directory)
+
+
+def get_environment(latex=False):
+    """Get the Jinja environment for the ``templates`` directory.
+
+    One environment is created per delimiter style and shared by all
+    later calls, so each template is compiled at most once per
+    process and, with ``VOCUTIL_CACHE_DIR`` set, once across processes.
+
+    Parameters
+    ----------
+    latex : bool, optional
+        Use LaTeX friendly delimiters.
+    """
+    with _environments_lock:
+        try:
+            return _environments[latex]
+        except KeyError:
+            pass
+
+        if latex:
+            jinja = Environment(
+                loader=FileSystemLoader("templates"),
+                bytecode_cache=_bytecode_cache(),
+                block_start_string=r"\BLOCK{",
+                block_end_string="}",
+                variable_start_string=r"\VAR{",
+                variable_end_string="}",
+                comment_start_string=r"\#{",
+                comment_end_string="}",
+                line_statement_prefix="%%",
+                line_comment_prefix="%#",
+                trim_blocks=True,
+                autoescape=True,
+                keep_trailing_newline=True,
+            )
+        else:
+            jinja = Environment(
+                loader=FileSystemLoader("templates"),
+                bytecode_cache=_bytecode_cache(),
+                trim_blocks=True,
+                autoescape=True,
+                keep_trailing_newline=True,
+            )
+
+        _environments[latex] = jinja
+
+        return jinja
+
 
 def _maybe_write_file_from_template(template, path, data, latex=False):
-    """Write a file if it does not exist."""
-    if latex:
-        jinja = Environment(
-            loader=FileSystemLoader("templates"),
-            block_start_string=r"\BLOCK{",
-            block_end_string="}",
-            variable_start_string=r"\VAR{",
-            variable_end_string="}",
-            comment_start_string=r"\#{",
-            comment_end_string="}",
-            line_statement_prefix="%%",
-            line_comment_prefix="%#",
-            trim_blocks=True,
-            autoescape=True,
-            keep_trailing_newline=True,
-        )
-    else:
-        jinja = Environment(
-            loader=FileSystemLoader("templates"),
-            trim_blocks=True,
-            autoescape=True,
-            keep_trailing_newline=True,
-        )
+    """Write a file if it does not exist.
+
+    Returns ``True`` if the file was written and ``False`` if it was
+    skipped.
+    """
+    jinja = get_environment(latex=latex)
 
     try:
         template = jinja.get_template(template)
     except TemplateNotFound:
         print(f"no template found for file {str(path)}, skipping...")
-        return
+        return False
 
     try:
         with open(path, "x") as f:
             f.write(template.render(data))
     except FileExistsError:
         print(f"boilerplate file {str(path)} exists, skipping...")
-        pass
+        return False
+
+    return True
 
 
 def maybe_create_directories(dest, unit, prefix):  # dead: disable
@@ -69,71 +130,102 @@ def maybe_create_directories(dest, unit, prefix):  # dead: disable
         dest / "sources" / "used",
     ]
 
+    created = []
     for dir in dirs:
         try:
             os.makedirs(dir)
         except FileExistsError:
             print(f"boilerplate directory {dir} exists, skipping...")
+            created.append(False)
         except OSError:
             print(f"problem creating boilerplate directory {dir}")
             sys.exit(1)
+        else:
+            created.append(True)
+
+    return created
 
 
 def maybe_create_makefile(dest, unit, prefix):
     """Create a makefile for the unit if necessary."""
-    _maybe_write_file_from_template(
-        "Makefile", dest / "Makefile", {"unit": unit, "prefix": prefix}, latex=False
-    )
+    return [
+        _maybe_write_file_from_template(
+            "Makefile", dest / "Makefile", {"unit": unit, "prefix": prefix}, latex=False
+        )
+    ]
 
 
 def maybe_create_cartridge_generator(dest, unit, prefix):
     """Create a cartridge generator for the unit if necessary."""
-    _maybe_write_file_from_template(
-        "cartridge.py",
-        dest / f"{prefix}-cartridge.py",
-        {
-            "unit": unit,
-            "prefix": prefix,
-            "chapter": str(dest).split("-")[0].lstrip("0"),
-        },
-        latex=False,
-    )
+    return [
+        _maybe_write_file_from_template(
+            "cartridge.py",
+            dest / f"{prefix}-cartridge.py",
+            {
+                "unit": unit,
+                "prefix": prefix,
+                "chapter": str(dest).split("-")[0].lstrip("0"),
+            },
+            latex=False,
+        )
+    ]
 
 
 def maybe_create_notes(dest, unit, prefix):
     """Create an empty notes presentation for the unit if necessary."""
-    _maybe_write_file_from_template(
-        "slides.tex",
-        dest / f"{prefix}-slides.tex",
-        {"unit": unit, "prefix": prefix},
-        latex=True,
-    )
+    return [
+        _maybe_write_file_from_template(
+            "slides.tex",
+            dest / f"{prefix}-slides.tex",
+            {"unit": unit, "prefix": prefix},
+            latex=True,
+        )
+    ]
 
 
 def maybe_create_bibliographic_database(dest, unit, prefix):
     """Create a bibliographic database if necessary."""
-    _maybe_write_file_from_template(
-        "slides.bib",
-        dest / f"{prefix}.bib",
-        {"unit": unit, "prefix": prefix},
-        latex=False,
-    )
+    return [
+        _maybe_write_file_from_template(
+            "slides.bib",
+            dest / f"{prefix}.bib",
+            {"unit": unit, "prefix": prefix},
+            latex=False,
+        )
+    ]
 
 
 def maybe_create_glossary(dest, unit, prefix):
     """Create an empty glossary if necessary."""
-    _maybe_write_file_from_template(
-        "glossary.json",
-        dest / "glossary.json",
-        {"unit": unit, "prefix": prefix},
-        latex=False,
-    )
-    _maybe_write_file_from_template(
-        "cumulative.json",
-        dest / "cumulative.json",
-        {"unit": unit, "prefix": prefix},
-        latex=False,
-    )
+    return [
+        _maybe_write_file_from_template(
+            "glossary.json",
+            dest / "glossary.json",
+            {"unit": unit, "prefix": prefix},
+            latex=False,
+        ),
+        _maybe_write_file_from_template(
+            "cumulative.json",
+            dest / "cumulative.json",
+            {"unit": unit, "prefix": prefix},
+            latex=False,
+        ),
+    ]
+
+
+def _create_unit(dest, unit, prefix):
+    """Create the boilerplate for a unit.
+
+    Returns a list of whether each directory and file was created.
+    """
+    return [
+        *maybe_create_directories(dest, unit, prefix),
+        *maybe_create_makefile(dest, unit, prefix),
+        *maybe_create_notes(dest, unit, prefix),
+        *maybe_create_cartridge_generator(dest, unit, prefix),
+        *maybe_create_bibliographic_database(dest, unit, prefix),
+        *maybe_create_glossary(dest, unit, prefix),
+    ]
 
 
 def create_unit():
@@ -156,9 +248,62 @@ def create_unit():
         print("provide a unit prefix", file=sys.stderr)
         sys.exit(1)
 
-    maybe_create_directories(dest, unit, prefix)
-    maybe_create_makefile(dest, unit, prefix)
-    maybe_create_notes(dest, unit, prefix)
-    maybe_create_cartridge_generator(dest, unit, prefix)
-    maybe_create_bibliographic_database(dest, unit, prefix)
-    maybe_create_glossary(dest, unit, prefix)
+    _create_unit(dest, unit, prefix)
+
+
+def _load_course_plan(fn):
+    """Load a course plan.
+
+    A course plan is a JSON list of objects or CSV rows, each with the
+    ``dest``, ``unit``, and ``prefix`` of a unit.  A CSV header row
+    naming those columns is skipped.
+
+    Returns
+    -------
+    [(Path, str, str)]
+        The directory, name, and prefix of each unit.
+    """
+    with open(fn, "r", newline="") as f:
+        if f.read(1024).lstrip().startswith("["):
+            f.seek(0)
+            return [
+                (Path(unit["dest"]), unit["unit"], unit["prefix"])
+                for unit in json.load(f)
+            ]
+
+        f.seek(0)
+        return [
+            (Path(row[0]), row[1], row[2])
+            for row in csv.reader(f)
+            if row and row[:3] != ["dest", "unit", "prefix"]
+        ]
+
+
+def create_units():
+    """Orchestrate creation of the boilerplate for a course.
+
+    Create every unit of a course plan in one process, sharing the
+    template environments and creating the units concurrently in a
+    thread pool.
+    """
+    try:
+        fn = sys.argv[1]
+    except IndexError:
+        print("provide a course plan file", file=sys.stderr)
+        sys.exit(1)
+
+    try:
+        plan = _load_course_plan(fn)
+    except (OSError, ValueError, KeyError, IndexError, csv.Error) as e:
+        print(f"unable to read course plan: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    with ThreadPoolExecutor() as pool:
+        results = list(pool.map(lambda unit: _create_unit(*unit), plan))
+
+    created = sum(sum(result) for result in results)
+    skipped = sum(len(result) for result in results) - created
+
+    print(
+        f"{len(plan)} units: created {created} files and directories, skipped {skipped}"
+    )
@@ -12,36 +12,312 @@
 
 """Combine glossary and course data."""
 
+import argparse
+import contextlib
+import hashlib
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from itertools import repeat
 
+from . import __version__
+from .load import iter_glossary
 from .load import load_glossary
+from .write import _GlossaryWriter
+from .write import _replace_file
+from .write import write_glossary
 
 
-def enrich():
-    """Combine glossary and course data."""
-    chapter = int(sys.argv[1])
-    data = load_glossary(sys.argv[2])
-    glossary_fns = sys.argv[3:]
-
-    for fn in glossary_fns:
-        gl = load_glossary(fn)
-        for entry in gl["glossary"]:
-            data["glossary"].append(
-                {
-                    "word": entry["word"] if "word" in entry else "",
-                    "definition": entry["definition"] if "definition" in entry else "",
-                    "chapter": (
-                        str(entry["chapter"])
-                        if "chapter" in entry and entry["chapter"]
-                        else str(chapter)
-                    ),
-                    "section": (
-                        str(entry["section"])
-                        if "section" in entry and entry["section"]
-                        else ""
-                    ),
-                }
+def _normalize_entry(entry, chapter):
+    """Normalize a chapter glossary entry."""
+    return {
+        "word": entry["word"] if "word" in entry else "",
+        "definition": entry["definition"] if "definition" in entry else "",
+        "chapter": (
+            str(entry["chapter"])
+            if "chapter" in entry and entry["chapter"]
+            else str(chapter)
+        ),
+        "section": (
+            str(entry["section"]) if "section" in entry and entry["section"] else ""
+        ),
+    }
+
+
+def _load_chapter_glossary(fn, chapter):
+    """Load and normalize the entries of a chapter glossary."""
+    return [_normalize_entry(entry, chapter) for entry in load_glossary(fn)["glossary"]]
+
+
+def _iter_chapter_glossaries(fns, chapter, jobs=1):
+    """Load and normalize chapter glossaries.
+
+    Yield the normalized entries of each glossary in ``fns``, in
+    order.  With more than one job, the glossaries are parsed
+    concurrently in a process pool and each is yielded as soon as it
+    and all of its predecessors are ready.
+
+    Parameters
+    ----------
+    fns : [str]
+        The chapter glossary filenames.
+    chapter : int
+        The default chapter of the entries.
+    jobs : int, optional
+        The number of worker processes; a number less than one uses
+        all available processors.
+    """
+    if jobs == 1 or len(fns) < 2:
+        for fn in fns:
+            yield _load_chapter_glossary(fn, chapter)
+        return
+
+    with ProcessPoolExecutor(max_workers=jobs if jobs > 0 else None) as pool:
+        yield from pool.map(_load_chapter_glossary, fns, repeat(chapter))
+
+
+def _parse_args(argv=None):
+    """Parse the ``enrich`` command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="enrich",
+        description="Combine glossary and course data.",
+    )
+    parser.add_argument(
+        "chapter",
+        type=int,
+        help="default chapter of the added glossary entries",
+    )
+    parser.add_argument(
+        "glossary",
+        help="glossary with the course and book data",
+    )
+    parser.add_argument(
+        "glossaries",
+        nargs="*",
+        help="chapter glossaries to add",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of glossaries to parse concurrently (0 for all processors)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        help="file to write the combined glossary to instead of standard output",
+    )
+    parser.add_argument(
+        "-c",
+        "--compact",
+        action="store_true",
+        help="write compact JSON without indentation",
+    )
+    parser.add_argument(
+        "-i",
+        "--incremental",
+        action="store_true",
+        help="only parse glossaries changed since the output was last written",
+    )
+
+    args = parser.parse_args(argv)
+    if args.incremental and not args.output:
+        parser.error("--incremental requires --output")
+
+    return args
+
+
+def _hash_file(fn):
+    """Get the SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(fn, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def _read_manifest(fn):
+    """Read an ``enrich`` manifest, if it exists."""
+    try:
+        with open(fn, "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _plan_update(manifest, inputs, chapter, indent, output):
+    """Match inputs with unchanged inputs of the previous build.
+
+    Returns the previous record of each input, or ``None`` if the
+    input is new or changed, along with the previous course and book
+    data.  Nothing matches if the previous output was built
+    differently or has been modified since.
+    """
+    plan = [None] * len(inputs)
+
+    try:
+        st = os.stat(output)
+        usable = (
+            manifest["version"] == __version__
+            and manifest["chapter"] == chapter
+            and manifest["indent"] == indent
+            and manifest["output"] == [st.st_mtime_ns, st.st_size]
+        )
+        previous = manifest["inputs"]
+    except (OSError, KeyError, TypeError):
+        return plan, None
+
+    if not usable or not previous:
+        return plan, None
+
+    # The course glossary can only match the course glossary.
+    course = {(previous[0]["path"], previous[0]["sha256"]): previous[0]}
+    chapters = {(prev["path"], prev["sha256"]): prev for prev in previous[1:]}
+
+    for i, inp in enumerate(inputs):
+        plan[i] = (chapters if i else course).get((inp["path"], inp["sha256"]))
+
+    return plan, manifest["header"]
+
+
+class _ByteWriter:
+    """Write text as UTF-8 to a binary file, tracking the position."""
+
+    def __init__(self, f):
+        """Initialize a byte writer."""
+        self.f = f
+        self.pos = 0
+
+    def write(self, data):
+        """Write text or bytes."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        self.f.write(data)
+        self.pos += len(data)
+
+
+def _copy_range(src, dest, start, end, size=1 << 20):
+    """Copy the bytes from ``start`` to ``end`` of ``src`` to ``dest``."""
+    src.seek(start)
+    remaining = end - start
+    while remaining > 0:
+        chunk = src.read(min(size, remaining))
+        if not chunk:
+            break
+        dest.write(chunk)
+        remaining -= len(chunk)
+
+
+def _enrich_incremental(args, indent):
+    """Combine glossary and course data, reusing unchanged entries.
+
+    A manifest of the inputs, their SHA-256 digests, and the byte
+    range of their entries in the output is kept next to the output.
+    The entries of unchanged inputs are copied verbatim from the
+    previous output and only new or changed inputs are parsed.
+    """
+    manifest_fn = f"{args.output}.manifest.json"
+    inputs = [
+        {"path": fn, "sha256": _hash_file(fn)}
+        for fn in (args.glossary, *args.glossaries)
+    ]
+    plan, header = _plan_update(
+        _read_manifest(manifest_fn), inputs, args.chapter, indent, args.output
+    )
+    changed = [inp["path"] for inp, prev in zip(inputs[1:], plan[1:]) if prev is None]
+
+    with contextlib.ExitStack() as stack:
+        old = base = None
+        if any(prev is not None for prev in plan):
+            old = stack.enter_context(open(args.output, "rb"))
+        if plan[0] is None:
+            base = stack.enter_context(iter_glossary(args.glossary))
+            header = base.header
+        loaded = stack.enter_context(
+            contextlib.closing(
+                _iter_chapter_glossaries(changed, args.chapter, args.jobs)
             )
+        )
+
+        with _replace_file(args.output, mode="wb") as f:
+            out = _ByteWriter(f)
+            writer = _GlossaryWriter(out, indent=indent)
+            writer.write_header(header)
+
+            for i, (inp, prev) in enumerate(zip(inputs, plan)):
+                inp["count"] = 0
+                inp["start"] = inp["end"] = out.pos
+
+                if prev is not None:
+                    if prev["count"]:
+                        writer.write_separator()
+                        inp["start"] = out.pos
+                        _copy_range(old, out, prev["start"], prev["end"])
+                        inp["count"] = prev["count"]
+                        inp["end"] = out.pos
+                    continue
+
+                for entry in base if i == 0 else next(loaded):
+                    writer.write_separator()
+                    if not inp["count"]:
+                        inp["start"] = out.pos
+                    out.write(writer.encode_entry(entry))
+                    inp["count"] += 1
+                inp["end"] = out.pos
+
+            writer.write_footer()
+            out.write("\n")
+
+    st = os.stat(args.output)
+    with _replace_file(manifest_fn) as f:
+        json.dump(
+            {
+                "version": __version__,
+                "chapter": args.chapter,
+                "indent": indent,
+                "header": header,
+                "output": [st.st_mtime_ns, st.st_size],
+                "inputs": inputs,
+            },
+            f,
+            indent=2,
+        )
+
+
+def _write_output(fn, header, entries, indent):
+    """Write a combined glossary to a file or standard output."""
+    if fn:
+        with _replace_file(fn) as f:
+            write_glossary(f, header, entries, indent=indent)
+            f.write("\n")
+    else:
+        write_glossary(sys.stdout, header, entries, indent=indent)
+        sys.stdout.write("\n")
+
+
+def enrich(argv=None):
+    """Combine glossary and course data.
+
+    The combined glossary is written as it is produced: the course
+    and book data, the entries of the course glossary, and then the
+    entries of each chapter glossary in order.
+    """
+    args = _parse_args(argv)
+    indent = None if args.compact else 2
+
+    if args.incremental:
+        _enrich_incremental(args, indent)
+        return
 
-    print(json.dumps(data, indent=2))
+    with iter_glossary(args.glossary) as base:
+        entries = chain(
+            base,
+            chain.from_iterable(
+                _iter_chapter_glossaries(args.glossaries, args.chapter, args.jobs)
+            ),
+        )
+        _write_output(args.output, base.header, entries, indent)
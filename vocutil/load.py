@@ -14,37 +14,68 @@
 
 import csv
 import json
-import sys
+import os
+import re
 
+from .cache import GlossaryCache
+from .cache import default_cache
 from .exceptions import VocutilError
 
 
-def load_glossary(fn):
+def load_glossary(fn, format=None, cache=None):
     """Load a glossary.
 
-    Load a glossary in vocutil JSON or word/definition CSV/TSV.
+    Load a glossary in vocutil JSON or word/definition CSV/TSV.  The
+    format is taken from ``format``, the file extension, or the
+    leading data of the file, in that order.
 
     fn : str
         The filename containing the glossary data.
+    format : str, optional
+        The glossary format, one of ``"json"``, ``"csv"``, or
+        ``"tsv"``.
+    cache : GlossaryCache or None or False, optional
+        The cache of cleaned glossaries to use.  Defaults to the cache
+        configured by ``VOCUTIL_CACHE_DIR``, if any; ``False``
+        disables caching.
+
+    Raises
+    ------
+    VocutilError
+        Raises if the format is unknown or the data cannot be parsed.
+    TypeError
+        Raises if ``cache`` is not a ``GlossaryCache``, ``None``, or
+        ``False``.
     """
-    try:
-        return _load_glossary_json(fn)
-    except json.JSONDecodeError as e:
-        print(f"file: {fn} error: {e}", file=sys.stderr)
-        pass
+    if cache is None:
+        cache = default_cache()
+    elif cache is not False and not isinstance(cache, GlossaryCache):
+        raise TypeError(f"cache must be a GlossaryCache, None, or False, not {cache!r}")
 
-    try:
-        return _load_glossary_csv(fn)
-    except csv.Error:
-        raise VocutilError("Unable to parse glossary data.")
+    if not cache:
+        return _load_glossary(fn, format)
 
+    return cache.load(fn, _load_glossary, format)
 
-def _clean_glossary(data):
-    """Clean a glossary."""
+
+def _load_glossary(fn, format=None):
+    """Load a glossary without caching."""
+    with open(fn, "r") as f:
+        format = _detect_glossary_format(fn, f, format)
+
+        try:
+            if format == "json":
+                return _parse_glossary_json(f)
+            return _parse_glossary_csv(f, format)
+        except (json.JSONDecodeError, csv.Error) as e:
+            raise VocutilError(f"Unable to parse glossary data in {fn}: {e}") from e
+
+
+def _clean_header(data):
+    """Clean the course and book data of a glossary."""
     cleaned = {
         "course": {},
         "book": {},
-        "glossary": [],
     }
 
     # Course data.
@@ -64,22 +95,35 @@ def _clean_glossary(data):
         except KeyError:
             cleaned["book"][entry] = ""
 
+    return cleaned
+
+
+def _clean_entry(gloss):
+    """Clean a single glossary entry."""
+    obj = {}
+    for entry in (
+        "word",
+        "definition",
+        "chapter",
+        "section",
+    ):
+        try:
+            obj[entry] = gloss[entry]
+        except KeyError:
+            obj[entry] = ""
+
+    return obj
+
+
+def _clean_glossary(data):
+    """Clean a glossary."""
+    cleaned = _clean_header(data)
+    cleaned["glossary"] = []
+
     # Glossary data.
     if "glossary" in data:
         for gloss in data["glossary"]:
-            obj = {}
-            for entry in (
-                "word",
-                "definition",
-                "chapter",
-                "section",
-            ):
-                try:
-                    obj[entry] = gloss[entry]
-                except KeyError:
-                    obj[entry] = ""
-
-            cleaned["glossary"].append(obj)
+            cleaned["glossary"].append(_clean_entry(gloss))
 
     return cleaned
 
@@ -87,32 +131,393 @@ def _clean_glossary(data):
 def _load_glossary_json(file):
     """Load a glossary."""
     with open(file, "r") as f:
-        data = json.load(f)
-
-    return _clean_glossary(data)
+        return _parse_glossary_json(f)
 
 
 def _load_glossary_csv(fn):
     """Load a glossary in CSV."""
     with open(fn, "r") as f:
-        # Detect CSV dialect and reset file object.
-        sniffer = csv.Sniffer()
-        dialect = sniffer.sniff(f.readline())
-        f.seek(0)
+        return _parse_glossary_csv(f)
 
-        # Read CSV file and populate glossary.
-        reader = csv.reader(f, dialect)
 
-        data = {
-            "glossary": [],
-        }
+def _parse_glossary_json(f):
+    """Parse a glossary from a JSON file object."""
+    return _clean_glossary(json.load(f))
 
-        for row in reader:
-            data["glossary"].append(
-                {
-                    "word": row[0],
-                    "definition": row[1],
-                }
-            )
+
+def _parse_glossary_csv(f, format=None):
+    """Parse a glossary from a CSV file object."""
+    data = {
+        "glossary": list(_iter_glossary_csv(f, format)),
+    }
 
     return _clean_glossary(data)
+
+
+def iter_glossary(fn, format=None):
+    """Iterate over a glossary.
+
+    Iterate over a glossary in vocutil JSON or word/definition CSV/TSV
+    without loading the whole file.  Entries are parsed and cleaned
+    one at a time.
+
+    fn : str
+        The filename containing the glossary data.
+    format : str, optional
+        The glossary format, as for ``load_glossary()``.
+
+    Returns
+    -------
+    GlossaryIterator
+        An iterator over the cleaned glossary entries, which also
+        provides the glossary course and book data.
+    """
+    return GlossaryIterator(fn, format=format)
+
+
+class GlossaryIterator:
+    """An iterator over the entries of a glossary file.
+
+    The glossary file is parsed incrementally, so only the course and
+    book data and the current entry are held in memory.  The iterator
+    may only be consumed once.  Use as a context manager or exhaust
+    the iterator to close the underlying file.
+
+    Parameters
+    ----------
+    fn : str
+        The filename containing the glossary data.
+    format : str, optional
+        The glossary format, as for ``load_glossary()``.
+
+    Raises
+    ------
+    VocutilError
+        Raises if the format is unknown or the data cannot be parsed,
+        when created or while iterating.
+    """
+
+    def __init__(self, fn, format=None):
+        """Initialize a glossary iterator."""
+        self.fn = fn
+        self._header = {}
+        self._complete = False
+        self._pending = None
+        self._file = open(fn, "r")
+
+        try:
+            format = _detect_glossary_format(fn, self._file, format)
+            if format == "json":
+                self._entries = _iter_glossary_json(self._file, self._header)
+            else:
+                self._entries = _iter_glossary_csv(self._file, format)
+                self._complete = True
+
+            # Read through the data preceding the first entry, which
+            # is normally the course and book data.
+            self._pending = next(self._entries, None)
+        except (json.JSONDecodeError, csv.Error) as e:
+            self.close()
+            raise VocutilError(f"Unable to parse glossary data in {fn}: {e}") from e
+        except Exception:
+            self.close()
+            raise
+
+        # Without entries, the whole file has been parsed.
+        if self._pending is None:
+            self._complete = True
+            self.close()
+
+        return
+
+    def __enter__(self):
+        """Enter the runtime context."""
+        return self
+
+    def __exit__(self, *args):
+        """Exit the runtime context, closing the file."""
+        self.close()
+
+    def __iter__(self):
+        """Iterate over the cleaned glossary entries."""
+        if self._pending is None:
+            return
+
+        entry, self._pending = self._pending, None
+
+        try:
+            yield _clean_entry(entry)
+            for entry in self._entries:
+                yield _clean_entry(entry)
+            self._complete = True
+        except (json.JSONDecodeError, csv.Error) as e:
+            raise VocutilError(
+                f"Unable to parse glossary data in {self.fn}: {e}"
+            ) from e
+        finally:
+            self.close()
+
+    @property
+    def header(self):
+        """Get the cleaned course and book data of the glossary.
+
+        Missing course or book data may follow the glossary entries in
+        the file.  If the entries have not been consumed yet, the file
+        is scanned separately for it, skipping over the entries
+        without decoding them.
+        """
+        if not self._complete and not (
+            "course" in self._header and "book" in self._header
+        ):
+            header = {}
+            try:
+                with open(self.fn, "r") as f:
+                    _scan_glossary_header(f, header)
+            except json.JSONDecodeError as e:
+                raise VocutilError(
+                    f"Unable to parse glossary data in {self.fn}: {e}"
+                ) from e
+            self._header = header
+            self._complete = True
+
+        return _clean_header(self._header)
+
+    def close(self):
+        """Close the glossary file."""
+        self._pending = None
+        self._file.close()
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_UNQUOTED = re.compile(r'[^"\[\]{}]*')
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+
+_FORMATS = {
+    "json": "json",
+    "csv": "csv",
+    "tsv": "tsv",
+}
+
+# The dialect of ``.csv`` files varies, so it is detected.
+_EXTENSIONS = {
+    ".json": "json",
+    ".csv": None,
+    ".tsv": "tsv",
+}
+
+_DIALECTS = {
+    "csv": csv.excel,
+    "tsv": csv.excel_tab,
+}
+
+
+def _detect_glossary_format(fn, f, format=None):
+    """Determine the format of glossary data.
+
+    Use the explicit ``format`` if given, then the extension of
+    ``fn``, and finally the leading data of ``f``.  Returns
+    ``"json"``, ``"csv"``, ``"tsv"``, or ``None`` for delimited data
+    of unknown dialect.
+    """
+    if format is not None:
+        try:
+            return _FORMATS[format.lower()]
+        except KeyError:
+            raise VocutilError(f"Unknown glossary format: {format}")
+
+    try:
+        return _EXTENSIONS[os.path.splitext(str(fn))[1].lower()]
+    except KeyError:
+        return _sniff_glossary_format(f)
+
+
+def _sniff_glossary_format(f):
+    """Guess the format of glossary data from its first character."""
+    start = f.read(1024).lstrip()
+    f.seek(0)
+
+    return "json" if start.startswith("{") else None
+
+
+class _JSONStream:
+    """Incrementally decode JSON values from a text file."""
+
+    def __init__(self, f, size=65536):
+        """Initialize a JSON stream."""
+        self.f = f
+        self.size = size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        """Read the next chunk of data, dropping consumed data."""
+        chunk = self.f.read(self.size)
+        if not chunk:
+            self.eof = True
+            return False
+
+        self.buf = self.buf[self.pos :] + chunk
+        self.pos = 0
+
+        return True
+
+    def peek(self):
+        """Get the next non-whitespace character without consuming it."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, chars):
+        """Consume the next character, which must be one of ``chars``."""
+        char = self.peek()
+        if not char or char not in chars:
+            raise json.JSONDecodeError(
+                f"Expecting one of {chars!r}", self.buf, self.pos
+            )
+        self.pos += 1
+
+        return char
+
+    def skip(self):
+        """Skip the next complete JSON value without decoding it."""
+        if self.peek() not in ("[", "{"):
+            self.decode()
+            return
+
+        depth = 0
+        while True:
+            self.pos = _UNQUOTED.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf) and self.buf[self.pos] == '"':
+                match = _STRING.match(self.buf, self.pos)
+                if match:
+                    self.pos = match.end()
+                    continue
+            elif self.pos < len(self.buf):
+                depth += 1 if self.buf[self.pos] in "[{" else -1
+                self.pos += 1
+                if depth == 0:
+                    return
+                continue
+
+            # The value, or a string in it, continues past the buffer.
+            if not self._fill():
+                raise json.JSONDecodeError("Unterminated value", self.buf, self.pos)
+
+    def decode(self):
+        """Decode the next complete JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+
+            # A value ending the buffer may be a truncated number.
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+
+            self.pos = end
+
+            return value
+
+
+def _iter_glossary_json(f, header):
+    """Incrementally parse vocutil JSON glossary data.
+
+    Yield the raw glossary entries one at a time, storing the course
+    and book data in ``header`` as they are encountered.
+    """
+    stream = _JSONStream(f)
+
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+
+    while True:
+        key = stream.decode()
+        stream.expect(":")
+
+        if key == "glossary" and stream.peek() == "[":
+            stream.expect("[")
+            if stream.peek() == "]":
+                stream.expect("]")
+            else:
+                while True:
+                    yield stream.decode()
+                    if stream.expect(",]") == "]":
+                        break
+        else:
+            value = stream.decode()
+            if key in ("course", "book"):
+                header[key] = value
+
+        if stream.expect(",}") == "}":
+            return
+
+
+def _scan_glossary_header(f, header):
+    """Scan vocutil JSON glossary data for the course and book data.
+
+    Store the course and book data in ``header``, skipping over the
+    other values, and stop once both have been found.
+    """
+    stream = _JSONStream(f)
+
+    stream.expect("{")
+    if stream.peek() == "}":
+        return
+
+    while True:
+        key = stream.decode()
+        stream.expect(":")
+
+        if key in ("course", "book"):
+            header[key] = stream.decode()
+            if "course" in header and "book" in header:
+                return
+        else:
+            stream.skip()
+
+        if stream.expect(",}") == "}":
+            return
+
+
+def _iter_glossary_csv(f, format=None):
+    """Parse CSV glossary data row by row.
+
+    The dialect is that of ``format``, ``"csv"`` or ``"tsv"``, or is
+    detected from the first line if the format is unknown.
+
+    Raises
+    ------
+    VocutilError
+        Raises on a row without a word and definition.
+    """
+    if format in _DIALECTS:
+        dialect = _DIALECTS[format]
+    else:
+        # Detect CSV dialect and reset file object.
+        sniffer = csv.Sniffer()
+        dialect = sniffer.sniff(f.readline())
+        f.seek(0)
+
+    reader = csv.reader(f, dialect)
+    for row in reader:
+        try:
+            yield {
+                "word": row[0],
+                "definition": row[1],
+            }
+        except IndexError:
+            raise VocutilError(
+                f"Glossary row {reader.line_num} of {getattr(f, 'name', f)}"
+                " needs a word and a definition"
+            ) from None
@@ -0,0 +1,133 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""vocutil glossary cache tests."""
+
+import json
+import os
+
+import pytest
+
+import vocutil
+
+glossary = {
+    "course": {
+        "title": "Course A",
+    },
+    "book": {
+        "title": "A Textbook",
+        "author": "J Gray",
+    },
+    "glossary": [
+        {
+            "word": "test",
+            "definition": "a test",
+            "chapter": 1,
+            "section": 1,
+        },
+    ],
+}
+
+
+def _fail(fn, format):
+    """Fail to load a glossary."""
+    raise AssertionError("glossary should be loaded from the cache")
+
+
+def test_cache_should_load_warm_glossary(tmp_path):
+    """Should load a glossary from the cache once warm."""
+    fn = tmp_path / "glossary.json"
+    fn.write_text(json.dumps(glossary))
+    cache = vocutil.GlossaryCache(tmp_path / "cache")
+
+    cold = vocutil.load_glossary(fn, cache=cache)
+    warm = cache.load(fn, _fail)
+
+    assert cold == glossary
+    assert warm == glossary
+    assert warm is not cold
+
+
+def test_cache_should_miss_modified_glossary(tmp_path):
+    """Should reload a glossary after it changes."""
+    fn = tmp_path / "glossary.json"
+    fn.write_text(json.dumps(glossary))
+    cache = vocutil.GlossaryCache(tmp_path / "cache")
+    vocutil.load_glossary(fn, cache=cache)
+
+    fn.write_text(json.dumps({"glossary": [{"word": "quiz"}]}))
+    os.utime(fn, ns=(0, 0))
+
+    actual = vocutil.load_glossary(fn, cache=cache)
+
+    assert actual["glossary"][0]["word"] == "quiz"
+
+
+def test_cache_should_use_environment(tmp_path, monkeypatch):
+    """Should use the cache directory from the environment."""
+    fn = tmp_path / "glossary.json"
+    fn.write_text(json.dumps(glossary))
+    monkeypatch.setenv("VOCUTIL_CACHE_DIR", str(tmp_path / "cache"))
+
+    vocutil.load_glossary(fn)
+
+    assert len(os.listdir(tmp_path / "cache")) == 1
+
+
+def test_cache_should_be_disabled_without_environment(tmp_path, monkeypatch):
+    """Should not cache without a configured directory."""
+    monkeypatch.delenv("VOCUTIL_CACHE_DIR", raising=False)
+
+    assert vocutil.cache.default_cache() is None
+
+
+@pytest.mark.parametrize("cache", [True, "cache"])
+def test_cache_should_reject_other_values(tmp_path, cache):
+    """Should only accept a cache, ``None``, or ``False``."""
+    fn = tmp_path / "glossary.json"
+    fn.write_text(json.dumps(glossary))
+
+    with pytest.raises(TypeError):
+        vocutil.load_glossary(fn, cache=cache)
+
+
+def test_cache_should_evict_least_recently_used(tmp_path):
+    """Should evict the least recently used entries over the size limit."""
+    cache = vocutil.GlossaryCache(tmp_path / "cache")
+    paths = []
+    for i in range(3):
+        fn = tmp_path / f"glossary-{i}.json"
+        fn.write_text(json.dumps(glossary))
+        cache.load(fn, vocutil.load._load_glossary)
+        path = cache._path(fn, os.stat(fn), None)
+        os.utime(path, ns=(i, i))
+        paths.append(path)
+
+    cache.max_size = 2 * os.path.getsize(paths[0])
+    cache._evict()
+
+    assert not os.path.exists(paths[0])
+    assert os.path.exists(paths[1])
+    assert os.path.exists(paths[2])
+
+
+def test_cache_should_recover_from_corrupt_entry(tmp_path):
+    """Should reload a glossary if its cache entry is corrupt."""
+    fn = tmp_path / "glossary.json"
+    fn.write_text(json.dumps(glossary))
+    cache = vocutil.GlossaryCache(tmp_path / "cache")
+    vocutil.load_glossary(fn, cache=cache)
+
+    with open(cache._path(fn, os.stat(fn), None), "wb") as f:
+        f.write(b"corrupt")
+
+    assert vocutil.load_glossary(fn, cache=cache) == glossary
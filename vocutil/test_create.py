@@ -0,0 +1,112 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""vocutil unit creation tests."""
+
+import json
+import os
+
+from vocutil import create
+
+
+def _write_templates(path):
+    """Write unit templates."""
+    templates = path / "templates"
+    templates.mkdir()
+    (templates / "Makefile").write_text("UNIT = {{ unit }}\n")
+    (templates / "slides.tex").write_text("\\title{\\VAR{unit}}\n")
+
+
+def test_environment_should_be_shared():
+    """Should create one environment per delimiter style."""
+    assert create.get_environment() is create.get_environment()
+    assert create.get_environment(latex=True) is create.get_environment(latex=True)
+    assert create.get_environment() is not create.get_environment(latex=True)
+
+
+def test_should_write_files_from_templates(tmp_path, monkeypatch):
+    """Should render templates with the matching delimiters."""
+    _write_templates(tmp_path)
+    monkeypatch.chdir(tmp_path)
+
+    create.maybe_create_makefile(tmp_path, "Sound and Light", "sl")
+    create.maybe_create_notes(tmp_path, "Sound and Light", "sl")
+
+    assert (tmp_path / "Makefile").read_text() == "UNIT = Sound and Light\n"
+    assert (tmp_path / "sl-slides.tex").read_text() == "\\title{Sound and Light}\n"
+
+
+def test_should_cache_template_bytecode(tmp_path, monkeypatch):
+    """Should store compiled templates in the cache directory."""
+    _write_templates(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("VOCUTIL_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(create, "_environments", {})
+
+    create.maybe_create_makefile(tmp_path, "Sound and Light", "sl")
+
+    assert len(os.listdir(tmp_path / "cache" / "jinja")) == 1
+
+
+def test_should_not_cache_template_bytecode_by_default(monkeypatch):
+    """Should not cache compiled templates without a cache directory."""
+    monkeypatch.delenv("VOCUTIL_CACHE_DIR", raising=False)
+    monkeypatch.setattr(create, "_environments", {})
+
+    assert create.get_environment().bytecode_cache is None
+
+
+def test_should_ignore_unwritable_cache_directory(tmp_path, monkeypatch):
+    """Should compile templates in memory if the cache cannot be created."""
+    _write_templates(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "cache").write_text("not a directory\n")
+    monkeypatch.setenv("VOCUTIL_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(create, "_environments", {})
+
+    create.maybe_create_makefile(tmp_path, "Sound and Light", "sl")
+
+    assert create.get_environment().bytecode_cache is None
+    assert (tmp_path / "Makefile").read_text() == "UNIT = Sound and Light\n"
+
+
+def test_create_units_should_scaffold_course_plan(tmp_path, monkeypatch, capsys):
+    """Should create every unit of a course plan in one process."""
+    _write_templates(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    plan = tmp_path / "plan.csv"
+    plan.write_text("dest,unit,prefix\n01-sound,Sound,sl\n02-light,Light,li\n")
+
+    monkeypatch.setattr("sys.argv", ["create-units", str(plan)])
+    create.create_units()
+
+    assert (tmp_path / "01-sound" / "Makefile").read_text() == "UNIT = Sound\n"
+    assert (tmp_path / "02-light" / "li-slides.tex").read_text() == "\\title{Light}\n"
+    assert capsys.readouterr().out.endswith(
+        "2 units: created 12 files and directories, skipped 8\n"
+    )
+
+
+def test_create_units_should_read_json_plan(tmp_path, monkeypatch, capsys):
+    """Should read a course plan from a JSON list and skip existing files."""
+    _write_templates(tmp_path)
+    monkeypatch.chdir(tmp_path)
+    plan = tmp_path / "plan.json"
+    plan.write_text(json.dumps([{"dest": "01-sound", "unit": "Sound", "prefix": "sl"}]))
+
+    monkeypatch.setattr("sys.argv", ["create-units", str(plan)])
+    create.create_units()
+    create.create_units()
+
+    assert capsys.readouterr().out.endswith(
+        "1 units: created 0 files and directories, skipped 10\n"
+    )
@@ -0,0 +1,196 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""vocutil enrich tests."""
+
+import importlib
+import json
+
+import pytest
+
+import vocutil
+
+enrich_module = importlib.import_module("vocutil.enrich")
+
+
+def _write_glossaries(tmp_path):
+    """Write a course glossary and some chapter glossaries."""
+    course = tmp_path / "cumulative.json"
+    course.write_text(
+        json.dumps(
+            {
+                "course": {
+                    "title": "Course A",
+                },
+                "book": {
+                    "title": "A Textbook",
+                    "author": "J Gray",
+                },
+                "glossary": [
+                    {
+                        "word": "test",
+                        "definition": "a test",
+                        "chapter": "1",
+                        "section": "1",
+                    },
+                ],
+            }
+        )
+    )
+
+    chapters = []
+    for i in range(4):
+        fn = tmp_path / f"chapter-{i}.csv"
+        fn.write_text("".join(f"word {i}-{j},definition {j}\n" for j in range(3)))
+        chapters.append(str(fn))
+
+    fn = tmp_path / "chapter-4.json"
+    fn.write_text(
+        json.dumps(
+            {
+                "glossary": [
+                    {
+                        "word": "quiz",
+                        "definition": "a small test",
+                        "chapter": 4,
+                        "section": 2,
+                    },
+                ],
+            }
+        )
+    )
+    chapters.append(str(fn))
+
+    return str(course), chapters
+
+
+def test_enrich(tmp_path, capsys):
+    """Should add chapter glossary entries to the course glossary."""
+    course, chapters = _write_glossaries(tmp_path)
+
+    vocutil.enrich(["2", course, *chapters])
+    actual = json.loads(capsys.readouterr().out)
+
+    assert actual["course"]["title"] == "Course A"
+    assert len(actual["glossary"]) == 1 + 4 * 3 + 1
+    assert actual["glossary"][1] == {
+        "word": "word 0-0",
+        "definition": "definition 0",
+        "chapter": "2",
+        "section": "",
+    }
+    assert actual["glossary"][-1] == {
+        "word": "quiz",
+        "definition": "a small test",
+        "chapter": "4",
+        "section": "2",
+    }
+
+
+def test_enrich_parallel_should_preserve_order(tmp_path, capsys):
+    """Should produce the same output with multiple jobs."""
+    course, chapters = _write_glossaries(tmp_path)
+
+    vocutil.enrich(["2", course, *chapters])
+    expected = capsys.readouterr().out
+
+    vocutil.enrich(["--jobs", "3", "2", course, *chapters])
+    actual = capsys.readouterr().out
+
+    assert actual == expected
+
+
+def test_enrich_should_match_loaded_glossary(tmp_path, capsys):
+    """Should write the combined glossary as indented JSON."""
+    course, chapters = _write_glossaries(tmp_path)
+
+    vocutil.enrich(["2", course, *chapters])
+    actual = capsys.readouterr().out
+
+    assert actual == json.dumps(json.loads(actual), indent=2) + "\n"
+
+
+def test_enrich_should_write_output_file(tmp_path, capsys):
+    """Should replace the output file with compact JSON."""
+    course, chapters = _write_glossaries(tmp_path)
+
+    vocutil.enrich(["2", course, *chapters])
+    expected = json.loads(capsys.readouterr().out)
+
+    vocutil.enrich(["--compact", "--output", course, "2", course, *chapters])
+
+    assert capsys.readouterr().out == ""
+    with open(course, "r") as f:
+        assert json.load(f) == expected
+    assert list(tmp_path.glob("*.tmp")) == []
+
+
+def test_enrich_incremental_should_only_parse_changes(tmp_path, monkeypatch):
+    """Should only parse new and changed glossaries."""
+    course, chapters = _write_glossaries(tmp_path)
+    output = str(tmp_path / "combined.json")
+    full = str(tmp_path / "full.json")
+
+    vocutil.enrich(["--incremental", "-o", output, "2", course, *chapters[:3]])
+
+    # Change one chapter and add another.
+    with open(chapters[1], "a") as f:
+        f.write("added,an added word\n")
+
+    loaded = []
+    load_glossary = enrich_module.load_glossary
+
+    def _load_glossary(fn, *args, **kwargs):
+        loaded.append(fn)
+        return load_glossary(fn, *args, **kwargs)
+
+    monkeypatch.setattr(enrich_module, "load_glossary", _load_glossary)
+
+    vocutil.enrich(["--incremental", "-o", output, "2", course, *chapters[:4]])
+    vocutil.enrich(["-o", full, "2", course, *chapters[:4]])
+
+    assert loaded[:2] == [chapters[1], chapters[3]]
+    with open(output, "r") as f, open(full, "r") as g:
+        assert f.read() == g.read()
+
+
+def test_enrich_incremental_should_drop_removed_glossaries(tmp_path):
+    """Should drop the entries of removed glossaries."""
+    course, chapters = _write_glossaries(tmp_path)
+    output = str(tmp_path / "combined.json")
+    full = str(tmp_path / "full.json")
+
+    vocutil.enrich(["--incremental", "-o", output, "2", course, *chapters])
+    del chapters[2]
+    vocutil.enrich(["--incremental", "-o", output, "2", course, *chapters])
+    vocutil.enrich(["-o", full, "2", course, *chapters])
+
+    with open(output, "r") as f, open(full, "r") as g:
+        assert f.read() == g.read()
+
+
+def test_enrich_incremental_should_rebuild_after_chapter_change(tmp_path):
+    """Should parse everything when the default chapter changes."""
+    course, chapters = _write_glossaries(tmp_path)
+    output = str(tmp_path / "combined.json")
+
+    vocutil.enrich(["--incremental", "-o", output, "2", course, *chapters])
+    vocutil.enrich(["--incremental", "-o", output, "3", course, *chapters])
+
+    with open(output, "r") as f:
+        assert json.load(f)["glossary"][1]["chapter"] == "3"
+
+
+def test_enrich_incremental_should_require_output(tmp_path):
+    """Should require an output file for incremental builds."""
+    with pytest.raises(SystemExit):
+        vocutil.enrich(["--incremental", "2", "cumulative.json"])
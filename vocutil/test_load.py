@@ -12,9 +12,10 @@
 
 """vocutil loading tests."""
 
+import json
 import sys
 
-# import pytest
+import pytest
 
 sys.path.insert(0, "/home/gray/src/work/vocutil")
 
@@ -42,3 +43,293 @@ def test_clean_glossary():
     }
 
     assert data == vocutil._clean_glossary(data)
+
+
+def test_iter_glossary_json(tmp_path):
+    """Should iterate over cleaned JSON glossary entries."""
+    data = {
+        "course": {
+            "title": "Course A",
+        },
+        "book": {
+            "title": "A Textbook",
+            "author": "J Gray",
+        },
+        "glossary": [
+            {
+                "word": "test",
+                "definition": "a test",
+                "chapter": 1,
+                "section": 1,
+            },
+            {
+                "word": "quiz",
+                "definition": "a small test",
+            },
+        ],
+    }
+    fn = tmp_path / "glossary.json"
+    fn.write_text(json.dumps(data, indent=2))
+
+    with vocutil.iter_glossary(fn) as gl:
+        assert gl.header == {
+            "course": data["course"],
+            "book": data["book"],
+        }
+        assert list(gl) == vocutil._clean_glossary(data)["glossary"]
+
+
+def test_json_stream_small_chunks(tmp_path):
+    """Should decode values split across read boundaries."""
+    data = [
+        {
+            "word": f"word {i}",
+            "definition": f"definition {i}",
+            "chapter": 1234567,
+            "section": i,
+        }
+        for i in range(100)
+    ]
+    fn = tmp_path / "glossary.json"
+    fn.write_text(json.dumps(data) + " 1234567")
+
+    with open(fn, "r") as f:
+        stream = vocutil.load._JSONStream(f, size=7)
+        stream.expect("[")
+        actual = []
+        while True:
+            actual.append(stream.decode())
+            if stream.expect(",]") == "]":
+                break
+        number = stream.decode()
+
+    assert actual == data
+    assert number == 1234567
+
+
+def test_json_stream_skip_small_chunks(tmp_path):
+    """Should skip values split across read boundaries."""
+    data = [{"word": f"[{i}]", "definition": f'a "{{test}}" \\ {i}'} for i in range(20)]
+    fn = tmp_path / "glossary.json"
+    fn.write_text(json.dumps([data, {"nested": [[], {}]}, "]", 12]) + " 1234567")
+
+    with open(fn, "r") as f:
+        stream = vocutil.load._JSONStream(f, size=7)
+        stream.expect("[")
+        for _ in range(4):
+            stream.skip()
+            stream.expect(",]")
+        number = stream.decode()
+
+    assert number == 1234567
+
+
+def test_iter_glossary_json_trailing_header(tmp_path):
+    """Should find course and book data following the entries."""
+    data = {
+        "glossary": [
+            {
+                "word": "test",
+                "definition": "a test",
+                "chapter": 1,
+                "section": 1,
+            },
+        ],
+        "course": {
+            "title": "Course A",
+        },
+        "book": {
+            "title": "A Textbook",
+            "author": "J Gray",
+        },
+    }
+    fn = tmp_path / "glossary.json"
+    fn.write_text(json.dumps(data))
+
+    gl = vocutil.iter_glossary(fn)
+
+    assert gl.header["course"] == data["course"]
+    assert gl.header["book"] == data["book"]
+    assert list(gl) == data["glossary"]
+
+
+def test_iter_glossary_json_header_without_book(tmp_path, monkeypatch):
+    """Should find missing header data without decoding the entries again."""
+    data = {
+        "course": {"title": "Course A"},
+        "glossary": [
+            {"word": f"[{i}]", "definition": f'a "{{test}}" \\ {i}'} for i in range(5)
+        ],
+        "notes": [{"text": "]}"}],
+    }
+    fn = tmp_path / "glossary.json"
+    fn.write_text(json.dumps(data))
+    iterated = []
+    iter_glossary_json = vocutil.load._iter_glossary_json
+
+    def _iter_glossary_json(f, header):
+        iterated.append(f)
+        return iter_glossary_json(f, header)
+
+    monkeypatch.setattr(vocutil.load, "_iter_glossary_json", _iter_glossary_json)
+
+    with vocutil.iter_glossary(fn) as gl:
+        assert gl.header == {
+            "course": {"title": "Course A"},
+            "book": {"title": "", "author": ""},
+        }
+        assert [entry["word"] for entry in gl] == [f"[{i}]" for i in range(5)]
+
+    assert len(iterated) == 1
+
+
+@pytest.mark.parametrize("data", ['{"glossary": [{"word": "a"} {}]}', '{"course": ['])
+def test_iter_glossary_bad_json(tmp_path, data):
+    """Should raise on malformed JSON when created or iterating."""
+    fn = tmp_path / "glossary.json"
+    fn.write_text(data)
+
+    with pytest.raises(vocutil.VocutilError):
+        with vocutil.iter_glossary(fn) as gl:
+            list(gl)
+
+
+def test_iter_glossary_empty_json(tmp_path):
+    """Should iterate over an empty JSON glossary."""
+    fn = tmp_path / "glossary.json"
+    fn.write_text("{}")
+
+    gl = vocutil.iter_glossary(fn)
+
+    assert list(gl) == []
+    assert gl.header == {
+        "course": {"title": ""},
+        "book": {"title": "", "author": ""},
+    }
+
+
+def test_iter_glossary_csv(tmp_path):
+    """Should iterate over cleaned CSV glossary entries."""
+    fn = tmp_path / "glossary.csv"
+    fn.write_text("test,a test\nquiz,a small test\n")
+
+    with vocutil.iter_glossary(fn) as gl:
+        assert list(gl) == [
+            {
+                "word": "test",
+                "definition": "a test",
+                "chapter": "",
+                "section": "",
+            },
+            {
+                "word": "quiz",
+                "definition": "a small test",
+                "chapter": "",
+                "section": "",
+            },
+        ]
+
+
+def test_load_glossary_csv_without_stderr(tmp_path, capsys):
+    """Should load a CSV glossary without reporting a JSON error."""
+    fn = tmp_path / "glossary.csv"
+    fn.write_text("test,a test\n")
+
+    actual = vocutil.load_glossary(fn)
+
+    assert actual["glossary"] == [
+        {
+            "word": "test",
+            "definition": "a test",
+            "chapter": "",
+            "section": "",
+        },
+    ]
+    assert capsys.readouterr().err == ""
+
+
+def test_load_glossary_sniff_format(tmp_path):
+    """Should detect the format from the data without an extension."""
+    json_fn = tmp_path / "glossary"
+    json_fn.write_text(' \n{"glossary": [{"word": "test"}]}')
+    tsv_fn = tmp_path / "glossary.txt"
+    tsv_fn.write_text("test\ta test\n")
+
+    assert vocutil.load_glossary(json_fn)["glossary"][0]["word"] == "test"
+    assert vocutil.load_glossary(tsv_fn)["glossary"][0]["definition"] == "a test"
+
+
+def test_load_glossary_explicit_format(tmp_path):
+    """Should use an explicit format over the file extension."""
+    fn = tmp_path / "glossary.json"
+    fn.write_text("test\ta test\n")
+
+    actual = vocutil.load_glossary(fn, format="tsv")
+
+    assert actual["glossary"][0]["definition"] == "a test"
+
+
+def test_load_glossary_unknown_format(tmp_path):
+    """Should raise on an unknown format."""
+    fn = tmp_path / "glossary.json"
+    fn.write_text("{}")
+
+    with pytest.raises(vocutil.VocutilError):
+        vocutil.load_glossary(fn, format="xml")
+
+
+def test_load_glossary_bad_json(tmp_path):
+    """Should raise on malformed JSON."""
+    fn = tmp_path / "glossary.json"
+    fn.write_text('{"glossary": [')
+
+    with pytest.raises(vocutil.VocutilError):
+        vocutil.load_glossary(fn)
+
+
+def test_load_glossary_tsv_with_commas(tmp_path):
+    """Should split TSV on tabs, even with commas in the fields."""
+    fn = tmp_path / "glossary.tsv"
+    fn.write_text("salt, table\tsodium chloride, NaCl\n")
+
+    expected = [
+        {
+            "word": "salt, table",
+            "definition": "sodium chloride, NaCl",
+            "chapter": "",
+            "section": "",
+        },
+    ]
+
+    assert vocutil.load_glossary(fn)["glossary"] == expected
+    assert vocutil.load_glossary(fn, format="TSV")["glossary"] == expected
+
+    with vocutil.iter_glossary(fn) as gl:
+        assert list(gl) == expected
+
+
+@pytest.mark.parametrize("delimiter", [";", "\t"])
+def test_load_glossary_csv_dialect(tmp_path, delimiter):
+    """Should detect the delimiter of ``.csv`` files."""
+    fn = tmp_path / "glossary.csv"
+    fn.write_text(f"salt{delimiter}sodium chloride\nsugar{delimiter}sucrose\n")
+
+    expected = [
+        {"word": "salt", "definition": "sodium chloride", "chapter": "", "section": ""},
+        {"word": "sugar", "definition": "sucrose", "chapter": "", "section": ""},
+    ]
+
+    assert vocutil.load_glossary(fn)["glossary"] == expected
+
+    with vocutil.iter_glossary(fn) as gl:
+        assert list(gl) == expected
+
+
+@pytest.mark.parametrize("data", ["test,a test\nquiz\n", "test,a test\n\n"])
+def test_load_glossary_short_row(tmp_path, data):
+    """Should raise on short or blank CSV rows."""
+    fn = tmp_path / "glossary.csv"
+    fn.write_text(data)
+
+    with pytest.raises(vocutil.VocutilError):
+        vocutil.load_glossary(fn)
@@ -0,0 +1,115 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""vocutil glossary tests."""
+
+import json
+
+import pytest
+
+import vocutil
+
+data = {
+    "course": {
+        "title": "Course A",
+    },
+    "book": {
+        "title": "A Textbook",
+        "author": "J Gray",
+    },
+    "glossary": [
+        {
+            "word": "Osmosis",
+            "definition": "diffusion of water",
+            "chapter": 1,
+            "section": 1,
+        },
+        {
+            "word": "diffusion",
+            "definition": "movement from high to low concentration",
+            "chapter": "1",
+            "section": "2",
+        },
+        {
+            "word": "cell  wall",
+            "definition": "a rigid layer around a plant cell",
+            "chapter": "2",
+            "section": "1",
+        },
+        {
+            "word": "enzyme",
+            "definition": "a biological catalyst",
+            "chapter": "4",
+            "section": "1",
+        },
+    ],
+}
+
+
+def test_glossary_should_find_words():
+    """Should find entries by normalized word."""
+    glossary = vocutil.Glossary.from_dict(data)
+
+    assert "osmosis" in glossary
+    assert "Cell Wall" in glossary
+    assert "mitosis" not in glossary
+    assert glossary.find(" OSMOSIS ") == [vocutil.Entry.from_dict(data["glossary"][0])]
+
+
+def test_glossary_should_find_chapters_and_sections():
+    """Should find entries by chapter and section."""
+    glossary = vocutil.Glossary.from_dict(data)
+
+    assert [e.word for e in glossary.chapter(1)] == ["Osmosis", "diffusion"]
+    assert [e.word for e in glossary.section("1", 2)] == ["diffusion"]
+    assert [e.word for e in glossary.chapters(2, 4)] == ["cell  wall", "enzyme"]
+    assert glossary.chapter(3) == []
+
+
+def test_glossary_should_reject_duplicates():
+    """Should reject duplicate words in a unique glossary."""
+    glossary = vocutil.Glossary.from_dict(data, unique=True)
+    duplicate = {"word": "osmosis", "definition": "another definition"}
+
+    assert glossary.is_duplicate(duplicate)
+    with pytest.raises(vocutil.VocutilError):
+        glossary.append(duplicate)
+    assert len(glossary) == 4
+
+
+def test_glossary_should_allow_duplicates():
+    """Should keep duplicate words by default."""
+    glossary = vocutil.Glossary.from_dict(data)
+
+    glossary.append({"word": "osmosis", "chapter": 5})
+
+    assert len(glossary.find("Osmosis")) == 2
+
+
+def test_glossary_should_roundtrip_file(tmp_path):
+    """Should load a glossary file and reproduce the cleaned data."""
+    fn = tmp_path / "glossary.json"
+    fn.write_text(json.dumps(data))
+
+    glossary = vocutil.Glossary.from_file(fn)
+
+    assert glossary.to_dict() == vocutil.load_glossary(fn)
+
+
+def test_entry_should_share_chapter_strings():
+    """Should intern chapter and section strings."""
+    first = vocutil.Entry("osmosis", "", "".join(["1", "2"]), "".join(["3"]))
+    second = vocutil.Entry("diffusion", "", "".join(["1", "2"]), "".join(["3"]))
+
+    assert first.chapter is second.chapter
+    assert first.section is second.section
+    assert not hasattr(first, "__dict__")
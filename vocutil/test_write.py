@@ -0,0 +1,95 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""vocutil writing tests."""
+
+import io
+import json
+import os
+import stat
+
+import pytest
+
+import vocutil
+from vocutil import write
+
+header = {
+    "course": {
+        "title": 'Course "A"\nsecond line',
+    },
+    "book": {
+        "title": "A Textbook",
+        "author": "J Gray",
+    },
+}
+
+entries = [
+    {
+        "word": "test",
+        "definition": "a test",
+        "chapter": "1",
+        "section": "1",
+    },
+    {
+        "word": "café",
+        "definition": "a small restaurant",
+        "chapter": "2",
+        "section": "",
+    },
+]
+
+
+@pytest.mark.parametrize("glossary", [entries, []])
+def test_write_glossary_should_match_json_dumps(glossary):
+    """Should write the same indented JSON as ``json.dumps()``."""
+    f = io.StringIO()
+
+    vocutil.write_glossary(f, header, iter(glossary))
+
+    assert f.getvalue() == json.dumps({**header, "glossary": glossary}, indent=2)
+
+
+@pytest.mark.parametrize("glossary", [entries, []])
+def test_write_glossary_compact(glossary):
+    """Should write compact JSON."""
+    f = io.StringIO()
+
+    vocutil.write_glossary(f, header, iter(glossary), indent=None)
+
+    assert "\n" not in f.getvalue()
+    assert json.loads(f.getvalue()) == {**header, "glossary": glossary}
+
+
+def test_replace_file_should_keep_mode(tmp_path):
+    """Should keep the permissions of the replaced file."""
+    fn = tmp_path / "glossary.json"
+    fn.write_text("old")
+    fn.chmod(0o640)
+
+    with write._replace_file(fn) as f:
+        f.write("new")
+
+    assert fn.read_text() == "new"
+    assert stat.S_IMODE(os.stat(fn).st_mode) == 0o640
+
+
+def test_replace_file_should_use_umask_for_new_files(tmp_path):
+    """Should create new files with the mode ``open()`` would use."""
+    fn = tmp_path / "glossary.json"
+    umask = os.umask(0o027)
+    try:
+        with write._replace_file(fn) as f:
+            f.write("new")
+    finally:
+        os.umask(umask)
+
+    assert stat.S_IMODE(os.stat(fn).st_mode) == 0o640
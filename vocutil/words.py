@@ -0,0 +1,268 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""vocutil glossary words."""
+
+import sys
+
+from .exceptions import VocutilError
+from .load import iter_glossary
+
+
+def _normalize_word(word):
+    """Normalize a word for lookups."""
+    return " ".join(str(word).split()).casefold()
+
+
+def _normalize_chapter(chapter):
+    """Normalize a chapter or section for lookups."""
+    return str(chapter).strip()
+
+
+def _intern(value):
+    """Intern a string value, sharing one copy between entries."""
+    return sys.intern(value) if type(value) is str else value
+
+
+class Entry:
+    """A glossary entry.
+
+    Entries use ``__slots__`` rather than an instance dict, and the
+    heavily repeated chapter and section strings are interned, so an
+    entry costs little more than its word and definition.
+
+    Parameters
+    ----------
+    word : str
+        The word.
+    definition : str
+        The definition of the word.
+    chapter : str or int
+        The chapter introducing the word.
+    section : str or int
+        The section introducing the word.
+    """
+
+    __slots__ = (
+        "word",
+        "definition",
+        "chapter",
+        "section",
+    )
+
+    fields = __slots__
+
+    def __init__(self, word="", definition="", chapter="", section=""):
+        """Initialize a glossary entry."""
+        self.word = word
+        self.definition = definition
+        self.chapter = _intern(chapter)
+        self.section = _intern(section)
+
+        return
+
+    def __eq__(self, other):
+        """Compare glossary entries."""
+        if not isinstance(other, Entry):
+            return NotImplemented
+
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        """Represent myself."""
+        return (
+            f"Entry(word={self.word!r}, definition={self.definition!r},"
+            f" chapter={self.chapter!r}, section={self.section!r})"
+        )
+
+    @classmethod
+    def from_dict(cls, data):
+        """Create an ``Entry`` from a dict.
+
+        Parameters
+        ----------
+        cls
+            The ``Entry`` class.
+        data : dict
+            A dict containing glossary entry data.  Missing fields are
+            empty.
+        """
+        return cls(**{field: data.get(field, "") for field in cls.fields})
+
+    def to_dict(self):
+        """Create a dict of glossary entry data."""
+        return {field: getattr(self, field) for field in self.fields}
+
+
+class Glossary:
+    """A glossary with word, chapter, and section indexes.
+
+    Entries are indexed by normalized word, by chapter, and by
+    chapter and section as they are appended, so lookups cost time
+    proportional to the number of matching entries rather than the
+    size of the glossary.  Words are normalized by collapsing
+    whitespace and case folding; chapters and sections are compared as
+    strings, so ``1`` and ``"1"`` are the same chapter.
+
+    Parameters
+    ----------
+    entries : iterable, optional
+        The glossary entries, as ``Entry`` objects or dicts.
+    course : dict, optional
+        The course data.
+    book : dict, optional
+        The book data.
+    unique : bool, optional
+        Reject entries duplicating the word of an existing entry.
+    """
+
+    def __init__(self, entries=(), course=None, book=None, unique=False):
+        """Initialize a glossary."""
+        self.course = course if course is not None else {"title": ""}
+        self.book = book if book is not None else {"title": "", "author": ""}
+        self.unique = unique
+
+        self.entries = []
+        self._words = {}
+        self._chapters = {}
+        self._sections = {}
+
+        for entry in entries:
+            self.append(entry)
+
+        return
+
+    def __len__(self):
+        """Get the number of entries."""
+        return len(self.entries)
+
+    def __iter__(self):
+        """Iterate over the entries in order."""
+        return iter(self.entries)
+
+    def __contains__(self, word):
+        """Determine if the glossary contains ``word``."""
+        return _normalize_word(word) in self._words
+
+    def append(self, entry):
+        """Append an entry to the glossary.
+
+        Parameters
+        ----------
+        entry : Entry or dict
+            The entry to append.
+
+        Raises
+        ------
+        VocutilError
+            Raises if the glossary is unique and already contains the
+            word of ``entry``.
+        """
+        if not isinstance(entry, Entry):
+            entry = Entry.from_dict(entry)
+
+        word = _normalize_word(entry.word)
+        if self.unique and word in self._words:
+            raise VocutilError(f"Duplicate glossary entry: {entry.word}")
+
+        chapter = _normalize_chapter(entry.chapter)
+        section = _normalize_chapter(entry.section)
+
+        self.entries.append(entry)
+        self._words.setdefault(word, []).append(entry)
+        self._chapters.setdefault(chapter, []).append(entry)
+        self._sections.setdefault((chapter, section), []).append(entry)
+
+    def is_duplicate(self, entry):
+        """Determine if an entry duplicates the word of an existing entry."""
+        word = entry.word if isinstance(entry, Entry) else entry.get("word", "")
+
+        return _normalize_word(word) in self._words
+
+    def find(self, word):
+        """Get the entries for ``word``."""
+        return list(self._words.get(_normalize_word(word), ()))
+
+    def chapter(self, chapter):
+        """Get the entries of ``chapter``."""
+        return list(self._chapters.get(_normalize_chapter(chapter), ()))
+
+    def section(self, chapter, section):
+        """Get the entries of ``section`` of ``chapter``."""
+        return list(
+            self._sections.get(
+                (_normalize_chapter(chapter), _normalize_chapter(section)), ()
+            )
+        )
+
+    def chapters(self, first, last):
+        """Get the entries of the numbered chapters ``first`` to ``last``.
+
+        Parameters
+        ----------
+        first : int
+            The first chapter of the range.
+        last : int
+            The last chapter of the range, inclusive.
+        """
+        entries = []
+        for chapter in range(int(first), int(last) + 1):
+            entries.extend(self._chapters.get(str(chapter), ()))
+
+        return entries
+
+    @classmethod
+    def from_dict(cls, data, **kwargs):
+        """Create a ``Glossary`` from cleaned glossary data.
+
+        Parameters
+        ----------
+        cls
+            The ``Glossary`` class.
+        data : dict
+            Glossary data, as returned by ``load_glossary()``.
+        """
+        return cls(
+            data.get("glossary", ()),
+            course=data.get("course"),
+            book=data.get("book"),
+            **kwargs,
+        )
+
+    @classmethod
+    def from_file(cls, fn, format=None, **kwargs):
+        """Create a ``Glossary`` from a glossary file.
+
+        Parameters
+        ----------
+        cls
+            The ``Glossary`` class.
+        fn : str
+            The filename containing the glossary data.
+        format : str, optional
+            The glossary format, as for ``load_glossary()``.
+        """
+        with iter_glossary(fn, format=format) as gl:
+            header = gl.header
+            glossary = cls(course=header["course"], book=header["book"], **kwargs)
+            for entry in gl:
+                glossary.append(entry)
+
+        return glossary
+
+    def to_dict(self):
+        """Create a dict of glossary data."""
+        return {
+            "course": self.course,
+            "book": self.book,
+            "glossary": [entry.to_dict() for entry in self.entries],
+        }
@@ -0,0 +1,151 @@
+# ******************************************************************************
+#
+# vocutil, educational vocabulary utilities.
+#
+# Copyright 2022-2025 Jeremy A Gray <gray@flyquackswim.com>.
+#
+# All rights reserved.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# ******************************************************************************
+
+"""vocutil writing functions."""
+
+import contextlib
+import json
+import os
+import secrets
+
+
+def write_glossary(f, header, entries, indent=2):
+    """Write a glossary as JSON.
+
+    Write the course and book data in ``header`` followed by each of
+    the glossary ``entries`` as they are produced, so the complete
+    glossary is never held in memory.  With an ``indent``, the output
+    is identical to ``json.dumps(data, indent=indent)``; without, it
+    is compact.
+
+    Parameters
+    ----------
+    f : file
+        A writable text file object.
+    header : dict
+        The course and book data of the glossary.
+    entries : iterable
+        The glossary entries.
+    indent : int or None, optional
+        The indentation of the output, or ``None`` for compact output.
+    """
+    writer = _GlossaryWriter(f, indent=indent)
+
+    writer.write_header(header)
+    for entry in entries:
+        writer.write_entry(entry)
+    writer.write_footer()
+
+
+class _GlossaryWriter:
+    """Write a glossary as JSON, piece by piece.
+
+    Each entry is preceded by a separator, so previously written
+    runs of entries can be written again verbatim with
+    ``write_separator()`` followed by the text of the run.
+    """
+
+    def __init__(self, f, indent=2):
+        """Initialize a glossary writer."""
+        self.f = f
+        self.indent = indent
+        self.count = 0
+
+        if indent is None:
+            self._encode = json.JSONEncoder(separators=(",", ":")).encode
+            self._pad = ""
+            self._first = ""
+            self._sep = ","
+        else:
+            self._encode = json.JSONEncoder(indent=indent).encode
+            self._pad = " " * indent
+            self._first = "\n" + self._pad * 2
+            self._sep = ",\n" + self._pad * 2
+
+        return
+
+    def write_header(self, header):
+        """Write the opening of the glossary and its course and book data."""
+        if self.indent is None:
+            self.f.write("{")
+            for key, value in header.items():
+                self.f.write(f"{self._encode(key)}:{self._encode(value)},")
+            self.f.write('"glossary":[')
+        else:
+            self.f.write("{\n")
+            for key, value in header.items():
+                value = self._encode(value).replace("\n", "\n" + self._pad)
+                self.f.write(f"{self._pad}{self._encode(key)}: {value},\n")
+            self.f.write(f'{self._pad}"glossary": [')
+
+    def write_separator(self):
+        """Write the separator preceding the next entry."""
+        self.f.write(self._sep if self.count else self._first)
+        self.count += 1
+
+    def encode_entry(self, entry):
+        """Encode a glossary entry as it is written."""
+        if self.indent is None:
+            return self._encode(entry)
+
+        return self._encode(entry).replace("\n", self._first)
+
+    def write_entry(self, entry):
+        """Write a glossary entry."""
+        self.write_separator()
+        self.f.write(self.encode_entry(entry))
+
+    def write_footer(self):
+        """Write the closing of the glossary."""
+        if self.indent is None:
+            self.f.write("]}")
+        elif self.count:
+            self.f.write(f"\n{self._pad}]\n}}")
+        else:
+            # An empty list is written as ``[]``.
+            self.f.write("]\n}")
+
+
+@contextlib.contextmanager
+def _replace_file(fn, mode="w"):
+    """Write a file, replacing ``fn`` only on success.
+
+    The replacement keeps the permissions of ``fn``, or for a new file
+    has those of ``open()``, as set by the current umask.
+    """
+    directory = os.path.dirname(os.path.abspath(fn))
+    fd, name = _create_temporary(directory)
+    f = os.fdopen(fd, mode, encoding=None if "b" in mode else "utf-8")
+
+    try:
+        with f:
+            yield f
+        with contextlib.suppress(FileNotFoundError):
+            os.chmod(name, os.stat(fn).st_mode & 0o7777)
+        os.replace(name, fn)
+    except BaseException:
+        os.remove(name)
+        raise
+
+
+def _create_temporary(directory):
+    """Create a new temporary file in ``directory``.
+
+    Unlike ``tempfile``, the file is created with the mode ``0o666``
+    less the umask.  Returns the file descriptor and name.
+    """
+    while True:
+        name = os.path.join(directory, f"tmp{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(name, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o666), name
+        except FileExistsError:
+            continue